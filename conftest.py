@@ -1,23 +1,74 @@
 import pytest
-from selenium import webdriver
-
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 
 from utility.config_reader import get_config    #To read browser from config.ini
+from utility.driver_factory import create_driver
+from utility.command_counter import CommandCounter, CommandBudgetWarning, budget_violations
+from utility.test_context import set_current_test
+from utility import perf_metrics
+from utility import dom_snapshots
+from utility import locator_registry
+from utility import trace_buffer
+from utility import log_pipeline
+from utility import allure_compactor
+from utility import lite_report
+from utility.perf_budgets import check_records
+from utility.resource_sampler import ResourceSampler
+from utility.screencast import ScreencastRecorder
+from utility.duration_store import DurationStore
+from utility import lpt_schedule
+from utility.data_pool import DataPool
+from utility.dependency_graph import DependencyGraph, DependencyError, DataHandoff
+from pages.page_factory import Pages
+from collections import defaultdict
+import allure
+import json
+import os
+import time
+import warnings
 import logging
 
 # Configure logging inside setup
 logger = logging.getLogger(__name__)
 
+# WebDriver command stats of each test → {nodeid: stats}, shown in the terminal summary
+command_stats = {}
+
+# Performance budget violations of each test → {nodeid: [messages]}
+perf_violations = {}
+
+# Browser memory growth of tests flagged as leaking → {nodeid: [messages]}
+memory_leaks = {}
+
+# Historical test durations (created on first use, None when scheduling is disabled)
+duration_store = None
+
+# Durations of this run → {nodeid: seconds}, {worker id: seconds}, outcome of each test
+test_durations = defaultdict(float)
+worker_durations = defaultdict(float)
+test_outcomes = {}
+
+# LPT schedule of this run as planned at collection (sent back by the xdist workers), shown next to the actual makespan
+schedule_plan = {}
+
+# Declared test dependencies (@depends_on), the tests that failed / were skipped
+# and the data published by prerequisites for their dependents
+dependency_graph = None
+unmet_prerequisites = set()
+data_handoff = DataHandoff()
+
+# Elements found through a fallback strategy in this run (utility/locator_registry.py)
+locator_fallbacks = []
+
+# Trace archives of the failed tests → {nodeid: path} (utility/trace_buffer.py)
+failure_traces = {}
+
+# Overhead of every screencast recorder of this run (utility/screencast.py)
+screencast_overhead = []
+
+# Start of this run (epoch seconds) and what the Allure results compaction removed
+run_started = time.time()
+allure_compaction = {}
+
 def pytest_addoption(parser):
     """
     Pytest hook to add a command-line option for browser name.
@@ -28,6 +79,23 @@ def pytest_addoption(parser):
     parser.addoption(
         "--browser-name",default = 'chrome', help="This will take browser name from user"
     )
+    # Load scenarios (@pytest.mark.load) are skipped unless --load is given
+    parser.addoption(
+        "--load", action="store_true", default=False, help="Run the load scenarios (load marker)"
+    )
+    # lite = streamed index.html with sidecar logs / screenshots instead of the pytest-html file
+    parser.addoption(
+        "--report-mode", choices=("full", "lite"), default=None,
+        help="HTML report: full (pytest-html) or lite (default [HTML_Report] mode)"
+    )
+    # Default WebDriver command budget per test (0 = no limit), a
+    # @pytest.mark.command_budget(...) marker overrides it for one test
+    parser.addini("command_budget", default="0",
+                  help="Maximum WebDriver commands per test (0 = no limit)")
+    parser.addini("command_latency_budget_ms", default="0",
+                  help="Maximum WebDriver round-trip time per test in ms (0 = no limit)")
+    parser.addini("command_budget_mode", default="warn",
+                  help="What to do when a test exceeds its command budget: warn or fail")
 
 @pytest.fixture(scope='class') # set up and tear down
 def setup(request):
@@ -50,49 +118,17 @@ def setup(request):
         logger.info(f"Selected browser: {browser_name}")
         browser = browser_name.lower()
 
-        # Initialize the driver based on browser name
-        #  Launching Chrome
-        if browser == 'chrome':
-
-            logger.info("Initializing Chrome browser...")
-            options = ChromeOptions()
-            # Open browser in Incognito mode
-            options.add_argument("--incognito")
-            # Disable password manager popup
-            options.add_experimental_option("prefs", {
-                "credentials_enable_service": False,
-                "profile.password_manager_enabled": False
-            })
-            # WebDriverManager auto-installs correct driver version
-            driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()),options=options)
-            logger.info("Launched Chrome browser in incognito mode")
-
-        #  Launching Firefox
-        elif browser == 'firefox':
-            logger.info("Initializing Firefox browser...")
-            options = FirefoxOptions()
-            # Open Firefox in private mode
-            options.set_preference("browser.privatebrowsing.autostart", True)
-
-            driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()),
-                options=options
-            )
-            logger.info("Launched Firefox in private mode")
-
-        #  Launching Edge
-        elif browser == 'edge':
-            logger.info("Initializing Edge browser...")
-            options = EdgeOptions()
-            options.add_argument("--inprivate")
-            driver = webdriver.Edge(
-                service=EdgeService(),
-                options=options
-            )
-            logger.info("Launched Edge in InPrivate mode")
-
-        else:
-            raise ValueError(f"Unsupported browser: {browser_name}")
+        # Initialize the driver based on browser name (utility/driver_factory.py)
+        driver = create_driver(browser)
+
+        # Count WebDriver commands (type, latency) issued by every test
+        request.cls.command_counter = CommandCounter.attach(driver)
+
+        # Sample browser memory / CPU at test boundaries (Chromium only)
+        request.cls.resource_sampler = ResourceSampler(driver) if ResourceSampler.is_enabled(driver) else None
+
+        # Screen recording kept only for failed tests (opt-in, Chromium only)
+        request.cls.screencast = start_screencast(driver)
 
         # Browser window setup
         driver.maximize_window()
@@ -112,34 +148,473 @@ def setup(request):
 
     finally:
         # Quit the browser after test completion
+        screencast = getattr(request.cls, "screencast", None)
+        if screencast:
+            screencast.stop()
+            screencast_overhead.append(screencast.measurements())
         if driver:
             logger.info("========== TEARDOWN: Closing Browser ==========")
             logging.info("Closing the browser")
             driver.quit()
 
 
-def pytest_configure():
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
     """
     Pytest to configure logging before tests start.
-    Configure the root logger to log INFO and above level messages to both file and console.
-    Sets up both file and console handlers with a common formatter.
+    The root logger only queues the records; a listener thread writes them as
+    JSON lines to a rotating file per xdist worker and as text to the console,
+    each record tagged with the running test (utility/log_pipeline.py).
+    Runs before pytest-html's own hook, so --report-mode=lite can switch its file off.
+    """
+    lite_report.configure(config)
+    try:
+        log_pipeline.start()
+        logger.info(f"Logging configured successfully → {log_pipeline.log_path()}")
+
+    except Exception as e:
+        print(f"Failed to configure logging: {e}")
+
+
+def pytest_unconfigure():
+    """Writes the queued log records before the process exits."""
+    log_pipeline.stop()
+
+
+def get_duration_store():
+    """Returns the duration history of [Scheduling] in config.ini, None when scheduling is disabled."""
+    global duration_store
+    if duration_store is None and get_config("Scheduling", "enabled").lower() == "true":
+        duration_store = DurationStore(get_config("Scheduling", "db_path"),
+                                       history=int(get_config("Scheduling", "history")),
+                                       default_seconds=float(get_config("Scheduling", "default_seconds")))
+    return duration_store
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Skips the load scenarios without --load.
+    Builds the @depends_on graph (cycles fail the collection) and orders the tests
+    longest-processing-time-first using their historical durations.
+    Classes are scheduled as a whole (their tests share the driver and its state),
+    together with every class they are linked to by dependencies.
+    Under pytest-xdist (--dist loadgroup) every worker gets one LPT bin as xdist_group.
+    The final order is a stable topological order of the dependency graph.
+    """
+    global dependency_graph
+    if not items:
+        return
+    if not config.getoption("--load"):
+        for item in items:
+            if item.get_closest_marker("load"):
+                item.add_marker(pytest.mark.skip(reason="load scenario, run with --load"))
+
+    try:
+        dependency_graph = DependencyGraph(items)
+    except DependencyError as e:
+        raise pytest.UsageError(str(e))
+    unit_of = dependency_graph.unit_of(lpt_schedule.unit_key)
+
+    store = get_duration_store()
+    if store is not None:
+        workers = int(config.workerinput["workercount"]) if hasattr(config, "workerinput") else 1
+        by_nodeid = {item.nodeid: item for item in items}
+        plan = lpt_schedule.plan(list(by_nodeid), store.estimate, workers, unit_of=unit_of.get)
+        items[:] = [by_nodeid[nodeid] for bin_nodeids in plan["bins"] for nodeid in bin_nodeids]
+
+        if workers > 1:
+            if config.getoption("dist", "no") != "loadgroup":
+                logger.warning("LPT bins are only honoured with --dist loadgroup")
+            for index, bin_nodeids in enumerate(plan["bins"]):
+                for nodeid in bin_nodeids:
+                    by_nodeid[nodeid].add_marker(pytest.mark.xdist_group(lpt_schedule.group_name(index)))
+        logger.info(f"Longest-first schedule on {workers} worker(s): predicted makespan {plan['makespan']} s")
+        schedule_plan.update(plan)
+        if hasattr(config, "workeroutput"):
+            config.workeroutput["schedule_plan"] = plan
+
+    items[:] = dependency_graph.ordered(items)
+
+
+def pytest_runtest_setup(item):
+    """Skips a test right away when one of its @depends_on prerequisites failed or was skipped."""
+    if dependency_graph is None:
+        return
+    unmet = [node[1] for node in dependency_graph.prerequisites(item) if node in unmet_prerequisites]
+    if unmet:
+        pytest.skip(f"prerequisite {', '.join(unmet)} did not pass")
+
+
+def start_screencast(driver):
+    """Starts the screencast recorder of a new driver, None when disabled or not possible."""
+    if not ScreencastRecorder.is_enabled(driver):
+        return None
+    recorder = ScreencastRecorder(driver)
+    try:
+        recorder.start()
+    except Exception as e:
+        logger.error(f"Screencast recording not started: {e}")
+        return None
+    return recorder
+
+
+@pytest.fixture
+def pages(setup):
+    """
+    Page objects of the class's driver, created lazily once per driver (pages/page_factory.py):
+        pages.login.enter_username(username)
+        pages.dashboard.perform_logout()
+    """
+    return Pages.of(setup)
+
+
+@pytest.fixture(scope="session")
+def data_pool():
+    """
+    Unique usernames, employees and leave dates for this worker / run
+    (utility/data_pool.py); everything created is deleted in bulk at session end.
+    """
+    pool = DataPool()
+    yield pool
+    pool.cleanup()
+
+
+@pytest.fixture
+def handoff(request):
+    """
+    Explicit data passing between dependent tests:
+        handoff.publish("username", new_username)            # prerequisite
+        handoff.get("tc05", "username", default=...)          # dependent
+    """
+    return data_handoff.bind(request.node, dependency_graph.key(request.node) if dependency_graph else None)
+
+
+def pytest_runtest_logreport(report):
+    """
+    Adds up setup + call + teardown time of every test (per worker under xdist) for the duration history.
+    Streams the finished test into the lite HTML report (--report-mode=lite).
     """
+    lite_report.record(report)
+    if os.environ.get("PYTEST_XDIST_WORKER") or get_duration_store() is None:
+        return
+    # xdist appends "@<group>" to the node id of grouped tests
+    nodeid = lpt_schedule.base_nodeid(report.nodeid)
+    node = getattr(report, "node", None)
+    worker = node.gateway.id if node is not None else "main"
+
+    test_durations[nodeid] += report.duration
+    worker_durations[worker] += report.duration
+    if report.when == "call" or report.outcome != "passed":
+        test_outcomes.setdefault(nodeid, report.outcome)
+    if report.when == "teardown":
+        get_duration_store().add(nodeid, test_durations[nodeid], test_outcomes.get(nodeid, "passed"))
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Tags everything recorded from now on (perf data, ...) with the running test and starts its trace buffer."""
+    set_current_test(nodeid)
+    trace_buffer.start(nodeid)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    set_current_test(None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """
+    Records the WebDriver commands issued while the test body runs and checks
+    them against the command budget (pytest.ini or command_budget marker).
+    Attaches the performance summary of the test's page navigations to Allure.
+    Samples browser memory before / after the test to flag leaks.
+    Stores a DOM snapshot of the page the test ended on.
+    Starts a fresh screencast buffer for the test.
+    """
+    counter = getattr(item.cls, "command_counter", None) if item.cls else None
+    sampler = getattr(item.cls, "resource_sampler", None) if item.cls else None
+    screencast = getattr(item.cls, "screencast", None) if item.cls else None
+    if screencast:
+        screencast.mark()
+
+    before = sample_resources(sampler)
+    mark = counter.snapshot() if counter else None
+
+    outcome = yield
+
+    # Command stats first, so the sampler's own CDP calls are not counted
+    stats = counter.since(mark) if counter else None
+    attach_perf_summary(item)
+    driver = getattr(item.cls, "driver", None) if item.cls else None
+    if driver:
+        dom_snapshots.capture(driver, "test_end")
+    if before:
+        check_resources(item, sampler, before)
+    if stats:
+        check_command_budget(item, stats, outcome)
+
+
+def sample_resources(sampler):
+    """Takes a memory / CPU sample, never breaks the test when the browser is gone."""
+    if sampler is None:
+        return None
     try:
-        logger = logging.getLogger()
-        logger.setLevel(logging.INFO)
-        formatter = logging.Formatter(fmt='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+        return sampler.sample()
+    except Exception as e:
+        logger.error(f"Resource sampling failed: {e}")
+        return None
 
-        # File handler for saving logs to file
-        file_handler = logging.FileHandler("test_logs.log")
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
 
-        # Console handler to print logs on terminal
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+def check_resources(item, sampler, before):
+    """Flags a test whose browser memory grew over the leak thresholds and recycles the tab / browser when needed."""
+    after = sample_resources(sampler)
+    if after is None:
+        return
+    result = sampler.compare(before, after)
+    allure.attach(json.dumps(result, indent=2), name="Browser memory / CPU",
+                  attachment_type=allure.attachment_type.JSON)
+    item.user_properties.append(("js_heap_delta_mb", result["delta"]["heap_mb"]))
+    logger.info(f"Browser resources after test: {after} (delta {result['delta']})")
 
-        logger.info("Logging configured successfully")
+    if result["leaks"]:
+        memory_leaks[item.nodeid] = result["leaks"]
+        logger.warning(f"Possible memory leak in {item.nodeid}: {', '.join(result['leaks'])}")
+    if result["recycle"]:
+        logger.warning(f"Browser over memory threshold after {item.nodeid} → recycling the {result['recycle']}")
+        try:
+            sampler.recycle(result["recycle"])
+        except Exception as e:
+            logger.error(f"Browser recycle failed: {e}")
+            return
+        screencast = getattr(item.cls, "screencast", None)
+        if screencast and result["recycle"] == "driver":
+            # The recorder's DevTools socket belonged to the old browser
+            screencast.stop()
+            screencast_overhead.append(screencast.measurements())
+            item.cls.screencast = start_screencast(sampler.driver)
 
+
+def attach_perf_summary(item):
+    """
+    Attaches the Navigation Timing / Web Vitals records of one test to Allure
+    and checks them against the [Perf_Budgets] of config.ini.
+    """
+    records = perf_metrics.records_for(item.nodeid)
+    if not records:
+        return
+    allure.attach(perf_metrics.summary_table(records), name="Page performance summary",
+                  attachment_type=allure.attachment_type.TEXT)
+    allure.attach(json.dumps(records, indent=2), name="Page performance records",
+                  attachment_type=allure.attachment_type.JSON)
+
+    violations = check_records(records)
+    if violations:
+        perf_violations[item.nodeid] = violations
+        allure.dynamic.tag("perf-budget-violation")
+        allure.attach("\n".join(violations), name="Performance budget violations",
+                      attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Remembers tests that did not pass, so their @depends_on dependents are skipped.
+    Writes the trace archive and the screencast clip of a test that failed in setup or call.
+    Performance budget violations are reported as their own failure category
+    (PERF-FAILED) so they are not mixed up with functional failures.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed and report.when in ("setup", "call"):
+        attach_trace(item, report)
+        attach_screencast(item)
+    # Functional result only: a PERF-FAILED prerequisite still produced its data
+    if (report.failed or report.skipped) and dependency_graph is not None:
+        unmet_prerequisites.add(dependency_graph.key(item))
+    if report.when != "call" or item.nodeid not in perf_violations:
+        return
+
+    report.perf_violations = perf_violations[item.nodeid]
+    if get_config("Perf", "budget_mode").lower() == "fail" and report.passed:
+        report.outcome = "failed"
+        report.perf_failed = True
+        report.longrepr = "Performance budget exceeded:\n" + "\n".join(report.perf_violations)
+
+
+def attach_trace(item, report):
+    """Writes the failure trace of the test (utility/trace_buffer.py) and links it from Allure."""
+    trace = trace_buffer.current()
+    if trace is None or trace.nodeid != item.nodeid or item.nodeid in failure_traces:
+        return
+    driver = getattr(item.cls, "driver", None) if item.cls else None
+    try:
+        path = trace.write(driver, report.longreprtext[-4000:])
     except Exception as e:
-        print(f"Failed to configure logging: {e}")
\ No newline at end of file
+        logger.error(f"Trace of {item.nodeid} not written: {e}")
+        return
+    failure_traces[item.nodeid] = path
+    lite_report.attach(path)
+    allure.attach.file(path, name="Failure trace (steps, DOM, console, network)", extension="zip")
+
+
+def attach_screencast(item):
+    """Encodes the screencast frames of the failed test (utility/screencast.py) and attaches the clip to Allure."""
+    screencast = getattr(item.cls, "screencast", None) if item.cls else None
+    if screencast is None:
+        return
+    try:
+        path = screencast.save_clip(item.nodeid)
+    except Exception as e:
+        logger.error(f"Screencast of {item.nodeid} not saved: {e}")
+        return
+    if path is None:
+        return
+    lite_report.attach(path)
+    if path.endswith(".mp4"):
+        allure.attach.file(path, name="Screencast", attachment_type=allure.attachment_type.MP4)
+    else:
+        allure.attach.file(path, name="Screencast frames", attachment_type=allure.attachment_type.ZIP)
+    allure.attach(json.dumps(screencast.measurements(), indent=2), name="Screencast overhead",
+                  attachment_type=allure.attachment_type.JSON)
+
+
+def pytest_report_teststatus(report, config):
+    """Shows perf-only failures as PERF-FAILED (P) instead of FAILED (F)."""
+    if getattr(report, "perf_failed", False):
+        return "perf_failed", "P", ("PERF-FAILED", {"yellow": True})
+
+
+def check_command_budget(item, stats, outcome):
+    """Records the command stats of one test and warns / fails when over budget."""
+    command_stats[item.nodeid] = stats
+    item.user_properties.append(("webdriver_commands", stats["total"]))
+    item.user_properties.append(("webdriver_latency_ms", stats["latency_ms"]))
+    allure.attach(json.dumps(stats, indent=2), name="WebDriver commands",
+                  attachment_type=allure.attachment_type.JSON)
+    logger.info(f"WebDriver commands: {stats['total']} ({stats['latency_ms']} ms) → {item.nodeid}")
+
+    # Budget → marker first, else pytest.ini defaults
+    marker = item.get_closest_marker("command_budget")
+    if marker:
+        max_commands = marker.kwargs.get("max_commands", marker.args[0] if marker.args else 0)
+        max_latency_ms = marker.kwargs.get("max_latency_ms", 0)
+    else:
+        max_commands = int(item.config.getini("command_budget"))
+        max_latency_ms = float(item.config.getini("command_latency_budget_ms"))
+
+    violations = budget_violations(stats, max_commands, max_latency_ms)
+    if not violations:
+        return
+
+    message = f"Command budget exceeded for {item.nodeid}: " + "; ".join(violations)
+    logger.warning(message)
+    if item.config.getini("command_budget_mode").lower() == "fail" and outcome.exception is None:
+        outcome.force_exception(pytest.fail.Exception(message, pytrace=False))
+    else:
+        warnings.warn(CommandBudgetWarning(message))
+
+
+def pytest_sessionfinish(session):
+    """
+    Writes the page performance records of the whole run (per test and per URL)
+    and stores the test durations of this run after comparing them with the predicted schedule.
+    Adds the locator strategy hits of this run to the persisted statistics.
+    Closes the lite HTML report. Compacts the Allure results once per run (not in the xdist workers),
+    only when this run wrote results to an --alluredir.
+    """
+    perf_metrics.write_results()
+    lite_report.close()
+
+    if (get_config("Allure", "compact_after_run").lower() == "true" and "PYTEST_XDIST_WORKER" not in os.environ
+            and not session.config.getoption("collectonly")):
+        directory = session.config.getoption("allure_report_dir", None)
+        try:
+            if directory and allure_compactor.has_results_since(directory, run_started):
+                allure_compaction.update(allure_compactor.compact(directory, run_started=run_started))
+        except Exception as e:
+            logger.error(f"Allure results compaction failed: {e}")
+
+    if locator_registry.is_enabled():
+        stats = locator_registry.get_stats()
+        locator_fallbacks.extend(stats.fallbacks())
+        stats.save()
+
+    store = duration_store
+    if store is None or not test_durations:
+        return
+    if schedule_plan:
+        schedule_plan["actual_makespan"] = round(max(worker_durations.values()), 1)
+    store.flush()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist controller: takes over the schedule the workers planned at collection (identical on every worker)."""
+    plan = getattr(node, "workeroutput", {}).get("schedule_plan")
+    if plan and not schedule_plan:
+        schedule_plan.update(plan)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Prints the predicted vs actual makespan, memory leak suspects, performance
+    budget violations, locators that fell back, the trace archives of failed
+    tests, the screencast overhead, the Allure results compaction, the lite HTML
+    report and the WebDriver command count / latency of every test.
+    """
+    if "actual_makespan" in schedule_plan:
+        terminalreporter.section("Test scheduling (longest-first)")
+        terminalreporter.write_line(f"Workers: {len(schedule_plan['loads'])}, predicted makespan "
+                                    f"{schedule_plan['makespan']} s, actual makespan {schedule_plan['actual_makespan']} s")
+        terminalreporter.write_line(f"    predicted bin loads: {', '.join(f'{load} s' for load in schedule_plan['loads'])}")
+        terminalreporter.write_line("    actual worker loads: " + ", ".join(
+            f"{worker} {seconds:.1f} s" for worker, seconds in sorted(worker_durations.items())))
+
+    if memory_leaks:
+        terminalreporter.section("Possible browser memory leaks")
+        for nodeid, leaks in memory_leaks.items():
+            terminalreporter.write_line(f"{nodeid}: {', '.join(leaks)}")
+
+    if perf_violations:
+        terminalreporter.section("Performance budget violations")
+        for nodeid, violations in perf_violations.items():
+            terminalreporter.write_line(nodeid)
+            for violation in violations:
+                terminalreporter.write_line(f"    {violation}")
+
+    if locator_fallbacks:
+        terminalreporter.section("Locator fallbacks (update the primary strategy)")
+        terminalreporter.write_line(locator_registry.fallback_report(locator_fallbacks))
+
+    if failure_traces:
+        terminalreporter.section("Failure traces")
+        for nodeid, path in failure_traces.items():
+            terminalreporter.write_line(f"{nodeid}: {path}")
+
+    if screencast_overhead:
+        terminalreporter.section("Screencast overhead")
+        for stats in screencast_overhead:
+            terminalreporter.write_line(
+                f"thread CPU {stats['thread_cpu_s']} s ({stats['cpu_share']:.1%} of one core), "
+                f"frames {stats['frames_kept']} kept / {stats['frames_received']} received, "
+                f"every {stats['every_nth']}. frame, {stats['clips']} clips {stats['clip_mb']} MB "
+                f"encoded in {stats['encode_s']} s")
+
+    if allure_compaction:
+        terminalreporter.section("Allure results compaction")
+        terminalreporter.write_line(
+            f"{allure_compaction['results_removed']} old results, {allure_compaction['containers_removed']} empty "
+            f"and {allure_compaction['containers_merged']} duplicate containers, "
+            f"{allure_compaction['attachments_deduplicated']} duplicate and {allure_compaction['attachments_removed']} "
+            f"orphaned attachments removed → {allure_compaction['bytes_freed'] / 1024 / 1024:.2f} MB freed "
+            f"in {allure_compaction['elapsed_s']} s")
+
+    if lite_report.report_path():
+        terminalreporter.write_sep("-", f"Generated lite html report: file://{os.path.abspath(lite_report.report_path())}")
+
+    if not command_stats:
+        return
+    terminalreporter.section("WebDriver commands per test")
+    for nodeid, stats in sorted(command_stats.items(), key=lambda item: item[1]["total"], reverse=True):
+        by_type = ", ".join(f"{name}={item['count']}" for name, item in sorted(stats["by_type"].items()))
+        terminalreporter.write_line(f"{stats['total']:>5} cmds {stats['latency_ms']:>10.1f} ms  {nodeid}  [{by_type}]")
@@ -1,4 +1,10 @@
 from selenium.webdriver.common.by import By
+from utility.locator_registry import Locator, by_text
+
+# Locator(by, value, *fallbacks) → primary strategy first, then the fallbacks tried
+# in the same lookup when the OXD markup changes (see utility/locator_registry.py).
+# A fallback must be as specific as its primary: scoped to the form / page container,
+# matching the one element only.
 
 # Login Page Locators
 class LoginPageLocators:
@@ -8,7 +14,8 @@ class LoginPageLocators:
     PASSWORD_INPUT = (By.NAME, "password")       # Password input field
 
     # ---------- Login Button ----------
-    LOGIN_BUTTON = (By.XPATH, "//button[@type='submit']")       # Login button
+    LOGIN_BUTTON = Locator(By.XPATH, "//button[@type='submit']",       # Login button
+                           (By.CSS_SELECTOR, "button.orangehrm-login-button"), by_text("Login", "button"))
 
     # ---------- Validation Error Messages ----------
     ERROR_MESSAGES = {
@@ -27,9 +34,11 @@ class LoginPageLocators:
 class DashBoardPageLocators:
 
     # Locators for
-    DASHBOARD_LOCATOR = (By.XPATH, "//p[@class='oxd-userdropdown-name']")       # Dashboard username
+    DASHBOARD_LOCATOR = Locator(By.XPATH, "//p[@class='oxd-userdropdown-name']",       # Dashboard username
+                                (By.CSS_SELECTOR, "p.oxd-userdropdown-name"))
     PROFILE_ICON = (By.CLASS_NAME, "oxd-userdropdown")                          # Profile dropdown icon
-    LOGOUT_BUTTON = (By.XPATH, "//a[text()='Logout']")                          # Logout option
+    LOGOUT_BUTTON = Locator(By.XPATH, "//a[text()='Logout']",                  # Logout option
+                            (By.CSS_SELECTOR, "a[href$='/auth/logout']"))
 
     MENU_ITEMS_TAB=(By.XPATH, "//ul[@class='oxd-main-menu']//child::li")        # All menu items
 
@@ -52,16 +61,22 @@ class AdminPageLocators:
 
     # ---------- Navigation ----------
     ADMIN_MENU = (By.XPATH, "//span[text()='Admin']")           # Admin menu in sidebar
-    USER_MANAGEMENT_MENU = (By.XPATH, "(//span[@class='oxd-topbar-body-nav-tab-item'])[1]")     # User Mgmt top bar
+    USER_MANAGEMENT_MENU = Locator(By.XPATH, "(//span[@class='oxd-topbar-body-nav-tab-item'])[1]",     # User Mgmt top bar
+                                   by_text("User Management", "span"))
     USERS_SUBMENU = (By.XPATH, "//a[text()='Users']")   # User list submenu
 
-    ADD_USER_BUTTON = (By.XPATH, "(//button[contains(@class,'oxd-button')])[3]")     # Add User button
+    ADD_USER_BUTTON = Locator(By.XPATH, "(//button[contains(@class,'oxd-button')])[3]",     # Add User button
+                              (By.XPATH, "//div[contains(@class,'orangehrm-header-container')]//button"),
+                              (By.XPATH, "//div[contains(@class,'orangehrm-header-container')]"
+                                         "//button[normalize-space(.)='Add']"))
 
     # ---------- User Form Fields ----------
-    ROLE_DROPDOWN = (By.XPATH, "//label[text()='User Role']/following::div[@class='oxd-select-text-input'][1]")
+    ROLE_DROPDOWN = Locator(By.XPATH, "//label[text()='User Role']/following::div[@class='oxd-select-text-input'][1]",
+                            (By.XPATH, "//label[text()='User Role']/../following-sibling::*//div[contains(@class,'oxd-select-text-input')]"))
     ROLE_OPTIONS = (By.XPATH, "//div[@role='option']")          # User role options
 
-    STATUS_DROPDOWN = (By.XPATH, "(//label[text()='Status']/following::div[contains(@class,'oxd-select-text-input')])")
+    STATUS_DROPDOWN = Locator(By.XPATH, "(//label[text()='Status']/following::div[contains(@class,'oxd-select-text-input')])",
+                              (By.XPATH, "//label[text()='Status']/../following-sibling::*//div[contains(@class,'oxd-select-text-input')]"))
     STATUS_OPTIONS = (By.XPATH,"//div[@role='option']//span | //div[@role='option']")           # Status dropdown options
 
     EMPLOYEE_NAME_INPUT = (By.XPATH, "//input[@placeholder='Type for hints...']")       # Search employee input
@@ -72,7 +87,9 @@ class AdminPageLocators:
     CONFIRM_PASSWORD_INPUT = (By.XPATH, "//label[text()='Confirm Password']/following::input[1]")       # Confirm password
 
     SUCCESS_MESSAGE = (By.XPATH, "//div[contains(@class,'oxd-toast') and contains(.,'Success')]") # Success message
-    SAVE_BUTTON = (By.XPATH, "//button[@type='submit' and contains(@class,'oxd-button')]")   # Save user
+    SAVE_BUTTON = Locator(By.XPATH, "//button[@type='submit' and contains(@class,'oxd-button')]",   # Save user
+                          (By.CSS_SELECTOR, "form.oxd-form div.oxd-form-actions button[type='submit']"),
+                          (By.XPATH, "//div[contains(@class,'oxd-form-actions')]//button[normalize-space(.)='Save']"))
 
     # ---------- Search User Section ----------
     SEARCH_USERNAME_INPUT = (By.XPATH, "//label[text()='Username']/../following-sibling::div/input")
@@ -110,7 +127,8 @@ class LeaveAssignPageLocators:
     EMPLOYEE_DROPDOWN_LIST = (By.XPATH, "//div[@role='listbox']//div[@role='option']")
 
     # ---------- Leave Type Dropdown ----------
-    LEAVE_TYPE_DROPDOWN = (By.XPATH,"//label[text()='Leave Type']/../..//div[contains(@class,'oxd-select-text')]")
+    LEAVE_TYPE_DROPDOWN = Locator(By.XPATH, "//label[text()='Leave Type']/../..//div[contains(@class,'oxd-select-text')]",
+                                  (By.XPATH, "//label[text()='Leave Type']/../following-sibling::*//div[contains(@class,'oxd-select-text-input')]"))
     # Dynamic leave type option
     LEAVE_TYPE_OPTIONS = "//div[@role='listbox']//span[text()='{}']"
 
@@ -121,7 +139,8 @@ class LeaveAssignPageLocators:
     # ---------- Other Fields ----------
     COMMENTS = (By.XPATH, "//textarea")
     ASSIGN_BUTTON = (By.XPATH, "//button[@type='submit']")
-    CONFIRM_LEAVE = (By.XPATH, "(//button[@type='button'])[5]")
+    CONFIRM_LEAVE = Locator(By.XPATH, "(//button[@type='button'])[5]",
+                            (By.XPATH, "//div[@role='document']//button[normalize-space(.)='Ok']"))
     SUCCESS_MSG = (By.XPATH, "//div[contains(@class,'oxd-toast-content--success')]")
 
     # ---------- Leave List ----------
@@ -129,6 +148,8 @@ class LeaveAssignPageLocators:
     SEARCH_BUTTON = (By.XPATH, "//button[@type='submit']")
     SEARCH_RESULT_MESSAGE = (By.XPATH, "//div[@class='oxd-toast-start']//p[text()='No Records Found']")
     SEARCH_RESULT = (By.XPATH, "//div[@class='orangehrm-paper-container']//span[text()='(No Records Found)']")
+    RECORDS_FOUND = (By.XPATH, "//div[@class='orangehrm-paper-container']//span[contains(normalize-space(.),'Record')]")
+    TABLE_LOADER = (By.CSS_SELECTOR, "div.oxd-table-loader")
 
 # Claim Page Locators
 class ClaimPageLocators:
@@ -145,11 +166,13 @@ class ClaimPageLocators:
         CURRENCY_TYPE_DROPDOWN = (By.XPATH, "//div[@role='option']//span[text()='{}']")
 
         REASON = (By.XPATH, "//textarea")       # Claim reason textarea
-        CREATE_CLAIM = (By.XPATH, "//button[text()=' Create ']")
+        CREATE_CLAIM = Locator(By.XPATH, "//button[text()=' Create ']",
+                               (By.XPATH, "//button[normalize-space(.)='Create']"))
         SUCCESS_MESSAGE = (By.XPATH, "//p[text()='Success']")
 
         # ---------- Expense Section ----------
-        ADD_BUTTON = (By.XPATH, "(//button[text()=' Add '])[1]")
+        ADD_BUTTON = Locator(By.XPATH, "(//button[text()=' Add '])[1]",
+                             (By.XPATH, "//h6[normalize-space(.)='Expenses']/..//button[normalize-space(.)='Add']"))
 
         EXPENSE_TYPE = (By.XPATH, "(//div[@class ='oxd-select-text-input'])[1]")
         EXPENSE_TYPE_DROPDOWN = (By.XPATH, "//div[@role='option']")
@@ -161,8 +184,22 @@ class ClaimPageLocators:
         SAVE_BUTTON = (By.XPATH, "//button[@type='submit']")
 
         # ---------- Submission and History ----------
-        SUBMIT_CLAIM=(By.XPATH,"//div[@class='orangehrm-action-buttons-container']//button[text()=' Submit ']")
+        SUBMIT_CLAIM = Locator(By.XPATH, "//div[@class='orangehrm-action-buttons-container']//button[text()=' Submit ']",
+                               (By.XPATH, "//div[contains(@class,'orangehrm-action-buttons-container')]"
+                                          "//button[normalize-space(.)='Submit']"))
         CLAIM_HISTORY_ROW = (By.XPATH, "(//div[@class='oxd-table-card'])[1]")       # First claim row
         MY_CLAIMS_TAB = (By.XPATH, "//a[text()='My Claims']")
         LOADER = (By.CSS_SELECTOR, "div.oxd-form-loader")
 
+# OXD Select Dropdown Locators
+class DropdownLocators:
+
+    # Open listbox rendered by any OXD select (only one is open at a time)
+    LISTBOX = (By.CSS_SELECTOR, "div[role='listbox']")
+
+    # CSS selector used inside scripts to read / pick options in one call
+    OPTION_CSS = "div[role='listbox'] div[role='option']"
+
+    # Text shown in the select box once a value is chosen
+    SELECTED_TEXT = (By.CSS_SELECTOR, "div.oxd-select-text-input")
+
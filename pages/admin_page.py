@@ -1,15 +1,44 @@
 from selenium.common import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 from pages.base_page import Base_Page
+from pages.oxd_dropdown import OXD_Dropdown
 from locators.locators import AdminPageLocators
 import logging
-from selenium.webdriver.support.ui import WebDriverWait
 import allure
 
 # Create a logger for this module
 logger = logging.getLogger(__name__)
 
 class Admin_Page(Base_Page):
+    __slots__ = ()
+
+    # ---------------- Locators --------------------
+    admin_menu = AdminPageLocators.ADMIN_MENU
+    user_management_menu = AdminPageLocators.USER_MANAGEMENT_MENU
+    users_submenu = AdminPageLocators.USERS_SUBMENU
+
+    add_user_button = AdminPageLocators.ADD_USER_BUTTON
+
+    role_dropdown = AdminPageLocators.ROLE_DROPDOWN
+    role_options = AdminPageLocators.ROLE_OPTIONS
+
+    status_dropdown = AdminPageLocators.STATUS_DROPDOWN
+    status_options = AdminPageLocators.STATUS_OPTIONS
+
+    employee_name_input = AdminPageLocators.EMPLOYEE_NAME_INPUT
+    employee_dropdown_option = AdminPageLocators.EMPLOYEE_DROPDOWN_OPTION
+
+    username_input = AdminPageLocators.USERNAME_INPUT
+    password_input = AdminPageLocators.PASSWORD_INPUT
+    confirm_password_input = AdminPageLocators.CONFIRM_PASSWORD_INPUT
+
+    save_button = AdminPageLocators.SAVE_BUTTON
+    success_message = AdminPageLocators.SUCCESS_MESSAGE
+
+    search_username_input = AdminPageLocators.SEARCH_USERNAME_INPUT
+    search_button = AdminPageLocators.SEARCH_BUTTON
+    results_rows = AdminPageLocators.RESULT_ROWS
+
     def __init__(self,driver):
         """
         Page Object Model (POM) for the OrangeHRM Admin Page.
@@ -20,39 +49,8 @@ class Admin_Page(Base_Page):
             - Selecting dropdown values (Role, Status)
             - Searching & validating users in table
         """
-        # Store driver instance
-        self.driver=driver
-        # WebDriverWait to use throughout the class (default 30 sec)
-        self.wait = WebDriverWait(self.driver, 30)
         super().__init__(driver)
 
-        # ---------------- Locators --------------------
-        self.admin_menu = AdminPageLocators.ADMIN_MENU
-        self.user_management_menu = AdminPageLocators.USER_MANAGEMENT_MENU
-        self.users_submenu = AdminPageLocators.USERS_SUBMENU
-
-        self.add_user_button= AdminPageLocators.ADD_USER_BUTTON
-
-        self.role_dropdown= AdminPageLocators.ROLE_DROPDOWN
-        self.role_options = AdminPageLocators.ROLE_OPTIONS
-
-        self.status_dropdown = AdminPageLocators.STATUS_DROPDOWN
-        self.status_options = AdminPageLocators.STATUS_OPTIONS
-
-        self.employee_name_input = AdminPageLocators.EMPLOYEE_NAME_INPUT
-        self.employee_dropdown_option = AdminPageLocators.EMPLOYEE_DROPDOWN_OPTION
-
-        self.username_input = AdminPageLocators.USERNAME_INPUT
-        self.password_input = AdminPageLocators.PASSWORD_INPUT
-        self.confirm_password_input = AdminPageLocators.CONFIRM_PASSWORD_INPUT
-
-        self.save_button = AdminPageLocators.SAVE_BUTTON
-        self.success_message=AdminPageLocators.SUCCESS_MESSAGE
-
-        self.search_username_input = AdminPageLocators.SEARCH_USERNAME_INPUT
-        self.search_button = AdminPageLocators.SEARCH_BUTTON
-        self.results_rows =AdminPageLocators.RESULT_ROWS
-
         logger.info("Admin_Page initialized successfully.")
 
     # OPEN ADMIN MENU
@@ -87,51 +85,19 @@ class Admin_Page(Base_Page):
     @allure.step("Selecting user role: {role_name}")
     def select_role(self, role_name):
         logger.info(f"Selecting role: {role_name}")
-        # Wait & Click dropdown
-        dropdown = self.is_visible(self.role_dropdown)
-        dropdown.click()
-
-        # Wait for elements
-        options = self.find_elements(self.role_options)
-
-        if not options:
-            raise Exception("Role dropdown options did not load!")
-
-        actions = ActionChains(self.driver)
-
-        # Loop and select a required role
-        for opt in options:
-            if opt.text.strip().lower() == role_name.lower():
-                actions.move_to_element(opt).pause(0.2).click().perform()
-                logger.info(f"Role selected: {role_name}")
-                return True
-        raise Exception(f"Role '{role_name}' not found in dropdown options")
+        # Open dropdown, read options once (cached) & click required role
+        OXD_Dropdown(self.driver, self.role_dropdown, name="user_role").select(role_name)
+        logger.info(f"Role selected: {role_name}")
+        return True
 
     # SELECT STATUS
     @allure.step("Selecting status: {expected_value}")
     def select_status(self, expected_value):
         logger.info(f"Selecting status: {expected_value}")
-        # Open dropdown
-        dropdown = self.is_visible(self.status_dropdown)
-        dropdown.click()
-
-        # Wait for options to appear
-        options = self.find_elements(self.status_options)
-
-        if not options:
-            raise Exception("Dropdown options did not load")
-
-        actions = ActionChains(self.driver)
-
-        # Loop and select a matching option
-        for opt in options:
-            if opt.text.strip().lower() == expected_value.lower():
-                # Move to option
-                actions.move_to_element(opt).pause(0.3).click().perform()
-                logger.info(f"Status selected: {expected_value}")
-                return True
-
-        raise Exception(f"'{expected_value}' not found in dropdown options")
+        # Open dropdown, read options once (cached) & click matching status
+        OXD_Dropdown(self.driver, self.status_dropdown, name="user_status").select(expected_value)
+        logger.info(f"Status selected: {expected_value}")
+        return True
 
     # SELECT EMPLOYEE NAME
     @allure.step("Selecting employee name: {emp_name}")
@@ -154,8 +120,19 @@ class Admin_Page(Base_Page):
 
     # FILL NEW USER DETAILS
     @allure.step("Entering new user details for: {username}")
-    def new_user_details(self, username, password):
+    def new_user_details(self, username, password, bulk=False):
+        """
+        Fills Username, Password & Confirm Password.
+        bulk=True → all three fields are set with one script call (Base_Page.bulk_fill)
+        """
         logger.info(f"Creating new user: {username}")
+        if bulk:
+            self.bulk_fill({
+                self.username_input: username,
+                self.password_input: password,
+                self.confirm_password_input: password,
+            })
+            return
         # Username
         self.send_keys(self.username_input, username)
         # Password + Confirm
@@ -3,12 +3,47 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException,ElementClickInterceptedException
 import allure
 import logging
+from utility import perf_metrics
+from utility import dom_snapshots
+from utility import locator_registry
+from utility import trace_buffer
+from utility import lite_report
 from selenium.webdriver.common.action_chains import ActionChains as actions
 from selenium.webdriver.common.keys import Keys
 
 # Set up logger for this test module
 logger = logging.getLogger(__name__)
 
+# Sets several Vue-bound inputs in ONE script call.
+# arguments[0] → [[by, value, text], ...]; returns one true/false per field.
+# The native value setter is used so Vue's v-model sees the change,
+# then input/change events are dispatched and the field is blurred.
+BULK_FILL_SCRIPT = """
+var results = [];
+arguments[0].forEach(function (field) {
+    var by = field[0], value = field[1], text = field[2], el = null;
+    if (by === 'xpath') {
+        el = document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } else if (by === 'css selector') {
+        el = document.querySelector(value);
+    } else if (by === 'id') {
+        el = document.getElementById(value);
+    } else if (by === 'name') {
+        el = document.getElementsByName(value)[0] || null;
+    } else if (by === 'class name') {
+        el = document.getElementsByClassName(value)[0] || null;
+    }
+    if (!el || el.disabled || el.readOnly) { results.push(false); return; }
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+    results.push(true);
+});
+return results;
+"""
+
 
 class Base_Page:
     """
@@ -18,13 +53,28 @@ class Base_Page:
        - Send Keys
        - Waits
        - Visibility checks
+       - Locator fallback resolution
        - Action Chains
        - Allure reporting helpers
        """
 
+    # Page objects are created once per driver (pages/page_factory.py):
+    # no per-instance __dict__, locators are class attributes of the subclasses
+    __slots__ = ("driver", "wait", "_query_cache")
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 30)
+        # results of the @cached_query methods (utility/query_cache.py)
+        self._query_cache = {}
+
+    # LOCATOR RESOLUTION
+    def resolve(self, locator):
+        """
+        Strategy of a Locator with fallbacks that currently finds the element
+        (utility/locator_registry.py); plain (By, value) tuples are returned as they are.
+        """
+        return locator_registry.resolve(self.driver, locator)
 
     # CLICK OPERATION
     def click(self, locator):
@@ -35,7 +85,11 @@ class Base_Page:
         with allure.step(f"Clicking element → {locator}"):
             try:
                 logger.info(f"Clicking on element: {locator}")
+                trace_buffer.step("click", locator)
+                locator = self.resolve(locator)
                 element = self.wait.until(EC.element_to_be_clickable(locator))
+                # DOM before the click (open dropdowns, dialogs) for the locator validator
+                dom_snapshots.capture(self.driver, "click")
                 element.click()
                 return  element
             except (TimeoutException, ElementClickInterceptedException) as e:
@@ -50,12 +104,44 @@ class Base_Page:
         with allure.step(f"Entering text into element → {locator}"):
             try:
                 logger.info(f"Sending keys to {locator}: {text}")
+                # Length only: the trace archive must not contain passwords
+                trace_buffer.step("send_keys", f"{locator} ({len(str(text))} chars)")
                 element = self.is_visible(locator)
                 element.clear()
                 element.send_keys(text)
             except TimeoutException as e:
                 raise AssertionError(f"Cannot send keys to element {locator}: {e}")
 
+    # BULK FORM FILL
+    def bulk_fill(self, fields, keyboard_fields=()):
+        """
+        Opt-in fast form fill.
+        Sets every field of `fields` ({locator: text}) with one execute_script
+        and dispatches input/change events so the Vue form picks the values up.
+
+        keyboard_fields → locators that must still be typed with real
+        keystrokes (use it where keyboard behaviour is under test).
+        Any field the script cannot set falls back to send_keys().
+        """
+        with allure.step(f"Bulk filling {len(fields)} fields"):
+            logger.info(f"Bulk filling fields: {list(fields)}")
+            trace_buffer.step("bulk_fill", list(fields))
+            scripted = [(locator, text) for locator, text in fields.items() if locator not in keyboard_fields]
+
+            if scripted:
+                # Wait once for the form to render instead of once per field
+                self.is_visible(scripted[0][0])
+                results = self.driver.execute_script(
+                    BULK_FILL_SCRIPT, [[*self.resolve(locator), str(text)] for locator, text in scripted])
+                for (locator, text), done in zip(scripted, results):
+                    if not done:
+                        logger.info(f"Bulk fill fallback to keystrokes for {locator}")
+                        self.send_keys(locator, text)
+
+            for locator in keyboard_fields:
+                if locator in fields:
+                    self.send_keys(locator, fields[locator])
+
     # URL HANDLING
     def get_current_url(self):
         """Returns the current page URL."""
@@ -65,13 +151,18 @@ class Base_Page:
     def wait_for_url(self, expected_url):
         """
             Waits until the URL matches the expected URL.
+            Then captures the page performance (Navigation Timing, Web Vitals)
+            when [Perf] enabled = true and a DOM snapshot when [DOM_Snapshots] enabled = true.
         """
         with allure.step(f"Waiting for URL → {expected_url}"):
             logger.info(f"Waiting for URL to be: {expected_url}")
+            trace_buffer.step("wait_for_url", expected_url)
             try:
                 self.wait.until(EC.url_to_be(expected_url))
             except TimeoutException:
                 raise AssertionError(f"Timed out waiting for URL {expected_url}")
+            perf_metrics.capture(self.driver)
+            dom_snapshots.capture(self.driver)
 
     # VISIBILITY CHECK
     def is_visible(self, locator):
@@ -80,7 +171,9 @@ class Base_Page:
             Returns the element or None if not visible.
         """
         logger.info(f"Checking visibility for element: {locator}")
+        trace_buffer.step("is_visible", locator)
         try:
+            locator = self.resolve(locator)
             element = self.wait.until(EC.visibility_of_element_located(locator))
             return element
         except TimeoutException:
@@ -93,6 +186,7 @@ class Base_Page:
         """
         logger.info(f"Checking if element is displayed & enabled: {locator}")
         try:
+            locator = self.resolve(locator)
             element = self.wait.until(EC.element_to_be_clickable(locator))
             return element.is_displayed() and element.is_enabled()
         except Exception as e:
@@ -103,19 +197,27 @@ class Base_Page:
     def find_elements(self, locator):
         """Returns list of elements located by the locator."""
         logger.info(f"Finding elements with locator: {locator}")
-        return self.wait.until(EC.presence_of_all_elements_located(locator))
+        trace_buffer.step("find_elements", locator)
+        return self.wait.until(EC.presence_of_all_elements_located(self.resolve(locator)))
 
     # ALLURE SCREENSHOT ATTACHMENT
     def attach_save_screenshot(self, name='screenshot'):
         """
         Takes screenshot and attaches it to Allure Report.
+        With [Trace] screenshots = failure only the step is recorded: a failed
+        test gets its screenshot in the trace archive (utility/trace_buffer.py).
         """
+        if trace_buffer.failure_screenshots_only():
+            trace_buffer.step("screenshot", name)
+            return
         logger.info(f"Capturing screenshot → {name}")
         try:
-            file_path = f"screenshots/{name}.png"
-            self.driver.save_screenshot(file_path)
+            # One screenshot round-trip: the same PNG bytes go to the file and to Allure
             png = self.driver.get_screenshot_as_png()
+            with open(f"screenshots/{name}.png", "wb") as f:
+                f.write(png)
             allure.attach(png, name=name, attachment_type=allure.attachment_type.PNG)
+            lite_report.screenshot(name, png)
         except:
             logger.error(f"Screenshot capture failed:")
             pass
@@ -128,6 +230,7 @@ class Base_Page:
         """
         logger.info(f"Waiting for all elements visible: {locator}")
         try:
+            locator = self.resolve(locator)
             elements = self.wait.until(EC.visibility_of_all_elements_located(locator))
             return elements
         except TimeoutException:
@@ -137,12 +240,14 @@ class Base_Page:
     def action_hover(self, element):
         """Hover over an element."""
         logger.info(f"Hovering over element: {element}")
+        trace_buffer.step("action_hover", element)
         with allure.step("Hover over element"):
             actions(self.driver).move_to_element(element).perform()
 
     def action_click(self, element):
         """Perform ActionChain click."""
         logger.info(f"Action click on element: {element}")
+        trace_buffer.step("action_click", element)
         with allure.step("Action click element"):
             actions(self.driver).move_to_element(element).pause(0.2).click().perform()
 
@@ -153,7 +258,8 @@ class Base_Page:
         """
         with allure.step(f"Typing '{value}' into element → {locator}"):
             logger.info(f"Typing into {locator}: {value}")
-            element = self.wait.until(EC.visibility_of_element_located(locator))
+            trace_buffer.step("type", f"{locator} ({len(str(value))} chars)")
+            element = self.wait.until(EC.visibility_of_element_located(self.resolve(locator)))
             element.clear()
             element.send_keys(value)
             element.send_keys(Keys.ENTER)
@@ -164,8 +270,9 @@ class Base_Page:
         Waits until locator is clickable and returns element.
         """
         logger.info(f"Waiting for element clickable: {locator}")
+        trace_buffer.step("wait_until_clickable", locator)
         try:
-            return self.wait.until(EC.element_to_be_clickable(locator))
+            return self.wait.until(EC.element_to_be_clickable(self.resolve(locator)))
         except TimeoutException:
             raise TimeoutException(f"Element not clickable: {locator}")
 
@@ -176,7 +283,7 @@ class Base_Page:
         """
         logger.info(f"Checking presence of element: {locator}")
         try:
-            return self.wait.until(EC.presence_of_element_located(locator))
+            return self.wait.until(EC.presence_of_element_located(self.resolve(locator)))
         except TimeoutException:
             return None
 
@@ -1,62 +1,59 @@
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 import allure
 from locators.locators import ClaimPageLocators
 from pages.base_page import Base_Page
+from pages.oxd_dropdown import OXD_Dropdown
 import logging
 
 # Create a logger for this module
 logger = logging.getLogger(__name__)
 
 class Claim_Page(Base_Page):
-    def __init__(self,driver):
-        """
-        Page Object Model for the Claim Page.
-        Contains:
-            - All claim-related web elements (locators)
-            - Reusable actions to interact with claim UI
-            - Validation and helper methods
-        """
-        # Store driver instance
-        self.driver=driver
-        # WebDriverWait to use throughout the class (default 30 sec)
-        self.wait = WebDriverWait(self.driver, 30)
-        super().__init__(driver)
+    __slots__ = ()
 
-        # ---------------- Locators ----------------
-        self.claim_menu = ClaimPageLocators.CLAIM_MENU
-        self.submit_claims_menu = ClaimPageLocators.SUBMIT_CLAIM_MENU
+    # ---------------- Locators ----------------
+    claim_menu = ClaimPageLocators.CLAIM_MENU
+    submit_claims_menu = ClaimPageLocators.SUBMIT_CLAIM_MENU
 
-        self.claim_type= ClaimPageLocators.CLAIM_TYPE
-        self.claim_type_dropdown=ClaimPageLocators.CLAIM_TYPE_DROPDOWN
+    claim_type = ClaimPageLocators.CLAIM_TYPE
+    claim_type_dropdown = ClaimPageLocators.CLAIM_TYPE_DROPDOWN
 
-        self.currency_type=ClaimPageLocators.CURRENCY_TYPE
-        self.currency_type_dropdown = ClaimPageLocators.CURRENCY_TYPE_DROPDOWN
+    currency_type = ClaimPageLocators.CURRENCY_TYPE
+    currency_type_dropdown = ClaimPageLocators.CURRENCY_TYPE_DROPDOWN
 
-        self.reason=ClaimPageLocators.REASON
+    reason = ClaimPageLocators.REASON
 
-        self.create_claim=ClaimPageLocators.CREATE_CLAIM
-        self.success_message=ClaimPageLocators.SUCCESS_MESSAGE
+    create_claim = ClaimPageLocators.CREATE_CLAIM
+    success_message = ClaimPageLocators.SUCCESS_MESSAGE
 
-        self.add_button=ClaimPageLocators.ADD_BUTTON
+    add_button = ClaimPageLocators.ADD_BUTTON
 
-        self.expense_type=ClaimPageLocators.EXPENSE_TYPE
-        self.expense_type_dropdown = ClaimPageLocators.EXPENSE_TYPE_DROPDOWN
+    expense_type = ClaimPageLocators.EXPENSE_TYPE
+    expense_type_dropdown = ClaimPageLocators.EXPENSE_TYPE_DROPDOWN
 
-        self.select_date=ClaimPageLocators.SELECT_DATE
+    select_date = ClaimPageLocators.SELECT_DATE
 
-        self.amount_input=ClaimPageLocators.AMOUNT_INPUT
-        self.notes=ClaimPageLocators.NOTES
+    amount_input = ClaimPageLocators.AMOUNT_INPUT
+    notes = ClaimPageLocators.NOTES
 
-        self.save_button=ClaimPageLocators.SAVE_BUTTON
-        self.submit_claim =ClaimPageLocators.SUBMIT_CLAIM
+    save_button = ClaimPageLocators.SAVE_BUTTON
+    submit_claim = ClaimPageLocators.SUBMIT_CLAIM
 
-        self.claim_history_row = ClaimPageLocators.CLAIM_HISTORY_ROW
-        self.my_claims = ClaimPageLocators.MY_CLAIMS_TAB
-        self.loader = ClaimPageLocators.LOADER
+    claim_history_row = ClaimPageLocators.CLAIM_HISTORY_ROW
+    my_claims = ClaimPageLocators.MY_CLAIMS_TAB
+    loader = ClaimPageLocators.LOADER
+
+    def __init__(self,driver):
+        """
+        Page Object Model for the Claim Page.
+        Contains:
+            - All claim-related web elements (locators)
+            - Reusable actions to interact with claim UI
+            - Validation and helper methods
+        """
+        super().__init__(driver)
 
     # NAVIGATION METHODS
     @allure.step("Navigate to Claim → Submit Claim")
@@ -71,17 +68,21 @@ class Claim_Page(Base_Page):
     @allure.step("Select Claim Type: {claim_type}")
     def select_claim_type(self, claim_type):
         logger.info(f"Selecting Claim Type: {claim_type}")
-        self.click(self.claim_type)
-        option = (By.XPATH, self.claim_type_dropdown[1].format(claim_type))
-        self.click(option)
+        OXD_Dropdown(self.driver, self.claim_type, name="claim_type").select(claim_type)
+
+    # EXPENSE TYPE SELECTION (add expense dialog)
+    @allure.step("Select Expense Type: {expense_type}")
+    def select_expense_type(self, expense_type):
+        logger.info(f"Selecting Expense Type: {expense_type}")
+        # Own cache name: the expense types are a different list than the claim events
+        OXD_Dropdown(self.driver, self.expense_type, name="expense_type").select(expense_type)
 
     # CURRENCY TYPE SELECTION
     @allure.step("Select Currency Type: {currency_type}")
     def select_currency_type(self, currency_type):
         logger.info(f"Selecting Currency Type: {currency_type}")
-        self.click(self.currency_type)
-        option = (By.XPATH, self.currency_type_dropdown[1].format(currency_type))
-        self.click(option)
+        # ~150 currencies → labels are read once per session and cached
+        OXD_Dropdown(self.driver, self.currency_type, name="currency").select(currency_type)
 
     # REMARKS / REASON
     @allure.step("Enter Remarks: {reason}")
@@ -149,6 +150,24 @@ class Claim_Page(Base_Page):
         logger.info(f"Entering notes: {reason}")
         self.send_keys(self.notes, reason)
 
+    # EXPENSE DETAILS
+    @allure.step("Filling expense details: {date}, {amount}")
+    def fill_expense_details(self, date, amount, notes, bulk=False):
+        """
+        Fills Date, Amount & Notes of the expense dialog.
+        bulk=True → one script call (Base_Page.bulk_fill) instead of typing each field
+        """
+        if bulk:
+            self.bulk_fill({
+                self.select_date: date,
+                self.amount_input: amount,
+                self.notes: notes,
+            })
+            return
+        self.select_claim_date(date)
+        self.enter_amount(amount)
+        self.enter_notes(notes)
+
     # CLAIM HISTORY
     @allure.step("Navigate to Claim History")
     def navigate_to_claim_history(self):
@@ -1,13 +1,35 @@
 import logging
-from selenium.webdriver.support.ui import WebDriverWait
 from pages.base_page import Base_Page
 from locators.locators import DashBoardPageLocators
+from utility import query_cache
+from utility.query_cache import cached_query
 import allure
 
 # Create a logger for this module
 logger = logging.getLogger(__name__)
 
+# Label → href of every main menu entry in a single round-trip
+MENU_SNAPSHOT_SCRIPT = """
+var menu = {};
+document.querySelectorAll('ul.oxd-main-menu li a').forEach(function (a) {
+    var label = a.textContent.trim();
+    if (label) { menu[label] = a.href; }
+});
+return menu;
+"""
+
 class Dashboard_Page(Base_Page):
+    # label → href of the main menu, read once per driver session (pages/page_factory.py)
+    __slots__ = ("_menu_snapshot",)
+
+    # ------------------------- LOCATORS ------------------------------------
+    profile_icon = DashBoardPageLocators.PROFILE_ICON
+    logout_button = DashBoardPageLocators.LOGOUT_BUTTON
+    dashboard_locator = DashBoardPageLocators.DASHBOARD_LOCATOR
+    menu_items_tab = DashBoardPageLocators.MENU_ITEMS_TAB
+    required_menu_items = DashBoardPageLocators.REQUIRED_MENU_ITEMS
+    menu_text_span = DashBoardPageLocators.MENU_TEXT_SPAN
+
     def __init__(self,driver):
         """
         Page Object Model (POM) class for the OrangeHRM Dashboard Page.
@@ -17,24 +39,11 @@ class Dashboard_Page(Base_Page):
             • Reusable utility methods to interact with dashboard elements
             • Assertions/validations for dashboard-specific features
         """
-
-        # Store driver instance
-        self.driver=driver
-        # WebDriverWait to use throughout the class (default 30 sec)
-        self.wait = WebDriverWait(self.driver, 30)
         super().__init__(driver)
-
-        # ------------------------- LOCATORS ------------------------------------
-        self.profile_icon = DashBoardPageLocators.PROFILE_ICON
-        self.logout_button = DashBoardPageLocators.LOGOUT_BUTTON
-        self.dashboard_locator = DashBoardPageLocators.DASHBOARD_LOCATOR
-        self.menu_items_tab=DashBoardPageLocators.MENU_ITEMS_TAB
-        self.required_menu_items=DashBoardPageLocators.REQUIRED_MENU_ITEMS
-        self.menu_text_span=DashBoardPageLocators.MENU_TEXT_SPAN
+        self._menu_snapshot = None
 
         logger.info("Dashboard_Page initialized successfully.")
 
-
     # LOGOUT FUNCTIONALITY
     @allure.step("Performing logout action from dashboard")
     def perform_logout(self):
@@ -48,12 +57,15 @@ class Dashboard_Page(Base_Page):
         try:
             self.click(self.profile_icon)
             self.click(self.logout_button)
+            # The next user may see a different menu
+            self._menu_snapshot = None
             logger.info("Logout successful.")
             return True
         except:
             return False
 
     # DASHBOARD STATUS CHECK
+    @cached_query
     @allure.step("Checking if dashboard is loaded")
     def is_dashboard_loaded(self):
         """
@@ -97,3 +109,16 @@ class Dashboard_Page(Base_Page):
         logger.info(f"Total extracted menu items: {len(menu_dict)}")
         return menu_dict
 
+    # MENU SNAPSHOT
+    @allure.step("Reading main menu labels and links")
+    def menu_snapshot(self, refresh=False):
+        """
+        Returns {label: href} of the left navigation menu, read with ONE script
+        call and cached on the page object until logout (or refresh=True).
+        """
+        if self._menu_snapshot is None or refresh:
+            self.is_visible(self.menu_items_tab)
+            with query_cache.read_only(self.driver):
+                self._menu_snapshot = self.driver.execute_script(MENU_SNAPSHOT_SCRIPT)
+            logger.info(f"Menu snapshot: {len(self._menu_snapshot)} items")
+        return self._menu_snapshot
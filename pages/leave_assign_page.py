@@ -1,16 +1,45 @@
 import allure
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from locators.locators import LeaveAssignPageLocators
 from pages.base_page import Base_Page
+from pages.oxd_dropdown import OXD_Dropdown
 import logging
 
 # Create a logger for this module
 logger = logging.getLogger(__name__)
 
 class Leave_Assign_Page(Base_Page):
+    __slots__ = ()
+
+    # --------------------------- Locators --------------------------------------------
+    leave_menu = LeaveAssignPageLocators.LEAVE_MENU
+    assign_leave = LeaveAssignPageLocators.ASSIGN_LEAVE
+
+    employee_name = LeaveAssignPageLocators.EMPLOYEE_NAME
+    employee_dropdown_list = LeaveAssignPageLocators.EMPLOYEE_DROPDOWN_LIST
+
+    leave_type_dropdown = LeaveAssignPageLocators.LEAVE_TYPE_DROPDOWN
+    leave_type_options = LeaveAssignPageLocators.LEAVE_TYPE_OPTIONS
+
+    from_date_input = LeaveAssignPageLocators.FROM_DATE_INPUT
+    to_date_input = LeaveAssignPageLocators.TO_DATE_INPUT
+
+    comments = LeaveAssignPageLocators.COMMENTS
+    assign_btn = LeaveAssignPageLocators.ASSIGN_BUTTON
+
+    confirm_leave = LeaveAssignPageLocators.CONFIRM_LEAVE
+    success_msg = LeaveAssignPageLocators.SUCCESS_MSG
+
+    leave_list = LeaveAssignPageLocators.LEAVE_LIST
+    search_button = LeaveAssignPageLocators.SEARCH_BUTTON
+    search_result_message = LeaveAssignPageLocators.SEARCH_RESULT_MESSAGE
+    search_result_text = LeaveAssignPageLocators.SEARCH_RESULT
+    records_found = LeaveAssignPageLocators.RECORDS_FOUND
+    table_loader = LeaveAssignPageLocators.TABLE_LOADER
+
     def __init__(self,driver):
         """
         Page Object Model for Assign Leave Page.
@@ -19,36 +48,8 @@ class Leave_Assign_Page(Base_Page):
             - Actions to interact with page
             - Assertions & validation helpers
         """
-        # Store driver instance
-        self.driver=driver
-        # WebDriverWait to use throughout the class (default 30 sec)
-        self.wait = WebDriverWait(self.driver, 30)
         super().__init__(driver)
 
-        # --------------------------- Locators --------------------------------------------
-        self.leave_menu = LeaveAssignPageLocators.LEAVE_MENU
-        self.assign_leave = LeaveAssignPageLocators.ASSIGN_LEAVE
-
-        self.employee_name = LeaveAssignPageLocators.EMPLOYEE_NAME
-        self.employee_dropdown_list = LeaveAssignPageLocators.EMPLOYEE_DROPDOWN_LIST
-
-        self.leave_type_dropdown = LeaveAssignPageLocators.LEAVE_TYPE_DROPDOWN
-        self.leave_type_options = LeaveAssignPageLocators.LEAVE_TYPE_OPTIONS
-
-        self.from_date_input = LeaveAssignPageLocators.FROM_DATE_INPUT
-        self.to_date_input = LeaveAssignPageLocators.TO_DATE_INPUT
-
-        self.comments = LeaveAssignPageLocators.COMMENTS
-        self.assign_btn = LeaveAssignPageLocators.ASSIGN_BUTTON
-
-        self.confirm_leave=LeaveAssignPageLocators.CONFIRM_LEAVE
-        self.success_msg = LeaveAssignPageLocators.SUCCESS_MSG
-
-        self.leave_list=LeaveAssignPageLocators.LEAVE_LIST
-        self.search_button=LeaveAssignPageLocators.SEARCH_BUTTON
-        self.search_result_message=LeaveAssignPageLocators.SEARCH_RESULT_MESSAGE
-        self.search_result=LeaveAssignPageLocators.SEARCH_RESULT
-
     # MENU ACTIONS
     @allure.step("Click on Leave menu")
     def click_leave_menu(self):
@@ -82,20 +83,9 @@ class Leave_Assign_Page(Base_Page):
     @allure.step("Selecting leave type: {leave_type}")
     def select_leave_type(self, leave_type):
         logger.info(f"Selecting leave type: {leave_type}")
-        # Open dropdown
-        dropdown = self.wait_until_clickable(self.leave_type_dropdown)
-        dropdown.click()
-
-        # locator for option
-        option_locator = (By.XPATH, self.leave_type_options.format(leave_type))
-
-        # Wait for an option to appear
-        target = self.is_visible(option_locator)
-
-        # Scroll and click using Actions
-        actions = ActionChains(self.driver)
-        logger.info(f"Clicking on leave type option: {leave_type}")
-        actions.scroll_to_element(target).pause(0.3).click(target).perform()
+        # Open dropdown, read options once (cached) & click leave type
+        OXD_Dropdown(self.driver, self.leave_type_dropdown, name="leave_type").select(leave_type)
+        logger.info(f"Leave type selected: {leave_type}")
 
     # DATE INPUT
     @allure.step("Selecting From Date: {date}")
@@ -108,6 +98,23 @@ class Leave_Assign_Page(Base_Page):
         logger.info(f"Entering To Date: {date}")
         self.type(self.to_date_input, date)
 
+    @allure.step("Filling leave details: {from_date} → {to_date}")
+    def fill_leave_details(self, from_date, to_date, comments, bulk=False):
+        """
+        Fills From Date, To Date & Comments.
+        bulk=True → one script call (Base_Page.bulk_fill) instead of typing each field
+        """
+        if bulk:
+            self.bulk_fill({
+                self.from_date_input: from_date,
+                self.to_date_input: to_date,
+                self.comments: comments,
+            })
+            return
+        self.select_from_date(from_date)
+        self.select_to_date(to_date)
+        self.enter_comments(comments)
+
     # COMMENTS
     @allure.step("Entering comments: {text}")
     def enter_comments(self, text):
@@ -151,10 +158,28 @@ class Leave_Assign_Page(Base_Page):
         element = self.is_visible(self.search_button)
         self.action_click(element)
 
+    @allure.step("Searching Leave List: {from_date} → {to_date}")
+    def search_leave_list(self, from_date, to_date):
+        """
+        Searches the Leave List for a date range and waits until the result table
+        has loaded. Returns the records text, e.g. '(12) Records Found'.
+        """
+        logger.info(f"Searching Leave List from {from_date} to {to_date}")
+        self.bulk_fill({self.from_date_input: from_date, self.to_date_input: to_date})
+        self.click_search_button()
+        # The table loader shows up shortly after the click → wait for it to come and go
+        try:
+            WebDriverWait(self.driver, 2).until(EC.visibility_of_element_located(self.table_loader))
+        except TimeoutException:
+            pass
+        self.wait.until(EC.invisibility_of_element_located(self.table_loader))
+        records = self.is_visible(self.records_found)
+        return records.text if records else None
+
     @allure.step("Get full search result")
     def search_result(self):
         logger.info("Fetching search result text")
-        result = self.is_visible(self.search_result)
+        result = self.is_visible(self.search_result_text)
         return result.text
 
     @allure.step("Get search result message")
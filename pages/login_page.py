@@ -9,7 +9,53 @@ import allure
 # Create a logger for this module
 logger = logging.getLogger(__name__)
 
+# Reads the login outcome in one call (no implicit/explicit wait):
+# "Success" on the dashboard, the visible error text, or null while pending
+LOGIN_RESULT_SCRIPT = """
+function visible(xpath) {
+    var node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return node && node.offsetParent !== null ? node : null;
+}
+if (location.href.toLowerCase().indexOf('dashboard') !== -1 && visible(arguments[0])) {
+    return 'Success';
+}
+for (var i = 0; i < arguments[1].length; i++) {
+    var error = visible(arguments[1][i]);
+    if (error) { return error.textContent.trim(); }
+}
+return null;
+"""
+
+# Clicks the element after the script has returned, so the command does not wait
+# for the login request: arguments[0] / [1] → by, value of the button
+DEFERRED_CLICK_SCRIPT = """
+var by = arguments[0], value = arguments[1];
+var el = by === 'xpath'
+    ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(value);
+if (!el) { return false; }
+setTimeout(function () { el.click(); }, 0);
+return true;
+"""
+
 class Login_Page(Base_Page):
+    __slots__ = ()
+
+    # -------------------- Locate Elements --------------------
+    # Username,Password & login button locator locator
+    username_input = LoginPageLocators.USERNAME_INPUT
+    password_input = LoginPageLocators.PASSWORD_INPUT
+    login_button = LoginPageLocators.LOGIN_BUTTON
+
+    # Dashboard & error msg locator
+    error_message = LoginPageLocators.ERROR_MESSAGES
+    dashboard_locator = DashBoardPageLocators.DASHBOARD_LOCATOR
+
+    forgot_password = LoginPageLocators.FORGOT_PASSWORD
+    forgot_username = LoginPageLocators.FORGOT_USERNAME
+    reset_password_button = LoginPageLocators.RESET_PASSWORD_BUTTON
+    reset_success_message = LoginPageLocators.RESET_SUCCESS_MESSAGE
+
     def __init__(self,driver):
         """
         Page Object Model class for the Login Page.
@@ -19,31 +65,11 @@ class Login_Page(Base_Page):
         - Login validations
         - Forgot password flow
         """
-        self.driver=driver
-        # WebDriverWait to use throughout the class (default 30 sec)
-        self.wait = WebDriverWait(self.driver, 30)
         # Call Base Class constructor
         super().__init__(driver)
 
-        # -------------------- Locate Elements --------------------
-        # Username,Password & login button locator locator
-        self.username_input = LoginPageLocators.USERNAME_INPUT
-        self.password_input = LoginPageLocators.PASSWORD_INPUT
-        self.login_button = LoginPageLocators.LOGIN_BUTTON
-
-        # Dashboard & error msg locator
-        self.error_message = LoginPageLocators.ERROR_MESSAGES
-        self.dashboard_locator = DashBoardPageLocators.DASHBOARD_LOCATOR
-
-        self.forgot_password=LoginPageLocators.FORGOT_PASSWORD
-        self.forgot_username=LoginPageLocators.FORGOT_USERNAME
-        self.reset_password_button=LoginPageLocators.RESET_PASSWORD_BUTTON
-        self.reset_success_message=LoginPageLocators.RESET_SUCCESS_MESSAGE
-
         logger.info("Login_Page POM initialized successfully.")
 
-
-
     # ---------------------- BASIC PAGE ACTIONS ----------------------
 
     @allure.step("Opening URL page: {url}")
@@ -98,6 +124,19 @@ class Login_Page(Base_Page):
             return False
         return True
 
+    @allure.step("Submitting login without waiting for it: {username}")
+    def submit_login_async(self, username, password):
+        """
+        Fills both fields with one script and clicks login after the call has
+        returned, so several tabs / contexts can have their logins in flight at
+        the same time. Read the outcome with wait_for_login_result().
+        """
+        logger.info(f"Submitting login for {username} (not waiting for the result)")
+        self.bulk_fill({self.username_input: username, self.password_input: password})
+        by, value = self.resolve(self.login_button)
+        if not self.driver.execute_script(DEFERRED_CLICK_SCRIPT, by, value):
+            self.click(self.login_button)
+
     # ---------------------- LOGIN STATUS VALIDATION ----------------------
     def get_login_status(self):
         """
@@ -131,6 +170,25 @@ class Login_Page(Base_Page):
         logger.error("Login failed: Unknown error")
         return "Failed: Unknown error"
 
+    def wait_for_login_result(self, timeout=30):
+        """
+        Polls the login outcome without per-locator timeouts.
+        Returns:
+        - "Success"       - Dashboard loaded
+        - error message   - Login failed
+        - "Failed: Unknown error" when nothing shows up within `timeout`
+        """
+        logger.info("Waiting for login result...")
+        error_xpaths = [locator[1] for locator in self.error_message.values()]
+        try:
+            status = WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.execute_script(LOGIN_RESULT_SCRIPT, self.dashboard_locator[1], error_xpaths))
+        except TimeoutException:
+            logger.error("Login failed: Unknown error")
+            return "Failed: Unknown error"
+        logger.info(f"Login result → {status}")
+        return status
+
     # ---------------------- FORGOT PASSWORD FLOW -------------------------
     @allure.step("Clicking Forgot Password link")
     def forgot_password_link(self):
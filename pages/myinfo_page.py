@@ -1,6 +1,5 @@
 import allure
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
 from webdriver_manager.core import driver
 from locators.locators import MyInfoPageLocators
 from pages.base_page import Base_Page
@@ -11,6 +10,13 @@ from utility.config_reader import get_config
 logger = logging.getLogger(__name__)
 
 class MyInfo_Page(Base_Page):
+    __slots__ = ()
+
+    # ------------------------- LOCATORS ------------------------------------
+    my_info_tab = MyInfoPageLocators.MY_INFO_TAB
+    my_info_menu = MyInfoPageLocators.MY_INFO_MENU
+    my_info_menu_text = MyInfoPageLocators.MY_INFO_MENU_TEXT
+    my_info_items = MyInfoPageLocators.MYINFO_ITEMS
 
     def __init__(self,driver):
         """
@@ -21,18 +27,8 @@ class MyInfo_Page(Base_Page):
             - Contains reusable functions to interact with My Info sidebar
             - Performs validations on UI elements for My Info submodules
         """
-        # Store driver instance
-        self.driver=driver
-        # WebDriverWait to use throughout the class (default 30 sec)
-        self.wait = WebDriverWait(self.driver, 30)
         super().__init__(driver)
 
-        # ------------------------- LOCATORS ------------------------------------
-        self.my_info_tab = MyInfoPageLocators.MY_INFO_TAB
-        self.my_info_menu=MyInfoPageLocators.MY_INFO_MENU
-        self.my_info_menu_text=MyInfoPageLocators.MY_INFO_MENU_TEXT
-        self.my_info_items = MyInfoPageLocators.MYINFO_ITEMS
-
         logger.info("MyInfo_Page initialized successfully.")
 
     # FETCH ALL MY INFO SECTION MENU ITEMS
@@ -0,0 +1,137 @@
+import logging
+import allure
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from locators.locators import DropdownLocators
+from pages.base_page import Base_Page
+from utility import query_cache
+
+# Create a logger for this module
+logger = logging.getLogger(__name__)
+
+# Reads every option label of the open listbox in a single round-trip
+READ_LABELS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0]))
+            .map(function (opt) { return opt.textContent.trim(); });
+"""
+
+# Returns the option at the cached index only if its label still matches,
+# so a stale cache entry is detected without an extra round-trip
+OPTION_AT_INDEX_SCRIPT = """
+var opts = document.querySelectorAll(arguments[0]);
+var opt = opts[arguments[1]];
+if (opt && opt.textContent.trim().toLowerCase() === arguments[2]) {
+    opt.scrollIntoView({block: 'nearest'});
+    return opt;
+}
+return null;
+"""
+
+
+class OXD_Dropdown(Base_Page):
+    """
+    Reusable component for OrangeHRM (OXD) select dropdowns.
+
+    Flow:
+        - Open the dropdown
+        - Read all option labels with ONE script call
+        - Build a label → index map, cached per dropdown for the whole session
+        - Select the option by direct click or by keyboard (ARROW_DOWN + ENTER)
+
+    The cache is keyed by the dropdown name, so the ~150 entry currency list
+    is only scanned once per session instead of once per option.
+    """
+
+    __slots__ = ("dropdown_locator", "name")
+
+    # label → index maps shared by every instance, keyed by dropdown name
+    _option_index_cache = {}
+
+    listbox = DropdownLocators.LISTBOX
+    option_css = DropdownLocators.OPTION_CSS
+
+    def __init__(self, driver, dropdown_locator, name=None):
+        super().__init__(driver)
+        self.dropdown_locator = dropdown_locator
+        self.name = name or str(dropdown_locator)
+
+    # OPEN DROPDOWN
+    def open(self):
+        """Click the select box and wait for its listbox to render."""
+        logger.info(f"Opening dropdown: {self.name}")
+        self.click(self.dropdown_locator)
+        try:
+            self.wait.until(EC.visibility_of_element_located(self.listbox))
+        except TimeoutException:
+            raise Exception(f"Dropdown '{self.name}' options did not load!")
+
+    # READ OPTIONS
+    def read_labels(self):
+        """Returns all option labels of the open listbox (one WebDriver call)."""
+        with query_cache.read_only(self.driver):
+            labels = self.driver.execute_script(READ_LABELS_SCRIPT, self.option_css)
+        logger.info(f"Dropdown '{self.name}' has {len(labels)} options")
+        return labels
+
+    def build_index(self):
+        """Reads the labels and (re)builds the cached label → index map."""
+        index_map = {}
+        for index, label in enumerate(self.read_labels()):
+            # Keep the first occurrence of duplicated labels
+            index_map.setdefault(label.lower(), index)
+        OXD_Dropdown._option_index_cache[self.name] = index_map
+        return index_map
+
+    @classmethod
+    def clear_cache(cls, name=None):
+        """Drops the cached map of one dropdown, or of all dropdowns."""
+        if name is None:
+            cls._option_index_cache.clear()
+        else:
+            cls._option_index_cache.pop(name, None)
+
+    # SELECT OPTION
+    def select(self, label, by_keyboard=False):
+        """
+        Opens the dropdown and selects the option whose text equals `label`
+        (case-insensitive).
+        by_keyboard=False → pointer click on the option element
+        by_keyboard=True  → ARROW_DOWN up to `index` + ENTER in one action chain
+        """
+        with allure.step(f"Selecting '{label}' from dropdown → {self.name}"):
+            logger.info(f"Selecting '{label}' from dropdown: {self.name}")
+            self.open()
+            expected = label.strip().lower()
+
+            # Try the cached index first, rebuild once if the list changed
+            index_map = OXD_Dropdown._option_index_cache.get(self.name)
+            fresh = index_map is None
+            if fresh:
+                index_map = self.build_index()
+
+            option, index = None, None
+            while True:
+                index = index_map.get(expected)
+                if index is not None:
+                    option = self.driver.execute_script(
+                        OPTION_AT_INDEX_SCRIPT, self.option_css, index, expected)
+                if option is not None or fresh:
+                    break
+                logger.info(f"Cached options of '{self.name}' are stale, re-reading")
+                index_map, fresh = self.build_index(), True
+
+            if option is None:
+                raise Exception(f"'{label}' not found in dropdown '{self.name}' options")
+
+            actions = ActionChains(self.driver)
+            if by_keyboard:
+                # Focus stays on the select box after open() and nothing is
+                # highlighted yet, so index 0 needs one ARROW_DOWN
+                actions.send_keys(Keys.ARROW_DOWN * (index + 1) + Keys.ENTER).perform()
+            else:
+                actions.move_to_element(option).click().perform()
+
+            logger.info(f"Selected '{label}' (index {index}) from dropdown: {self.name}")
+            return True
@@ -0,0 +1,79 @@
+import logging
+from pages.base_page import Base_Page
+from pages.login_page import Login_Page
+from pages.dashboard_page import Dashboard_Page
+from pages.admin_page import Admin_Page
+from pages.myinfo_page import MyInfo_Page
+from pages.leave_assign_page import Leave_Assign_Page
+from pages.claim_page import Claim_Page
+
+"""
+page_factory.py
+
+Page objects of one WebDriver, each created lazily on first use and then
+reused for as long as the driver lives:
+    - no WebDriverWait / locator set-up per test step or per flow iteration
+    - cached page state (e.g. Dashboard_Page.menu_snapshot) survives between tests
+      of the same browser session
+    - the Pages object is kept on the driver itself, so a quit driver's pages go with it
+
+Example:
+    pages = Pages.of(driver)
+    pages.login.enter_username("Admin")
+    pages.dashboard.perform_logout()
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# attribute name → page class
+PAGE_CLASSES = {
+    "base": Base_Page,
+    "login": Login_Page,
+    "dashboard": Dashboard_Page,
+    "admin": Admin_Page,
+    "myinfo": MyInfo_Page,
+    "leave": Leave_Assign_Page,
+    "claim": Claim_Page,
+}
+
+
+class Pages:
+    """Lazy per-driver singletons of the page objects (one Pages per driver)."""
+
+    __slots__ = ("driver", "_pages")
+
+    # Attribute of the driver that holds its Pages
+    DRIVER_ATTRIBUTE = "_page_factory"
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._pages = {}
+
+    @classmethod
+    def of(cls, driver):
+        """The Pages of `driver`, created on first use."""
+        pages = getattr(driver, cls.DRIVER_ATTRIBUTE, None)
+        if pages is None:
+            pages = cls(driver)
+            setattr(driver, cls.DRIVER_ATTRIBUTE, pages)
+        return pages
+
+    def get(self, page_class):
+        """The instance of `page_class` bound to this driver (created once)."""
+        page = self._pages.get(page_class)
+        if page is None:
+            logger.info(f"Creating {page_class.__name__} for driver session {getattr(self.driver, 'session_id', '-')}")
+            page = self._pages[page_class] = page_class(self.driver)
+        return page
+
+    def __getattr__(self, name):
+        try:
+            page_class = PAGE_CLASSES[name]
+        except KeyError:
+            raise AttributeError(f"No page '{name}', known pages: {', '.join(PAGE_CLASSES)}") from None
+        return self.get(page_class)
+
+    def reset(self):
+        """Drops the page objects (and their cached state), e.g. after logging in as another user."""
+        self._pages.clear()
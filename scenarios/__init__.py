@@ -0,0 +1,8 @@
+"""
+scenarios
+
+Load scenarios built on the page objects of pages/. Each scenario module has
+a data generator and a flow function `flow(driver, work_items, metrics)` that
+one browser session runs; scenarios/runner.py runs the flow in several
+parallel sessions and collects the metrics (utility/load_metrics.py).
+"""
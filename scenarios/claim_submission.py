@@ -0,0 +1,99 @@
+import csv
+import logging
+from collections import OrderedDict
+from utility.config_reader import get_config
+from pages.page_factory import Pages
+from scenarios.runner import login
+
+"""
+claim_submission.py
+
+Multi-expense claim submission through Claim_Page, driven by a table
+([Load_Claim] data, testdata/claim_expenses.csv): one row per expense line,
+rows with the same claim_id form one claim. Every session logs in as its
+own ESS employee (data pool) and submits its share of the claims.
+Timed steps: create_claim, add_expense, loader_wait, submit_claim and
+claim_history_read (tagged with the number of claims submitted so far).
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+
+def load_claims(path):
+    """Reads the expense table → [{"claim_type", "currency", "expenses": [{...}, ...]}, ...]."""
+    claims = OrderedDict()
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            claim = claims.setdefault(row["claim_id"], {
+                "claim_id": row["claim_id"], "claim_type": row["claim_type"],
+                "currency": row["currency"], "expenses": []})
+            claim["expenses"].append({"expense_type": row["expense_type"], "date": row["date"],
+                                      "amount": row["amount"], "notes": row["notes"]})
+    return list(claims.values())
+
+
+def claim_specs(claims, data_pool, sessions, repeat=1):
+    """
+    Assigns the claims (`repeat` times) to `sessions` ESS employees. Claim i goes
+    to employee i % sessions, which matches the round-robin split of the runner,
+    so every session only submits claims of the employee it is logged in as.
+    """
+    users = [data_pool.lease_ess_user() for _ in range(max(1, sessions))]
+    work = [claim for _ in range(max(1, repeat)) for claim in claims]
+    return [dict(claim, user=users[index % len(users)]) for index, claim in enumerate(work)]
+
+
+def submit_claims(driver, specs, metrics):
+    """Flow of one browser session: logs in as the claims' employee and submits every claim of `specs`."""
+    pages = Pages.of(driver)
+    basepage = pages.base
+    claimpage = pages.claim
+    submit_url = get_config("Load_Claim", "submit_url")
+    expected_msg = get_config("claim", "success_message")
+    remarks = get_config("claim", "reason")
+
+    def expect_success(action):
+        message = claimpage.get_success_message()
+        if not message or expected_msg not in message:
+            raise AssertionError(f"{action} failed: {message}")
+
+    username, password = specs[0]["user"]
+    with metrics.step("login"):
+        login(driver, username, password)
+
+    for claim in specs:
+        with metrics.iteration():
+            with metrics.step("create_claim"):
+                driver.get(submit_url)
+                basepage.wait_for_url(submit_url)
+                claimpage.select_claim_type(claim["claim_type"])
+                claimpage.select_currency_type(claim["currency"])
+                claimpage.enter_remarks(remarks)
+                claimpage.create_submit_claim()
+                expect_success(f"Claim {claim['claim_id']} creation")
+
+            for expense in claim["expenses"]:
+                with metrics.step("add_expense"):
+                    claimpage.add_expense()
+                    claimpage.select_expense_type(expense["expense_type"])
+                    claimpage.fill_expense_details(expense["date"], expense["amount"], expense["notes"], bulk=True)
+                with metrics.step("loader_wait"):
+                    claimpage.wait_for_no_loader()
+                with metrics.step("save_expense"):
+                    claimpage.save_claim()
+                    expect_success(f"Expense '{expense['notes']}'")
+
+            with metrics.step("loader_wait"):
+                claimpage.wait_for_no_loader()
+            with metrics.step("submit_claim"):
+                claimpage.click_submit_claim()
+                expect_success(f"Claim {claim['claim_id']} submission")
+
+            # volume = claims submitted so far by all sessions
+            with metrics.step("claim_history_read", volume=metrics.completed):
+                claimpage.navigate_to_claim_history()
+                found = claimpage.verify_claim_in_history(claim["claim_type"], claim["currency"])
+            if not found:
+                raise AssertionError(f"Claim {claim['claim_id']} not found in claim history")
+            logger.info(f"Submitted claim {claim['claim_id']} with {len(claim['expenses'])} expenses as {username}")
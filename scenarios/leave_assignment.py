@@ -0,0 +1,94 @@
+import logging
+from utility.config_reader import get_config
+from pages.page_factory import Pages
+from scenarios.runner import login
+
+"""
+leave_assignment.py
+
+Leave assignment load through Leave_Assign_Page: many non-overlapping leaves
+over several employees and leave types ([Load_Leave] in config.ini).
+Every sample of assign_confirm and leave_list_search is tagged with the
+number of leaves assigned so far, to show how the leave module degrades as
+its history grows.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+
+def leave_specs(count, data_pool, employees=1):
+    """
+    Generates `count` leave assignments. Date ranges (1..max_days weekdays) come
+    from the data pool, so they never overlap with each other or earlier runs.
+    """
+    leave_types = [name.strip() for name in get_config("Load_Leave", "leave_types").split(",")]
+    max_days = int(get_config("Load_Leave", "max_days"))
+    employee_names = [data_pool.lease_employee() for _ in range(max(1, employees))]
+    specs = []
+    for index in range(count):
+        from_date, to_date = data_pool.lease_date_range(days=1 + index % max_days)
+        specs.append({
+            "employee": employee_names[index % len(employee_names)],
+            "leave_type": leave_types[index % len(leave_types)],
+            "from_date": from_date,
+            "to_date": to_date,
+            "comments": f"Load test leave {index + 1}",
+        })
+    return specs
+
+
+def assign_leaves(driver, specs, metrics, search_range, search_every=5, on_assigned=None):
+    """
+    Flow of one browser session: logs in as admin once, assigns every leave of
+    `specs` and searches the Leave List over `search_range` (from, to) after
+    every `search_every` assignments. `on_assigned(employee, from_date, to_date)`
+    is called for each assigned leave (e.g. DataPool.register_leave for the cleanup).
+    """
+    pages = Pages.of(driver)
+    basepage = pages.base
+    leave_page = pages.leave
+    assign_url = get_config("Load_Leave", "assign_url")
+    list_url = get_config("Load_Leave", "list_url")
+    expected_msg = get_config("Leave_Data", "success_message")
+
+    with metrics.step("login"):
+        login(driver, get_config("Data_Pool", "admin_username"), get_config("Data_Pool", "admin_password"))
+
+    for number, spec in enumerate(specs, start=1):
+        with metrics.iteration():
+            with metrics.step("open_assign_leave"):
+                driver.get(assign_url)
+                basepage.wait_for_url(assign_url)
+
+            with metrics.step("select_employee"):
+                leave_page.enter_employee_name(spec["employee"])
+
+            with metrics.step("select_leave_type"):
+                leave_page.select_leave_type(spec["leave_type"])
+
+            with metrics.step("fill_dates"):
+                leave_page.fill_leave_details(spec["from_date"], spec["to_date"], spec["comments"], bulk=True)
+
+            # volume = leaves assigned so far by all sessions
+            with metrics.step("assign_confirm", volume=metrics.completed):
+                leave_page.click_assign_button()
+                leave_page.click_confirm_leave()
+                message = leave_page.get_success_message()
+                if not message or expected_msg not in message:
+                    raise AssertionError(f"Leave {spec['from_date']} → {spec['to_date']} not assigned: {message}")
+            if on_assigned:
+                on_assigned(spec["employee"], spec["from_date"], spec["to_date"])
+            logger.info(f"Assigned {spec['leave_type']} {spec['from_date']} → {spec['to_date']} to {spec['employee']}")
+
+        if number % search_every == 0:
+            # Not an iteration: throughput counts assigned leaves only, a failed search is still an error
+            try:
+                driver.get(list_url)
+                basepage.wait_for_url(list_url)
+                with metrics.step("leave_list_search", volume=metrics.completed):
+                    records = leave_page.search_leave_list(*search_range)
+                logger.info(f"Leave List search after {metrics.completed} leaves: {records}")
+            except Exception as e:
+                metrics.fail(f"leave_list_search:{type(e).__name__}")
+                logger.error(f"Leave List search failed: {type(e).__name__}: {e}")
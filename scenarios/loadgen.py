@@ -0,0 +1,315 @@
+import os
+import sys
+import csv
+import time
+import random
+import logging
+import argparse
+import threading
+from collections import defaultdict
+from utility.config_reader import config, get_config, set_base_url
+from utility.driver_factory import create_driver
+from utility.hrm_api import HRMApiClient, base_url_from
+from utility.load_metrics import LoadMetrics, percentile
+from scenarios.runner import login, instrumentation_disabled
+from scenarios.user_creation import parse_mix
+from scenarios.virtual_users import FLOWS, credentials
+
+"""
+loadgen.py
+
+Load generator CLI: runs the page-object flows of scenarios/virtual_users.py
+as N virtual users instead of as tests.
+    - scenario mix  → each iteration picks a flow by weight ('login:1, browse_menu:2')
+    - ramp-up       → the users start one after another over --ramp-up seconds
+    - mode          → 'browser' (one headless WebDriver per user) or 'http'
+                      (HTTP-level replay of the same flows, no browser)
+Every --interval seconds a row with throughput, p50/p95/p99 latency and the
+error rate is printed and appended to the CSV; the step tables of every flow
+are printed at the end and written to Reports/load/loadgen_<flow>.json.
+
+Example (from the project root):
+    python -m scenarios.loadgen --users 20 --ramp-up 60 --duration 300 --mode http \
+        --mix "login:1, browse_menu:2, user_search:2, leave_list:1" --base-url http://localhost:8080
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+CSV_FIELDS = ["elapsed_s", "scenario", "active_users", "iterations", "errors", "error_rate",
+              "per_second", "p50_ms", "p95_ms", "p99_ms"]
+
+
+def parse_args(argv=None):
+    """Command line options, defaults from [Load_Generator] in config.ini."""
+    section = config["Load_Generator"]
+    parser = argparse.ArgumentParser(prog="python -m scenarios.loadgen",
+                                     description="Runs the page-object flows as virtual users.")
+    parser.add_argument("--mix", default=section["mix"],
+                        help=f"flow:weight list, flows: {', '.join(FLOWS)}")
+    parser.add_argument("--users", type=int, default=int(section["users"]), help="number of virtual users")
+    parser.add_argument("--ramp-up", type=float, default=float(section["ramp_up"]),
+                        help="seconds until all users are started")
+    parser.add_argument("--duration", type=float, default=float(section["duration"]),
+                        help="total run time in seconds (ramp-up included)")
+    parser.add_argument("--think-time", type=float, default=float(section["think_time"]),
+                        help="pause of a user between two iterations in seconds")
+    parser.add_argument("--mode", choices=("browser", "http"), default=section["mode"])
+    parser.add_argument("--interval", type=float, default=float(section["interval"]),
+                        help="seconds between two rows of the live table")
+    parser.add_argument("--browser", default=get_config("browser_name", "browser"))
+    parser.add_argument("--headed", action="store_true", help="show the browsers (browser mode)")
+    parser.add_argument("--base-url", help="OrangeHRM instance to load, e.g. http://localhost:8080")
+    parser.add_argument("--csv", default=section["csv"], help="CSV file of the interval rows")
+    parser.add_argument("--max-error-rate", type=float, default=float(section["max_error_rate"]),
+                        help="exit code 1 when the overall error rate is higher")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in parse_mix(args.mix) if name not in FLOWS]
+    if unknown:
+        parser.error(f"unknown flow(s) {sorted(set(unknown))}, choose from {', '.join(FLOWS)}")
+    if args.users < 1 or args.interval <= 0:
+        parser.error("--users must be >= 1 and --interval > 0")
+    return args
+
+
+class Timeline:
+    """Thread-safe list of finished iterations: (elapsed s, flow, ms, ok)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = []
+        self.started = time.perf_counter()
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def add(self, flow, elapsed_ms, ok):
+        with self.lock:
+            self.samples.append((self.elapsed(), flow, elapsed_ms, ok))
+
+    def between(self, start, end):
+        with self.lock:
+            return [sample for sample in self.samples if start <= sample[0] < end]
+
+
+def window_rows(samples, elapsed, seconds, active_users):
+    """One row per flow plus 'ALL' for the samples of a window of `seconds` length."""
+    by_flow = defaultdict(list)
+    for sample in samples:
+        by_flow[sample[1]].append(sample)
+        by_flow["ALL"].append(sample)
+    rows = []
+    for flow in ["ALL"] + sorted(name for name in by_flow if name != "ALL"):
+        flow_samples = by_flow.get(flow, [])
+        latencies = [ms for _, _, ms, ok in flow_samples if ok]
+        errors = sum(1 for sample in flow_samples if not sample[3])
+
+        def pct(value):
+            return round(percentile(latencies, value), 1) if latencies else ""
+        rows.append({
+            "elapsed_s": round(elapsed, 1),
+            "scenario": flow,
+            "active_users": active_users,
+            "iterations": len(flow_samples),
+            "errors": errors,
+            "error_rate": round(errors / len(flow_samples), 4) if flow_samples else 0.0,
+            "per_second": round(len(latencies) / seconds, 2) if seconds else 0.0,
+            "p50_ms": pct(50),
+            "p95_ms": pct(95),
+            "p99_ms": pct(99),
+        })
+    return rows
+
+
+def format_row(row):
+    def value(key, width):
+        return f"{row[key]:>{width}}" if row[key] != "" else f"{'-':>{width}}"
+    return (f"{row['elapsed_s']:>9} {row['scenario']:<12} {row['active_users']:>6} {row['iterations']:>6} "
+            f"{row['errors']:>6} {row['error_rate']:>8.1%} {row['per_second']:>8} "
+            f"{value('p50_ms', 9)} {value('p95_ms', 9)} {value('p99_ms', 9)}")
+
+
+TABLE_HEADER = (f"{'elapsed s':>9} {'flow':<12} {'users':>6} {'iters':>6} {'errors':>6} {'err %':>8} "
+                f"{'iter/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+
+
+class LoadGenerator:
+    """
+    Example:
+        generator = LoadGenerator({"login": 1, "browse_menu": 2}, users=10, ramp_up=30, duration=120, mode="http")
+        overall = generator.run()   # window row of the whole run
+    """
+
+    def __init__(self, mix, users, ramp_up, duration, mode="browser", think_time=1.0, interval=5.0,
+                 browser="chrome", headless=True, csv_path=None, out=sys.stdout):
+        self.mix = mix
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.mode = mode
+        self.think_time = think_time
+        self.interval = interval
+        self.browser = browser
+        self.headless = headless
+        self.csv_path = csv_path
+        self.out = out
+        # Step latencies per flow
+        self.metrics = {flow: LoadMetrics(f"loadgen_{flow}") for flow in set(mix)}
+        self.timeline = Timeline()
+        self.stop = threading.Event()
+        self.active = 0
+        self.active_lock = threading.Lock()
+
+    # SESSIONS
+    def open_session(self):
+        """Logged-in WebDriver (browser mode) or HRMApiClient (http mode)."""
+        if self.mode == "http":
+            return HRMApiClient(base_url_from(get_config("Login_Orange", "url")), *credentials()).login()
+        driver = create_driver(self.browser, headless=self.headless)
+        try:
+            driver.implicitly_wait(10)
+            login(driver, *credentials())
+        except Exception:
+            driver.quit()
+            raise
+        return driver
+
+    def close_session(self, session):
+        if self.mode == "browser":
+            session.quit()
+
+    # VIRTUAL USER
+    def virtual_user(self, index):
+        """Starts after its ramp-up delay, then runs weighted random flows until the run ends."""
+        if self.stop.wait(index * self.ramp_up / self.users):
+            return
+        picker = random.Random(index)
+        try:
+            session = self.open_session()
+        except Exception as e:
+            # Session start failure → one failed iteration, the user does not run
+            logger.error(f"Virtual user {index} could not start: {type(e).__name__}: {e}")
+            self.timeline.add("session", 0, ok=False)
+            return
+
+        with self.active_lock:
+            self.active += 1
+        try:
+            while not self.stop.is_set():
+                flow = picker.choice(self.mix)
+                metrics = self.metrics[flow]
+                if metrics.started is None:
+                    metrics.start()
+                run = FLOWS[flow][0 if self.mode == "browser" else 1]
+                start = time.perf_counter()
+                try:
+                    run(session, metrics)
+                except Exception as e:
+                    metrics.fail(type(e).__name__)
+                    self.timeline.add(flow, (time.perf_counter() - start) * 1000, ok=False)
+                    logger.error(f"Virtual user {index} {flow} failed: {type(e).__name__}: {e}")
+                else:
+                    metrics.complete()
+                    self.timeline.add(flow, (time.perf_counter() - start) * 1000, ok=True)
+                self.stop.wait(self.think_time)
+        finally:
+            with self.active_lock:
+                self.active -= 1
+            try:
+                self.close_session(session)
+            except Exception as e:
+                logger.warning(f"Virtual user {index} session close failed: {e}")
+
+    # REPORTING
+    def write_csv(self, rows):
+        if not self.csv_path:
+            return
+        new_file = not os.path.exists(self.csv_path)
+        with open(self.csv_path, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            if new_file:
+                writer.writeheader()
+            writer.writerows(rows)
+
+    def report_window(self, start, end):
+        """Prints the ALL row of the window and writes every row to the CSV."""
+        rows = window_rows(self.timeline.between(start, end), end, end - start, self.active)
+        print(format_row(rows[0]), file=self.out, flush=True)
+        self.write_csv(rows)
+        return rows
+
+    def run(self):
+        """Runs the load for `duration` seconds and returns the 'ALL' row of the whole run."""
+        if self.csv_path:
+            os.makedirs(os.path.dirname(self.csv_path) or ".", exist_ok=True)
+            if os.path.exists(self.csv_path):
+                os.remove(self.csv_path)
+        print(f"{self.users} {self.mode} users, ramp-up {self.ramp_up} s, duration {self.duration} s, "
+              f"target {base_url_from(get_config('Login_Orange', 'url'))}", file=self.out)
+        print(TABLE_HEADER, file=self.out, flush=True)
+
+        threads = [threading.Thread(target=self.virtual_user, args=(index,), name=f"vu{index}", daemon=True)
+                   for index in range(self.users)]
+        self.timeline = Timeline()
+        for thread in threads:
+            thread.start()
+
+        window_start = 0.0
+        try:
+            while window_start < self.duration:
+                window_end = min(window_start + self.interval, self.duration)
+                time.sleep(max(0.0, window_end - self.timeline.elapsed()))
+                self.report_window(window_start, window_end)
+                window_start = window_end
+        except KeyboardInterrupt:
+            print("Interrupted, stopping the virtual users...", file=self.out)
+        self.stop.set()
+        for thread in threads:
+            thread.join()
+
+        # Iterations that were still running when the run ended
+        end = self.timeline.elapsed()
+        if end > window_start:
+            self.report_window(window_start, end + 1e-6)
+        overall = window_rows(self.timeline.between(0, end + 1e-6), end, end, 0)
+        print("", file=self.out)
+        print(TABLE_HEADER, file=self.out)
+        for row in overall:
+            print(format_row(row), file=self.out)
+        for flow, metrics in sorted(self.metrics.items()):
+            metrics.stop()
+            if metrics.started is not None:
+                print("\n" + metrics.table(), file=self.out)
+                metrics.write()
+        if self.csv_path:
+            print(f"\nInterval rows written to {self.csv_path}", file=self.out)
+        return overall[0]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.base_url:
+        set_base_url(args.base_url)
+    os.makedirs("Reports/load", exist_ok=True)
+    file_handler = logging.FileHandler("Reports/load/loadgen.log")
+    file_handler.setFormatter(logging.Formatter(fmt='%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
+    logging.getLogger().addHandler(file_handler)
+    logging.getLogger().setLevel(logging.INFO)
+
+    generator = LoadGenerator(parse_mix(args.mix), users=args.users, ramp_up=args.ramp_up,
+                              duration=args.duration, mode=args.mode, think_time=args.think_time,
+                              interval=args.interval, browser=args.browser, headless=not args.headed,
+                              csv_path=args.csv)
+    # No perf capture / DOM snapshots: they would add their own time to the measured latencies
+    with instrumentation_disabled():
+        overall = generator.run()
+    if overall["iterations"] == 0 or overall["error_rate"] > args.max_error_rate:
+        print(f"\nFAILED: {overall['errors']} of {overall['iterations']} iterations failed "
+              f"(max error rate {args.max_error_rate:.1%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import logging
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from utility.config_reader import config, get_config
+from utility.driver_factory import create_driver
+from pages.page_factory import Pages
+
+"""
+runner.py
+
+Runs a scenario flow in N parallel browser sessions (one thread and one
+WebDriver per session) and shares the work items between them round-robin.
+Page performance capture and DOM snapshots are off while the sessions run.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# Per-navigation capture: it would measure pages under deliberate concurrency
+# against [Perf_Budgets] and add its own time to the step latencies
+INSTRUMENTATION_SECTIONS = ("Perf", "DOM_Snapshots")
+
+
+@contextmanager
+def instrumentation_disabled():
+    """Switches [Perf] and [DOM_Snapshots] off for the duration of a load run."""
+    previous = {section: config[section]["enabled"] for section in INSTRUMENTATION_SECTIONS
+                if config.has_option(section, "enabled")}
+    for section in previous:
+        config[section]["enabled"] = "false"
+    try:
+        yield
+    finally:
+        for section, enabled in previous.items():
+            config[section]["enabled"] = enabled
+
+
+def login(driver, username, password):
+    """Logs in through Login_Page and waits for the dashboard."""
+    loginpage = Pages.of(driver).login
+    loginpage.navigate_to_url(get_config("Login_Orange", "url"))
+    loginpage.enter_username(username)
+    loginpage.enter_password(password)
+    loginpage.click_login()
+    result = loginpage.wait_for_login_result()
+    if result != "Success":
+        raise AssertionError(f"Login as '{username}' failed: {result}")
+
+
+def split_work(work_items, sessions):
+    """Round-robin split of the work items over the sessions (empty sessions dropped)."""
+    chunks = [list(work_items[index::sessions]) for index in range(max(1, sessions))]
+    return [chunk for chunk in chunks if chunk]
+
+
+def run_sessions(flow, work_items, sessions, metrics, browser=None, headless=True):
+    """
+    Runs `flow(driver, chunk, metrics)` in `sessions` parallel browsers and
+    returns the metrics summary. A session that cannot start counts all of its
+    work items as failed.
+
+    Example:
+        metrics = LoadMetrics("user_creation")
+        run_sessions(user_creation.create_users, specs, sessions=4, metrics=metrics)
+    """
+    browser = browser or get_config("browser_name", "browser")
+    chunks = split_work(work_items, sessions)
+
+    def run_session(index, chunk):
+        driver = None
+        try:
+            driver = create_driver(browser, headless=headless)
+            driver.implicitly_wait(10)
+            logger.info(f"{metrics.name} session {index} started with {len(chunk)} work items")
+            flow(driver, chunk, metrics)
+        except Exception as e:
+            # Session level failure (browser start, login) → its remaining work is lost
+            logger.error(f"{metrics.name} session {index} aborted: {type(e).__name__}: {e}")
+            metrics.fail(f"session:{type(e).__name__}", count=len(chunk))
+        finally:
+            if driver:
+                driver.quit()
+
+    metrics.start()
+    with instrumentation_disabled(), ThreadPoolExecutor(max_workers=len(chunks) or 1) as executor:
+        list(executor.map(lambda args: run_session(*args), enumerate(chunks)))
+    metrics.stop()
+    logger.info(metrics.table())
+    return metrics.summary()
@@ -0,0 +1,94 @@
+import logging
+from utility.config_reader import get_config
+from pages.page_factory import Pages
+from scenarios.runner import login
+
+"""
+user_creation.py
+
+Bulk system-user creation through Admin_Page (Admin → Add User), with a mix
+of roles and statuses from [Load_User_Creation] in config.ini.
+Steps timed per user: open_add_user, select_role_status, select_employee,
+enter_credentials, save_confirm, back_to_list.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+
+def parse_mix(value):
+    """'ESS:3, Admin:1' → ['ESS', 'ESS', 'ESS', 'Admin'] (cycled over the users)."""
+    mix = []
+    for part in value.split(","):
+        name, _, weight = part.strip().partition(":")
+        mix.extend([name.strip()] * int(weight or 1))
+    return mix
+
+
+def user_specs(count, data_pool, employees=1):
+    """
+    Generates `count` users with unique usernames (data pool), spread over
+    `employees` leased employees and the configured role / status mix.
+    """
+    roles = parse_mix(get_config("Load_User_Creation", "role_mix"))
+    statuses = parse_mix(get_config("Load_User_Creation", "status_mix"))
+    employee_names = [data_pool.lease_employee() for _ in range(max(1, employees))]
+    password = get_config("Add_new_user", "new_password")
+    return [{
+        "username": data_pool.lease_username(),
+        "password": password,
+        "role": roles[index % len(roles)],
+        "status": statuses[index % len(statuses)],
+        "employee": employee_names[index % len(employee_names)],
+    } for index in range(count)]
+
+
+def create_users(driver, specs, metrics, on_created=None):
+    """
+    Flow of one browser session: logs in as admin once, then creates every
+    user of `specs`. `on_created(username)` is called for each saved user
+    (e.g. DataPool.register_user for the cleanup).
+    """
+    pages = Pages.of(driver)
+    basepage = pages.base
+    adminpage = pages.admin
+    admin_url = get_config("Add_new_user", "admin_url")
+    add_url = get_config("Add_new_user", "add_url")
+    expected_msg = get_config("Add_new_user", "success_message")
+
+    with metrics.step("login"):
+        login(driver, get_config("Data_Pool", "admin_username"), get_config("Data_Pool", "admin_password"))
+
+    for spec in specs:
+        with metrics.iteration():
+            # Back to the user list (first user, or after a failed one)
+            if basepage.get_current_url() != admin_url:
+                driver.get(admin_url)
+                basepage.wait_for_url(admin_url)
+
+            with metrics.step("open_add_user"):
+                adminpage.click_add_user()
+                basepage.wait_for_url(add_url)
+
+            with metrics.step("select_role_status"):
+                adminpage.select_role(spec["role"])
+                adminpage.select_status(spec["status"])
+
+            with metrics.step("select_employee"):
+                adminpage.select_employee_name(spec["employee"])
+
+            with metrics.step("enter_credentials"):
+                adminpage.new_user_details(spec["username"], spec["password"], bulk=True)
+
+            with metrics.step("save_confirm"):
+                adminpage.save_user()
+                message = adminpage.get_success_message()
+                if not message or expected_msg not in message:
+                    raise AssertionError(f"User {spec['username']} not saved: {message}")
+
+            if on_created:
+                on_created(spec["username"])
+            logger.info(f"Created {spec['role']} / {spec['status']} user {spec['username']}")
+
+            with metrics.step("back_to_list"):
+                basepage.wait_for_url(admin_url)
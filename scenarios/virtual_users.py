@@ -0,0 +1,127 @@
+import logging
+from datetime import date
+from utility.config_reader import config, get_config
+from utility.hrm_api import HRMApiError
+from pages.page_factory import Pages
+from scenarios.runner import login
+
+"""
+virtual_users.py
+
+Flows of the load generator (scenarios/loadgen.py). One call is one iteration
+of a virtual user that is already logged in; every flow exists twice:
+    - browser → drives the page objects in the user's WebDriver session
+    - http    → replays the same page loads and API calls with HRMApiClient
+                (no browser, so many more virtual users per machine)
+Steps are timed with LoadMetrics.step(); a failed check raises.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# REST calls the dashboard widgets make after the page load
+DASHBOARD_API = ("dashboard/shortcuts", "dashboard/employees/action-summary",
+                 "dashboard/employees/subunit", "dashboard/employees/locations")
+
+
+def credentials():
+    """Login of the virtual users ([Load_Generator] username / password)."""
+    return get_config("Load_Generator", "username"), get_config("Load_Generator", "password")
+
+
+def leave_year():
+    """Date range of the Leave List search: the current calendar year."""
+    year = date.today().year
+    return f"{year}-01-01", f"{year}-12-31"
+
+
+# LOGIN
+def browser_login(driver, metrics):
+    """Logs out through Dashboard_Page and logs in again through Login_Page."""
+    with metrics.step("logout"):
+        if not Pages.of(driver).dashboard.perform_logout():
+            raise AssertionError("Logout failed")
+    with metrics.step("login"):
+        login(driver, *credentials())
+
+
+def http_login(api, metrics):
+    """New session through the login form, then the dashboard page and its widget calls."""
+    with metrics.step("login"):
+        api.login()
+    with metrics.step("dashboard"):
+        api.page(get_config("Dashboard_Page", "url"))
+        for path in DASHBOARD_API:
+            api.get(path)
+
+
+# MENU BROWSING
+def browser_browse_menu(driver, metrics):
+    """Opens every [Menu_URLs] page and waits for its URL."""
+    basepage = Pages.of(driver).base
+    for name, url in config["Menu_URLs"].items():
+        with metrics.step(f"open_{name}"):
+            driver.get(url)
+            basepage.wait_for_url(url)
+
+
+def http_browse_menu(api, metrics):
+    """GETs every [Menu_URLs] page with the session."""
+    for name, url in config["Menu_URLs"].items():
+        with metrics.step(f"open_{name}"):
+            api.page(url)
+
+
+# USER SEARCH
+def browser_user_search(driver, metrics):
+    """Searches the virtual user's own account on Admin → Users."""
+    username = credentials()[0]
+    adminpage = Pages.of(driver).admin
+    with metrics.step("open_admin"):
+        driver.get(get_config("Menu_URLs", "admin"))
+        adminpage.wait_for_url(get_config("Menu_URLs", "admin"))
+    with metrics.step("search_user"):
+        adminpage.search_user(username)
+        if not adminpage.is_user_present_in_table(username):
+            raise AssertionError(f"User '{username}' not found")
+
+
+def http_user_search(api, metrics):
+    """Same search through the admin/users API."""
+    username = credentials()[0]
+    with metrics.step("open_admin"):
+        api.page(get_config("Menu_URLs", "admin"))
+    with metrics.step("search_user"):
+        users = api.get("admin/users", username=username, limit=50, offset=0)["data"]
+        if not any(user["userName"] == username for user in users):
+            raise HRMApiError(f"User '{username}' not found")
+
+
+# LEAVE LIST
+def browser_leave_list(driver, metrics):
+    """Leave List search over the current year through Leave_Assign_Page."""
+    leave_page = Pages.of(driver).leave
+    with metrics.step("open_leave_list"):
+        driver.get(get_config("Load_Leave", "list_url"))
+        leave_page.wait_for_url(get_config("Load_Leave", "list_url"))
+    with metrics.step("leave_list_search"):
+        leave_page.search_leave_list(*leave_year())
+
+
+def http_leave_list(api, metrics):
+    """Same search through the leave-requests API."""
+    from_date, to_date = leave_year()
+    with metrics.step("open_leave_list"):
+        api.page(get_config("Load_Leave", "list_url"))
+    with metrics.step("leave_list_search"):
+        api.get("leave/employees/leave-requests", limit=50, offset=0, fromDate=from_date, toDate=to_date,
+                includeEmployees="onlyCurrent")
+
+
+# name → (browser flow, http flow)
+FLOWS = {
+    "login": (browser_login, http_login),
+    "browse_menu": (browser_browse_menu, http_browse_menu),
+    "user_search": (browser_user_search, http_user_search),
+    "leave_list": (browser_leave_list, http_leave_list),
+}
@@ -0,0 +1,92 @@
+import json
+import os
+from utility.allure_compactor import compact, has_results_since, merge_containers, new_files, stale_results
+
+
+def write_json(folder, name, data):
+    with open(os.path.join(folder, name), "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def result(uuid, history_id, start, attachments=()):
+    return {"uuid": uuid, "historyId": history_id, "start": start, "stop": start + 10,
+            "attachments": [{"name": "log", "source": source, "type": "text/plain"} for source in attachments]}
+
+
+class Test_Stale_Results:
+
+    def test_current_run_replaces_earlier_runs(self):
+        results = {"old-result.json": result("1", "tc1", 1000), "new-result.json": result("2", "tc1", 5000),
+                   "other-result.json": result("3", "tc2", 1000)}
+        assert stale_results(results, run_started_ms=4000) == {"old-result.json"}
+
+    def test_newest_result_is_kept_without_run_start(self):
+        results = {"a-result.json": result("1", "tc1", 1000), "b-result.json": result("2", "tc1", 3000),
+                   "c-result.json": result("3", "tc1", 2000)}
+        assert stale_results(results) == {"a-result.json", "c-result.json"}
+
+
+class Test_Merge_Containers:
+
+    def test_empty_containers_are_dropped_and_duplicates_merged(self):
+        fixture = {"name": "setup", "befores": [{"name": "driver", "status": "passed"}]}
+        containers = {"a-container.json": dict(fixture, uuid="a", children=["1"], start=1, stop=2),
+                      "b-container.json": dict(fixture, uuid="b", children=["2"], start=3, stop=4),
+                      "c-container.json": dict(fixture, uuid="c", children=["gone"], start=5, stop=6)}
+        kept, empty, duplicates = merge_containers(containers, {"1", "2"})
+        assert empty == ["c-container.json"] and duplicates == ["b-container.json"]
+        assert kept["a-container.json"]["children"] == ["1", "2"]
+        assert kept["a-container.json"]["stop"] == 4
+
+
+class Test_Compact:
+
+    def test_compact_removes_old_runs_and_dedupes_attachments(self, tmp_path):
+        folder = str(tmp_path)
+        for name in ("a-attachment.txt", "b-attachment.txt", "orphan-attachment.txt"):
+            with open(os.path.join(folder, name), "w") as f:
+                f.write("same content")
+        write_json(folder, "old-result.json", result("1", "tc1", 1000, ["orphan-attachment.txt"]))
+        write_json(folder, "new-result.json", result("2", "tc1", 5000, ["a-attachment.txt"]))
+        write_json(folder, "other-result.json", result("3", "tc2", 5000, ["b-attachment.txt"]))
+        write_json(folder, "x-container.json", {"uuid": "x", "name": "setup", "children": ["1"]})
+
+        stats = compact(folder, run_started=4)
+        assert stats["results_removed"] == 1 and stats["containers_removed"] == 1
+        assert stats["attachments_deduplicated"] == 1
+        assert sorted(os.listdir(folder)) == ["a-attachment.txt", "new-result.json", "other-result.json"]
+        with open(os.path.join(folder, "other-result.json")) as f:
+            assert json.load(f)["attachments"][0]["source"] == "a-attachment.txt"
+
+    def test_dry_run_changes_nothing(self, tmp_path):
+        folder = str(tmp_path)
+        write_json(folder, "old-result.json", result("1", "tc1", 1000))
+        write_json(folder, "new-result.json", result("2", "tc1", 5000))
+        assert compact(folder, dry_run=True)["results_removed"] == 1
+        assert len(os.listdir(folder)) == 2
+
+
+class Test_New_Files:
+
+    def test_files_not_in_the_manifest(self, tmp_path):
+        folder = tmp_path / "results"
+        folder.mkdir()
+        for name in ("a-result.json", "b-result.json"):
+            (folder / name).write_text("{}")
+        manifest = str(tmp_path / "manifest.json")
+        assert new_files(str(folder), manifest) == ["a-result.json", "b-result.json"]
+        write_json(str(tmp_path), "manifest.json", {"files": ["a-result.json"]})
+        assert new_files(str(folder), manifest) == ["b-result.json"]
+
+
+class Test_Has_Results_Since:
+
+    def test_only_results_of_this_run_count(self, tmp_path):
+        folder = str(tmp_path)
+        write_json(folder, "old-result.json", result("1", "tc1", 1000))
+        assert not has_results_since(folder, run_started=4)
+        write_json(folder, "new-result.json", result("2", "tc1", 5000))
+        assert has_results_since(folder, run_started=4)
+
+    def test_missing_folder(self, tmp_path):
+        assert not has_results_since(str(tmp_path / "missing"), run_started=0)
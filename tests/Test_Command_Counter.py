@@ -0,0 +1,65 @@
+from selenium.webdriver.remote.command import Command
+from utility.command_counter import CommandCounter, budget_violations
+
+
+class FakeExecutor:
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, command, params):
+        self.commands.append(command)
+        if command == Command.SCREENSHOT:
+            raise RuntimeError("no screenshot")
+        return {"value": None}
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.command_executor = FakeExecutor()
+
+
+class Test_Command_Counter:
+
+    def test_commands_are_counted_by_type(self):
+        driver = FakeDriver()
+        counter = CommandCounter.attach(driver)
+        for command in (Command.FIND_ELEMENT, Command.FIND_CHILD_ELEMENTS, Command.CLICK_ELEMENT, Command.GET):
+            driver.command_executor.execute(command, {})
+        stats = counter.since(({}, {}))
+        assert stats["total"] == 4
+        assert {name: item["count"] for name, item in stats["by_type"].items()} == {
+            "findElement": 2, "click": 1, "other": 1}
+        assert driver.command_executor.commands[-1] == Command.GET
+
+    def test_failed_command_is_counted(self):
+        driver = FakeDriver()
+        counter = CommandCounter.attach(driver)
+        try:
+            driver.command_executor.execute(Command.SCREENSHOT, {})
+        except RuntimeError:
+            pass
+        assert counter.counts["screenshot"] == 1
+
+    def test_since_reports_only_the_commands_after_the_mark(self):
+        counter = CommandCounter()
+        counter.record(Command.CLICK_ELEMENT, 0.1)
+        mark = counter.snapshot()
+        counter.record(Command.CLICK_ELEMENT, 0.2)
+        counter.record(Command.W3C_EXECUTE_SCRIPT, 0.05)
+        stats = counter.since(mark)
+        assert stats["total"] == 2 and stats["latency_ms"] == 250.0
+        assert stats["by_type"]["click"] == {"count": 1, "latency_ms": 200.0}
+
+
+class Test_Budget_Violations:
+
+    def test_within_budget_and_unlimited(self):
+        stats = {"total": 40, "latency_ms": 900.0}
+        assert budget_violations(stats, max_commands=40, max_latency_ms=1000) == []
+        assert budget_violations(stats) == []
+
+    def test_over_budget(self):
+        violations = budget_violations({"total": 41, "latency_ms": 1200.0}, max_commands=40, max_latency_ms=1000)
+        assert violations == ["41 WebDriver commands > budget 40", "1200.0 ms WebDriver latency > budget 1000 ms"]
@@ -1,3 +1,4 @@
+import time
 import pytest
 import logging
 import allure
@@ -5,13 +6,9 @@ from locators.locators import DashBoardPageLocators
 from locators.locators import MyInfoPageLocators
 from utility.config_reader import get_config
 from utility.excel_reader import ExcelUtil
-from pages.base_page import Base_Page
-from pages.login_page import Login_Page
-from pages.dashboard_page import Dashboard_Page
-from pages.admin_page import Admin_Page
-from pages.leave_assign_page import Leave_Assign_Page
-from pages.myinfo_page import MyInfo_Page
-from pages.claim_page import Claim_Page
+from utility.navigation_validator import NavigationValidator
+from utility.dependency_graph import depends_on
+import json
 
 # Set up logger for this test module
 logger = logging.getLogger(__name__)
@@ -21,6 +18,30 @@ sheet = get_config("Excel", "sheet")
 excel = ExcelUtil(excel_path, sheet)
 excel_row_valid = ExcelUtil(excel_path, sheet).get_row(2)
 
+# Number of menu items / tabs still checked by real click navigation (0 = all),
+# every URL is validated concurrently in separate tabs afterwards
+click_sample = int(get_config("Navigation", "click_sample"))
+max_tabs = int(get_config("Navigation", "max_tabs"))
+
+
+def validate_urls_concurrently(driver, targets, prefix, sequential_ms=None):
+    """
+    Opens all target URLs in parallel tabs of the logged in browser,
+    attaches the report to Allure and asserts every page loaded correctly.
+    `sequential_ms` (timed click navigations) is the baseline of the reported speedup.
+    """
+    with allure.step(f"Validate {len(targets)} URLs concurrently in separate tabs"):
+        report = NavigationValidator(driver, max_tabs=max_tabs).validate(targets, sequential_ms)
+        allure.attach(json.dumps(report, indent=2), name=f"{prefix}_Concurrent_URL_Validation",
+                      attachment_type=allure.attachment_type.JSON)
+        logger.info(f"{prefix} concurrent URL validation: wall-clock {report['wall_clock_ms']} ms, "
+                    f"sum of concurrent page loads {report['summed_load_ms']} ms, "
+                    f"speedup {report.get('speedup')}x over sequential click navigation")
+
+        for result in report["results"]:
+            assert result["passed"], \
+                f"URL Mismatch for {result['name']}: Expected {result['expected_url']}, Got {result['actual_url']}"
+
 @pytest.mark.usefixtures("setup")
 class Test_Orange_Hrsite_Automation_DashBoard_Page:
 
@@ -32,11 +53,11 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
     @pytest.mark.smoke
     @pytest.mark.regression
     @pytest.mark.parametrize("row,username,password", excel_row_valid)
-    def test_tc04_validate_menu_items_visibility_and_urls(self, setup, row, username, password):
+    def test_tc04_validate_menu_items_visibility_and_urls(self, setup, pages, row, username, password):
 
         driver = setup
-        basepage = Base_Page(driver)
-        dashboardpage = Dashboard_Page(driver)
+        basepage = pages.base
+        dashboardpage = pages.dashboard
 
         # CONFIG DATA
         login_url = get_config("Login_Orange", "url")
@@ -46,7 +67,7 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
         with allure.step("Login to HRM Application"):
             logger.info("=== Starting Login Process ===")
 
-            loginpage = Login_Page(driver)
+            loginpage = pages.login
             loginpage.navigate_to_url(login_url)
 
             logger.info(f"Entering username: {username}")
@@ -76,6 +97,11 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
 
         logger.info("=== Starting Menu Validation Loop ===")
 
+        # Only a sample is click-navigated, the others are checked for visibility
+        clicked_menus = dashboardpage.required_menu_items[:click_sample or None]
+        # click → URL reached of each sampled item, the sequential baseline of the speedup
+        click_times_ms = []
+
         # LOOP THROUGH MENU ITEMS
         for menu_name in dashboardpage.required_menu_items:
 
@@ -96,15 +122,21 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
 
                     basepage.attach_save_screenshot(f"TC_04_{menu_name}_Visible_Enabled_success")
 
+                    # URL of items outside the sample is validated concurrently below
+                    if menu_name not in clicked_menus:
+                        continue
+
                     # CLICK
+                    expected_url = url_map[menu_name]
+                    started = time.perf_counter()
                     basepage.click(locator)
                     logger.info(f"Clicked {menu_name}")
 
                     # URL VALIDATE
-                    expected_url = url_map[menu_name]
                     logger.info(f"Expected URL for '{menu_name}' → {expected_url}")
 
                     basepage.wait_for_url(expected_url)
+                    click_times_ms.append((time.perf_counter() - started) * 1000)
                     actual_url = basepage.get_current_url()
 
                     logger.info(f"Actual URL after clicking: {actual_url}")
@@ -120,6 +152,9 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
                     logger.error(f"Error in {menu_name}: {e}")
                     raise
 
+        # VALIDATE ALL MENU URLS IN PARALLEL TABS
+        validate_urls_concurrently(driver, url_map, "TC04", click_times_ms)
+
     # -----------------------------------TC_08--------------------------------
     # My Info page menu items Visibility & Navigation validation
 
@@ -129,10 +164,10 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
     @pytest.mark.regression
     @pytest.mark.usefixtures("setup")
     @pytest.mark.parametrize("row,username,password", excel_row_valid)
-    def test_tc08_validate_myinfo_menu(self, setup, row, username, password):
+    def test_tc08_validate_myinfo_menu(self, setup, pages, row, username, password):
         driver = setup
-        basepage = Base_Page(driver)
-        myinfopage = MyInfo_Page(driver)
+        basepage = pages.base
+        myinfopage = pages.myinfo
 
         # LOGIN IS ALREADY DONE BY FIXTURE
         # OPEN MY INFO
@@ -156,6 +191,11 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
 
         logger.info("=== Starting My Info Tab Validation Loop ===")
 
+        # Only a sample is click-navigated, the others are checked for visibility
+        clicked_tabs = myinfopage.my_info_items[:click_sample or None]
+        # click → URL reached of each sampled tab, the sequential baseline of the speedup
+        click_times_ms = []
+
         # LOOP THROUGH ALL TABS
         for tab_name in myinfopage.my_info_items:
 
@@ -173,15 +213,21 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
 
                 basepage.attach_save_screenshot(f"TC_08_{tab_name}_Visible_Enabled_success")
 
+                # URL of tabs outside the sample is validated concurrently below
+                if tab_name not in clicked_tabs:
+                    continue
+
                 # CLICK
+                expected_url = myinfo_urls[tab_name]
+                started = time.perf_counter()
                 basepage.click(locator)
                 logger.info(f"Clicked {tab_name}")
 
                 # URL VALIDATION
-                expected_url = myinfo_urls[tab_name]
                 logger.info(f"Expected URL for '{tab_name}' → {expected_url}")
 
                 basepage.wait_for_url(expected_url)
+                click_times_ms.append((time.perf_counter() - started) * 1000)
                 actual_url = basepage.get_current_url()
                 logger.info(f"Actual URL after clicking: {actual_url}")
 
@@ -196,6 +242,9 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
                 logger.error(f"Error in {tab_name}: {e}")
                 raise
 
+        # VALIDATE ALL MY INFO URLS IN PARALLEL TABS
+        validate_urls_concurrently(driver, myinfo_urls, "TC08", click_times_ms)
+
     # ---------------------------------------------- TC-09----------------------------------------
     # Assig Leave and validate in search result
 
@@ -204,18 +253,17 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
     @pytest.mark.smoke
     @pytest.mark.regression
     @pytest.mark.parametrize("row,username,password", excel_row_valid)
-    def test_tc09_validate_assign_leave(self, setup, row, username, password):
+    def test_tc09_validate_assign_leave(self, setup, pages, data_pool, row, username, password):
 
-        driver = setup
-        basepage = Base_Page(driver)
-        leave_page = Leave_Assign_Page(driver)
+        basepage = pages.base
+        leave_page = pages.leave
 
         # config data
         expected_msg = get_config("Leave_Data", "success_message")
         employee_name = get_config("Leave_Data", "employee_name")
         leave_type = get_config("Leave_Data", "leave_type")
-        from_date = get_config("Leave_Data", "from_date")
-        to_date = get_config("Leave_Data", "to_date")
+        # weekdays no other worker / run has assigned leave on
+        from_date, to_date = data_pool.lease_date_range(days=1)
         comment_text = get_config("Leave_Data", "comments")
         search_message = get_config("Leave_Data", "search_message")
 
@@ -272,6 +320,7 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
 
             assert success_text is not None, "Success toast not visible"
             assert expected_msg in success_text, f"Expected success message '{expected_msg}' not found"
+            data_pool.register_leave(employee_name, from_date, to_date)
 
         # Validate Assigned Leave in Search List
             with allure.step("Validate Assigned Leave in Search List"):
@@ -298,13 +347,12 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
         "Creates a new user from Admin → User Management and validates login with the newly created user.")
     @pytest.mark.smoke
     @pytest.mark.regression
-    def test_tc05__create_and_validate_new_user(self, setup):
+    def test_tc05__create_and_validate_new_user(self, setup, pages, handoff, data_pool):
 
-        driver = setup
-        basepage = Base_Page(driver)
-        loginpage = Login_Page(driver)
-        adminpage = Admin_Page(driver)
-        dashboardpage = Dashboard_Page(driver)
+        basepage = pages.base
+        loginpage = pages.login
+        adminpage = pages.admin
+        dashboardpage = pages.dashboard
 
         logger.info("====== TC05: Create and Validate New User Test Started ======")
 
@@ -313,8 +361,9 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
         dashboard_url = get_config("Dashboard_Page", "url")
         role = get_config("Add_new_user", "role")
         status = get_config("Add_new_user", "status")
-        employee_name = get_config("Add_new_user", "emp_name")
-        new_username = get_config("Add_new_user", "new_username")
+        # unique employee / username per worker and run (config.ini values when the pool is disabled)
+        employee_name = data_pool.lease_employee()
+        new_username = data_pool.lease_username()
         new_password = get_config("Add_new_user", "new_password")
         admin_url = get_config("Add_new_user", "admin_url")
         add_url = get_config("Add_new_user", "add_url")
@@ -364,6 +413,10 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
             assert expected_msg in success_text, "Success message mismatch"
 
             logger.info("New user created successfully.")
+            data_pool.register_user(new_username)
+            # TC06 / TC10 work with this user
+            handoff.publish("username", new_username)
+            handoff.publish("password", new_password)
             basepage.wait_for_url(admin_url)
 
         # Logout Admin
@@ -410,18 +463,19 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
     @pytest.mark.smoke
     @pytest.mark.regression
     @pytest.mark.parametrize("row,username,password", excel_row_valid)
-    def test_tc06_validate_new_user_in_search(self, setup, row, username, password):
+    @depends_on("tc05")
+    def test_tc06_validate_new_user_in_search(self, setup, pages, handoff, row, username, password):
 
-        driver = setup
-        basepage = Base_Page(driver)
-        adminpage=Admin_Page(driver)
-        loginpage = Login_Page(driver)
-        dashboardpage=Dashboard_Page(driver)
+        basepage = pages.base
+        adminpage = pages.admin
+        loginpage = pages.login
+        dashboardpage = pages.dashboard
 
         # config data
         login_url = get_config("Login_Orange", "url")
         dashboard_url = get_config("Dashboard_Page", "url")
-        new_username = get_config("Add_new_user", "new_username")
+        # user created by TC05 (config value when TC05 is not part of this run)
+        new_username = handoff.get("tc05", "username", default=get_config("Add_new_user", "new_username"))
 
         logger.info("========== TC06 Validate Newly Created User Search STARTED ==========")
 
@@ -479,17 +533,18 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
         "Employee initiates a new claim request, adds expense, submits the claim and validates the claim in history.")
     @pytest.mark.smoke
     @pytest.mark.regression
-    def test_tc10_initiate_claim_request(self, setup):
+    @depends_on("tc05")
+    def test_tc10_initiate_claim_request(self, setup, pages, handoff):
 
-        driver=setup
-        claimpage = Claim_Page(driver)
-        basepage=Base_Page(driver)
+        claimpage = pages.claim
+        basepage = pages.base
 
         # ---- Test Data from config.ini ----
         login_url = get_config("Login_Orange", "url")
         dashboard_url = get_config("Dashboard_Page", "url")
-        emp_username = get_config("claim", "emp_username")
-        emp_password = get_config("claim", "emp_password")
+        # employee created by TC05 (config values when TC05 is not part of this run)
+        emp_username = handoff.get("tc05", "username", default=get_config("claim", "emp_username"))
+        emp_password = handoff.get("tc05", "password", default=get_config("claim", "emp_password"))
         claim_type = get_config("claim", "claim_type")
         currency = get_config("claim", "currency")
         reason = get_config("claim", "reason")
@@ -501,7 +556,7 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
         with allure.step("Login to HRM Application"):
             logger.info("=== Starting Login Process ===")
 
-            loginpage = Login_Page(driver)
+            loginpage = pages.login
             loginpage.navigate_to_url(login_url)
 
             logger.info(f"Entering username: {emp_username}")
@@ -549,8 +604,8 @@ class Test_Orange_Hrsite_Automation_DashBoard_Page:
             logger.info("Adding Expense")
             claimpage.add_expense()
 
-            logger.info(f"Selecting claim type: {claim_type}")
-            claimpage.select_claim_type(claim_type)
+            logger.info(f"Selecting expense type: {claim_type}")
+            claimpage.select_expense_type(claim_type)
 
             logger.info(f"Selecting claim date: {date}")
             claimpage.select_claim_date(date)
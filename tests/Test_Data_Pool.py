@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+from utility.data_pool import DataPool, _base36
+
+
+class FakeApi:
+    """Records the calls of DataPool and answers with canned data."""
+
+    def __init__(self, leave_requests=(), employees=()):
+        self.leave_requests = list(leave_requests)
+        self.employees = list(employees)
+        self.calls = []
+
+    def get(self, path, **params):
+        self.calls.append(("GET", path, params))
+        if path == "pim/employees":
+            return {"data": self.employees}
+        if path == "leave/employees/leave-requests":
+            return {"data": [request for request in self.leave_requests
+                             if request["employee"]["empNumber"] == params["empNumber"]]}
+        return {"data": []}
+
+    def put(self, path, payload):
+        self.calls.append(("PUT", path, payload))
+        return {}
+
+    def delete(self, path, payload):
+        self.calls.append(("DELETE", path, payload))
+        return {}
+
+
+def leave_request(request_id, emp_number, from_date, to_date=None):
+    return {"id": request_id, "employee": {"empNumber": emp_number},
+            "dates": {"fromDate": from_date, "toDate": to_date}}
+
+
+class Test_Data_Pool:
+
+    def test_base36(self):
+        assert _base36(0) == "0"
+        assert _base36(36 * 36 + 35) == "10z"
+
+    def test_usernames_are_unique_per_worker(self):
+        first, second = DataPool(worker="gw1", run_id="run"), DataPool(worker="gw2", run_id="run")
+        names = {first.lease_username(), first.lease_username(), second.lease_username()}
+        assert len(names) == 3
+        assert all("runw1" in name or "runw2" in name for name in names)
+
+    def test_date_ranges_do_not_overlap_and_start_over_after_the_horizon(self, tmp_path):
+        pool = DataPool(worker="gw0", run_id="run")
+        pool.lease_dir = str(tmp_path)
+        ranges = [pool.lease_date_range(days=3) for _ in range(60)]
+        dates = [date.fromisoformat(day) for pair in ranges for day in pair]
+        assert all(day.weekday() < 5 for day in dates)
+        assert min(dates) >= date.today() + timedelta(days=30)
+        assert max(dates) <= date.today() + timedelta(days=30 + 180)
+        first = ranges[0]
+        assert all(to_date < next_from for (_, to_date), (next_from, _) in zip(ranges[:5], ranges[1:6]))
+        # 60 × 3 weekdays are more than the horizon holds → the cursor started over
+        assert first in ranges[1:]
+
+    def test_cleanup_cancels_only_the_leaves_of_this_session(self):
+        pool = DataPool(worker="gw0", run_id="run")
+        pool.employee_numbers["Pool runw01"] = 7
+        pool.created_employees.append(7)
+        pool.register_leave("Pool runw01", "2030-01-07", "2030-01-08")
+        pool.register_leave("Orange Test", "2030-01-09", "2030-01-09")
+        api = FakeApi(leave_requests=[
+            leave_request(1, 7, "2030-01-07", "2030-01-08"),
+            # same employee, other dates (assigned by someone else)
+            leave_request(2, 7, "2030-01-08", "2030-01-08"),
+            # single-day leave of the looked-up employee
+            leave_request(3, 42, "2030-01-09"),
+            # other employee on the same dates
+            leave_request(4, 99, "2030-01-07", "2030-01-08"),
+        ], employees=[{"empNumber": 42, "firstName": "Orange", "lastName": "Test"},
+                      {"empNumber": 43, "firstName": "Orange", "lastName": "Tester"}])
+        pool.api = api
+
+        pool.cleanup()
+        cancelled = [payload for method, path, payload in api.calls if method == "PUT"]
+        assert cancelled == [{"data": [{"leaveRequestId": 1, "action": "CANCEL"},
+                                       {"leaveRequestId": 3, "action": "CANCEL"}]}]
+        assert ("DELETE", "pim/employees", {"ids": [7]}) in api.calls
+        assert pool.assigned_leaves == [] and pool.created_employees == []
+
+    def test_nothing_to_cancel_without_assigned_leaves(self, tmp_path):
+        pool = DataPool(worker="gw0", run_id="run")
+        pool.lease_dir = str(tmp_path)
+        pool.lease_date_range(days=1)
+        pool.api = api = FakeApi(leave_requests=[leave_request(1, 7, "2030-01-07")])
+        pool.cleanup()
+        assert api.calls == []
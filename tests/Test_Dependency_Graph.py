@@ -0,0 +1,74 @@
+import pytest
+from utility.dependency_graph import DependencyGraph, DependencyCycleError, DependencyError, DataHandoff, normalize_id
+
+MODULE = "tests/Test_Module.py"
+
+
+class FakeItem:
+    """Just what DependencyGraph reads from a pytest item: nodeid, names and depends_on markers."""
+
+    def __init__(self, name, *prerequisites, cls="Test_Class"):
+        self.name = name
+        self.originalname = name.split("[")[0]
+        self.nodeid = f"{MODULE}::{cls}::{name}"
+        self.markers = [pytest.mark.depends_on(*prerequisites).mark] if prerequisites else []
+
+    def iter_markers(self, name):
+        return iter([marker for marker in self.markers if marker.name == name])
+
+
+class Test_Dependency_Graph:
+
+    def test_normalize_id(self):
+        assert normalize_id("TC05") == normalize_id("tc_05") == normalize_id("tc5") == "tc5"
+
+    def test_prerequisite_moves_before_dependent(self):
+        dependent = FakeItem("test_tc06_search", "tc05")
+        prerequisite = FakeItem("test_tc05_create")
+        graph = DependencyGraph([dependent, prerequisite])
+        assert graph.ordered([dependent, prerequisite]) == [prerequisite, dependent]
+        assert graph.prerequisites(dependent) == [(MODULE, "tc5")]
+
+    def test_all_parametrizations_of_prerequisite_run_first(self):
+        first, second = FakeItem("test_tc05_create[1]"), FakeItem("test_tc05_create[2]")
+        dependent = FakeItem("test_tc06_search", "tc05")
+        graph = DependencyGraph([first, dependent, second])
+        assert graph.ordered([first, dependent, second]) == [first, second, dependent]
+
+    def test_cycle_is_reported(self):
+        with pytest.raises(DependencyCycleError, match="tc1 → tc2 → tc1|tc2 → tc1 → tc2"):
+            DependencyGraph([FakeItem("test_tc1_a", "tc2"), FakeItem("test_tc2_b", "tc1")])
+
+    def test_unknown_prerequisite_is_ignored(self):
+        item = FakeItem("test_tc06_search", "tc99")
+        assert DependencyGraph([item]).prerequisites(item) == []
+
+    def test_shared_id_is_tracked_per_function(self):
+        excel = FakeItem("test_tc1_validate_logins_from_excel[1]")
+        contexts = FakeItem("test_tc1_validate_logins_in_isolated_contexts")
+        graph = DependencyGraph([excel, contexts])
+        assert (MODULE, "tc1") in graph.ambiguous
+        assert graph.key(excel) != graph.key(contexts)
+        assert graph.key(excel) == (MODULE, "test_tc1_validate_logins_from_excel")
+
+    def test_shared_id_cannot_be_a_prerequisite(self):
+        items = [FakeItem("test_tc1_a"), FakeItem("test_tc1_b"), FakeItem("test_tc2_c", "tc1")]
+        with pytest.raises(DependencyError, match="test_tc1_a, test_tc1_b"):
+            DependencyGraph(items)
+
+    def test_linked_classes_share_a_scheduling_unit(self):
+        producer = FakeItem("test_tc05_create", cls="Test_A")
+        consumer = FakeItem("test_tc06_search", "tc05", cls="Test_B")
+        loner = FakeItem("test_tc07_other", cls="Test_C")
+        units = DependencyGraph([producer, consumer, loner]).unit_of(lambda nodeid: nodeid.rsplit("::", 1)[0])
+        assert units[producer.nodeid] == units[consumer.nodeid] != units[loner.nodeid]
+
+
+class Test_Data_Handoff:
+
+    def test_published_value_is_read_by_id(self):
+        handoff = DataHandoff()
+        handoff.bind(FakeItem("test_tc05_create")).publish("username", "user_1")
+        handoff.bind(FakeItem("test_tc06_search"))
+        assert handoff.get("TC05", "username") == "user_1"
+        assert handoff.get("tc05", "password", default="fallback") == "fallback"
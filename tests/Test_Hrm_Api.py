@@ -0,0 +1,76 @@
+import io
+import json
+import pytest
+from utility.hrm_api import HRMApiClient, HRMApiError, base_url_from
+
+BASE_URL = "https://hrm.example.com"
+
+
+class FakeResponse(io.BytesIO):
+
+    def __init__(self, body=b"", url=""):
+        super().__init__(body)
+        self.url = url
+
+    def geturl(self):
+        return self.url
+
+
+class FakeOpener:
+    """Stands in for the cookie opener: records the requests, answers with `responses` in order."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def open(self, request, data=None, timeout=None):
+        self.requests.append((request, data))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def client(*responses):
+    api = HRMApiClient(BASE_URL, "Admin", "admin123")
+    api.opener = FakeOpener(*responses)
+    return api
+
+
+class Test_Hrm_Api:
+
+    def test_base_url_from_login_url(self):
+        assert base_url_from(f"{BASE_URL}/web/index.php/auth/login") == BASE_URL
+
+    def test_list_parameters_become_repeated_keys(self):
+        api = client(FakeResponse(b'{"data": []}'))
+        assert api.get("leave/employees/leave-requests", limit=50, **{"statuses[]": [1, 2]}) == {"data": []}
+        request, _ = api.opener.requests[0]
+        assert request.full_url == (f"{BASE_URL}/web/index.php/api/v2/leave/employees/leave-requests"
+                                    "?limit=50&statuses%5B%5D=1&statuses%5B%5D=2")
+        assert request.get_method() == "GET" and request.data is None
+
+    def test_json_payload_and_empty_body(self):
+        api = client(FakeResponse(b""))
+        assert api.put("leave/employees/leave-requests/bulk", {"data": [{"leaveRequestId": 1}]}) == {}
+        request, _ = api.opener.requests[0]
+        assert request.get_method() == "PUT"
+        assert json.loads(request.data) == {"data": [{"leaveRequestId": 1}]}
+
+    def test_failed_call_raises_api_error(self):
+        api = client(OSError("connection refused"))
+        with pytest.raises(HRMApiError, match="DELETE admin/users failed"):
+            api.delete("admin/users", {"ids": [1]})
+
+    def test_redirect_to_login_page_means_session_is_gone(self):
+        url = f"{BASE_URL}/web/index.php/pim/viewEmployeeList"
+        api = client(FakeResponse(b"<html>", url), FakeResponse(b"<html>", f"{BASE_URL}/web/index.php/auth/login"))
+        assert api.page(url) == 6
+        with pytest.raises(HRMApiError, match="redirected to the login page"):
+            api.page(url)
+
+    def test_login_without_token_fails(self, monkeypatch):
+        opener = FakeOpener(FakeResponse(b"<auth-login></auth-login>"))
+        monkeypatch.setattr("utility.hrm_api.build_opener", lambda *handlers: opener)
+        with pytest.raises(HRMApiError, match="CSRF token not found"):
+            HRMApiClient(BASE_URL, "Admin", "admin123").login()
@@ -0,0 +1,92 @@
+import os
+import zipfile
+from utility import lite_report
+from utility.lite_report import LiteReport, _slug, outcome_of
+
+
+class FakeReport:
+    """Stands in for a pytest TestReport of one phase."""
+
+    def __init__(self, when, outcome="passed", sections=(), longreprtext="", duration=0.5, wasxfail=None):
+        self.when = when
+        self.outcome = outcome
+        self.failed = outcome == "failed"
+        self.skipped = outcome == "skipped"
+        self.sections = list(sections)
+        self.longreprtext = longreprtext
+        self.duration = duration
+        if wasxfail is not None:
+            self.wasxfail = wasxfail
+
+
+def phases(call="passed", setup="passed", **call_kwargs):
+    return [FakeReport("setup", setup), FakeReport("call", call, **call_kwargs), FakeReport("teardown")]
+
+
+class Test_Outcome_Of:
+
+    def test_worst_outcome_wins(self):
+        assert outcome_of(phases()) == "passed"
+        assert outcome_of(phases(call="failed")) == "failed"
+        assert outcome_of(phases(setup="failed")[:1]) == "error"
+        assert outcome_of(phases(call="skipped")) == "skipped"
+
+    def test_xfail_and_perf_failures(self):
+        assert outcome_of([FakeReport("call", "skipped", wasxfail="known bug")]) == "xfailed"
+        assert outcome_of([FakeReport("call", "passed", wasxfail="known bug")]) == "xpassed"
+        report = FakeReport("call", "failed")
+        report.perf_failed = True
+        assert outcome_of([report]) == "perf-failed"
+
+
+class Test_Lite_Report:
+
+    def test_slug_of_a_node_id(self):
+        assert _slug("tests/Test_Login.py::Test_Login::test_tc1[Admin-admin123]") == \
+            "tests_Test_Login.py_Test_Login_test_tc1_Admin-admin123"
+
+    def test_rows_and_paged_logs(self, tmp_path):
+        directory = str(tmp_path / "lite")
+        report = LiteReport(directory, page_lines=3)
+        report.open()
+        section = ("Captured log call", "line 1\nline 2\nline 3")
+        reports = [FakeReport("setup", sections=[section]),
+                   FakeReport("call", "failed", sections=[section], longreprtext="AssertionError\nboom"),
+                   FakeReport("teardown", sections=[section])]
+        report.add("tests/Test_Login.py::test_tc1", reports)
+        report.close()
+
+        folder = os.path.join(directory, "assets", "tests_Test_Login.py_test_tc1")
+        # captured section once (4 lines) + failure (3 lines) → 3 pages of 3 lines
+        assert sorted(os.listdir(folder)) == ["log_001.txt", "log_002.txt", "log_003.txt"]
+        with open(report.path, encoding="utf-8") as f:
+            page = f.read()
+        assert 'data-outcome="failed"' in page and 'data-pages="3"' in page
+        assert "1 tests in" in page and page.rstrip().endswith("</html>")
+
+    def test_open_removes_the_previous_run(self, tmp_path):
+        directory = tmp_path / "lite"
+        (directory / "assets" / "old_test").mkdir(parents=True)
+        report = LiteReport(str(directory))
+        report.open()
+        report.close()
+        assert os.listdir(directory / "assets") == []
+
+    def test_trace_screenshot_is_extracted_on_attach(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(lite_report, "_enabled", True)
+        monkeypatch.setattr(lite_report, "get_current_test", lambda: "tests/Test_Login.py::test_tc1@lpt2")
+        monkeypatch.setattr(lite_report, "_setting", lambda key, default: str(tmp_path / "lite"))
+        trace = str(tmp_path / "trace.zip")
+        with zipfile.ZipFile(trace, "w") as archive:
+            archive.writestr("trace.json", "{}")
+            archive.writestr("screenshot.png", b"png")
+        lite_report.attach(trace)
+        folder = tmp_path / "lite" / "assets" / "tests_Test_Login.py_test_tc1"
+        assert sorted(os.listdir(folder)) == ["failure_screenshot.png", "trace.zip"]
+        assert (folder / "failure_screenshot.png").read_bytes() == b"png"
+
+    def test_nothing_is_written_outside_lite_mode(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(lite_report, "_enabled", False)
+        monkeypatch.setattr(lite_report, "_setting", lambda key, default: str(tmp_path / "lite"))
+        lite_report.screenshot("login", b"png")
+        assert not (tmp_path / "lite").exists()
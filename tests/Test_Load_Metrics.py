@@ -0,0 +1,55 @@
+import json
+from utility.load_metrics import LoadMetrics, distribution, percentile
+
+
+class Test_Load_Metrics:
+
+    def test_nearest_rank_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([7, 3, 5], 0) == 3
+        assert percentile([], 50) is None
+
+    def test_distribution(self):
+        dist = distribution([10, 20, 30, 40])
+        assert dist["count"] == 4 and dist["min_ms"] == 10 and dist["max_ms"] == 40
+        assert dist["mean_ms"] == 25 and dist["p50_ms"] == 20
+        assert distribution([]) == {"count": 0}
+
+    def test_failed_iteration_is_counted_and_swallowed(self):
+        metrics = LoadMetrics("scenario")
+        with metrics.iteration():
+            metrics.record("save", 120)
+        with metrics.iteration():
+            raise TimeoutError("no response")
+        metrics.fail("SessionNotCreated", count=2)
+        metrics.stop()
+        summary = metrics.summary()
+        assert summary["completed"] == 1 and summary["failed"] == 3
+        assert summary["error_rate"] == 0.75
+        assert summary["errors"] == {"TimeoutError": 1, "SessionNotCreated": 2}
+        assert summary["steps"]["save"]["count"] == 1
+
+    def test_failed_step_is_not_recorded(self):
+        metrics = LoadMetrics("scenario")
+        with metrics.iteration():
+            with metrics.step("save"):
+                raise ValueError("invalid")
+        assert "save" not in metrics.summary()["steps"]
+
+    def test_latency_by_volume_buckets(self):
+        metrics = LoadMetrics("scenario")
+        for volume in range(10):
+            metrics.record("list", volume * 10, volume=volume)
+        rows = metrics.by_volume("list", buckets=2)
+        assert [(row["volume_from"], row["volume_to"], row["count"]) for row in rows] == [(0, 4, 5), (5, 9, 5)]
+        assert metrics.by_volume("unknown") == []
+
+    def test_summary_is_written_as_json(self, tmp_path):
+        metrics = LoadMetrics("scenario")
+        metrics.record("list", 5, volume=1)
+        with open(metrics.write(str(tmp_path))) as f:
+            data = json.load(f)
+        assert data["scenario"] == "scenario"
+        assert data["volume"]["list"][0]["count"] == 1
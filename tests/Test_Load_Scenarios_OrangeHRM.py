@@ -0,0 +1,141 @@
+import pytest
+import logging
+import allure
+import json
+from functools import partial
+from utility.config_reader import get_config
+from utility.load_metrics import LoadMetrics
+from scenarios.runner import run_sessions
+from scenarios import user_creation
+from scenarios import leave_assignment
+from scenarios import claim_submission
+
+# Set up logger for this test module
+logger = logging.getLogger(__name__)
+
+
+def report_load_metrics(metrics, prefix):
+    """Attaches the step table and the summary to Allure and writes Reports/load/<scenario>.json."""
+    summary = metrics.summary()
+    allure.attach(metrics.table(), name=f"{prefix}_Load_Summary", attachment_type=allure.attachment_type.TEXT)
+    allure.attach(json.dumps(summary, indent=2), name=f"{prefix}_Load_Metrics",
+                  attachment_type=allure.attachment_type.JSON)
+    metrics.write()
+    logger.info(f"{prefix}: {summary['completed']} ok, {summary['failed']} failed, "
+                f"{summary['per_minute']} / min, error rate {summary['error_rate']:.1%}")
+    return summary
+
+
+@pytest.mark.load
+class Test_Orange_Hrsite_Load_Scenarios:
+    """
+    Load scenarios driven through the page objects (run with --load).
+    Each scenario starts its own headless browser sessions in parallel;
+    the instance is chosen with HRM_BASE_URL / [Environment] base_url.
+    """
+
+    # --------------------------------------- LOAD-01 ------------------------------------------------
+    # LOAD01 — Bulk user creation throughput
+
+    @allure.title("LOAD01 – Bulk User Creation Throughput")
+    @allure.description("""
+            Creates N system users with a mix of roles and statuses through Admin_Page
+            in parallel browser sessions and reports users per minute, per-step latency
+            percentiles and the error rate.
+        """)
+    def test_load01_bulk_user_creation(self, request, data_pool):
+
+        users = int(get_config("Load_User_Creation", "users"))
+        sessions = int(get_config("Load_User_Creation", "sessions"))
+        headless = get_config("Load_User_Creation", "headless").lower() == "true"
+        max_error_rate = float(get_config("Load_User_Creation", "max_error_rate"))
+        browser = request.config.getoption("--browser-name")
+
+        with allure.step(f"Generate {users} users for {sessions} sessions"):
+            # one leased employee per session
+            specs = user_creation.user_specs(users, data_pool, employees=sessions)
+
+        metrics = LoadMetrics("user_creation")
+        with allure.step(f"Create {users} users in {sessions} parallel sessions"):
+            run_sessions(partial(user_creation.create_users, on_created=data_pool.register_user),
+                         specs, sessions, metrics, browser=browser, headless=headless)
+
+        summary = report_load_metrics(metrics, "LOAD01")
+        assert summary["completed"] > 0, f"No user created: {summary['errors']}"
+        assert summary["error_rate"] <= max_error_rate, \
+            f"Error rate {summary['error_rate']:.1%} above {max_error_rate:.1%}: {summary['errors']}"
+
+    # --------------------------------------- LOAD-02 ------------------------------------------------
+    # LOAD02 — Leave assignment latency as volume grows
+
+    @allure.title("LOAD02 – Leave Assignment & Leave List Search Under Growing Volume")
+    @allure.description("""
+            Assigns many non-overlapping leaves over several employees and leave types
+            in parallel browser sessions and measures the latency of the assignment
+            confirmation and of the Leave List search as the number of leaves grows.
+        """)
+    def test_load02_leave_assignment_volume(self, request, data_pool):
+
+        leaves = int(get_config("Load_Leave", "leaves"))
+        sessions = int(get_config("Load_Leave", "sessions"))
+        employees = int(get_config("Load_Leave", "employees"))
+        search_every = int(get_config("Load_Leave", "search_every"))
+        headless = get_config("Load_Leave", "headless").lower() == "true"
+        max_error_rate = float(get_config("Load_Leave", "max_error_rate"))
+        browser = request.config.getoption("--browser-name")
+
+        with allure.step(f"Generate {leaves} non-overlapping leaves for {employees} employees"):
+            specs = leave_assignment.leave_specs(leaves, data_pool, employees=employees)
+            # Leave List searches cover every generated leave
+            search_range = (min(spec["from_date"] for spec in specs), max(spec["to_date"] for spec in specs))
+
+        metrics = LoadMetrics("leave_assignment")
+        with allure.step(f"Assign {leaves} leaves in {sessions} parallel sessions"):
+            run_sessions(partial(leave_assignment.assign_leaves, search_range=search_range, search_every=search_every,
+                                 on_assigned=data_pool.register_leave),
+                         specs, sessions, metrics, browser=browser, headless=headless)
+
+        summary = report_load_metrics(metrics, "LOAD02")
+        for step in ("assign_confirm", "leave_list_search"):
+            allure.attach(metrics.volume_table(step), name=f"LOAD02_{step}_by_volume",
+                          attachment_type=allure.attachment_type.TEXT)
+            logger.info(metrics.volume_table(step))
+
+        assert summary["completed"] > 0, f"No leave assigned: {summary['errors']}"
+        assert summary["error_rate"] <= max_error_rate, \
+            f"Error rate {summary['error_rate']:.1%} above {max_error_rate:.1%}: {summary['errors']}"
+
+    # --------------------------------------- LOAD-03 ------------------------------------------------
+    # LOAD03 — Multi-expense claim submission throughput
+
+    @allure.title("LOAD03 – Multi-Expense Claim Submission Throughput")
+    @allure.description("""
+            Submits the claims of testdata/claim_expenses.csv (many expense lines per claim)
+            in parallel sessions, each logged in as its own ESS employee, and reports the
+            submission latency, loader wait time and claim history read time as claims grow.
+        """)
+    def test_load03_multi_expense_claims(self, request, data_pool):
+
+        sessions = int(get_config("Load_Claim", "sessions"))
+        repeat = int(get_config("Load_Claim", "repeat"))
+        headless = get_config("Load_Claim", "headless").lower() == "true"
+        max_error_rate = float(get_config("Load_Claim", "max_error_rate"))
+        browser = request.config.getoption("--browser-name")
+
+        with allure.step(f"Load claim table and lease {sessions} ESS employees"):
+            claims = claim_submission.load_claims(get_config("Load_Claim", "data"))
+            specs = claim_submission.claim_specs(claims, data_pool, sessions, repeat=repeat)
+            logger.info(f"{len(specs)} claims with {sum(len(c['expenses']) for c in specs)} expense lines")
+
+        metrics = LoadMetrics("claim_submission")
+        with allure.step(f"Submit {len(specs)} claims in {sessions} parallel sessions"):
+            run_sessions(claim_submission.submit_claims, specs, sessions, metrics, browser=browser, headless=headless)
+
+        summary = report_load_metrics(metrics, "LOAD03")
+        allure.attach(metrics.volume_table("claim_history_read"), name="LOAD03_claim_history_read_by_volume",
+                      attachment_type=allure.attachment_type.TEXT)
+        logger.info(metrics.volume_table("claim_history_read"))
+
+        assert summary["completed"] > 0, f"No claim submitted: {summary['errors']}"
+        assert summary["error_rate"] <= max_error_rate, \
+            f"Error rate {summary['error_rate']:.1%} above {max_error_rate:.1%}: {summary['errors']}"
@@ -0,0 +1,91 @@
+import copy
+import json
+from selenium.webdriver.common.by import By
+from utility import locator_registry
+from utility.locator_registry import Locator, LocatorStats, by_text, resolve, to_css
+
+
+class SampleLocators:
+    SAVE_BUTTON = Locator(By.ID, "save", (By.CSS_SELECTOR, "button.save"), by_text("Save", "button"))
+
+
+class SamplePage:
+    save_button = SampleLocators.SAVE_BUTTON
+
+
+class FakeDriver:
+    """Answers the probe script with the 1-based position of the matching strategy and its match count."""
+
+    def __init__(self, position, count=1):
+        self.answer = [position, count] if position else None
+        self.payloads = []
+
+    def execute_script(self, script, payload):
+        self.payloads.append(payload)
+        return self.answer
+
+
+class Test_Locator:
+
+    def test_locator_is_its_primary_strategy(self):
+        assert SampleLocators.SAVE_BUTTON == (By.ID, "save")
+        by, value = SampleLocators.SAVE_BUTTON
+        assert (by, value) == (By.ID, "save")
+        assert len(SampleLocators.SAVE_BUTTON.strategies) == 3
+
+    def test_name_of_the_locators_class_is_kept_on_page_classes(self):
+        assert SamplePage.save_button.name == "SampleLocators.SAVE_BUTTON"
+
+    def test_copy_keeps_the_fallbacks(self):
+        duplicate = copy.deepcopy(SampleLocators.SAVE_BUTTON)
+        assert duplicate.strategies == SampleLocators.SAVE_BUTTON.strategies
+
+    def test_css_form_of_strategies(self):
+        assert to_css(By.ID, "save") == '[id="save"]'
+        assert to_css(By.CLASS_NAME, "oxd-button") == ".oxd-button"
+        assert to_css(By.XPATH, "//button") is None
+
+
+class Test_Locator_Stats:
+
+    def test_last_successful_strategy_is_tried_first(self, tmp_path):
+        stats = LocatorStats(str(tmp_path / "stats.json"))
+        assert stats.order(SampleLocators.SAVE_BUTTON) == [0, 1, 2]
+        stats.hit(SampleLocators.SAVE_BUTTON.name, 2)
+        assert stats.order(SampleLocators.SAVE_BUTTON) == [2, 0, 1]
+
+    def test_save_adds_to_the_counts_of_other_workers(self, tmp_path):
+        path = tmp_path / "stats.json"
+        path.write_text(json.dumps({"SampleLocators.SAVE_BUTTON": {
+            "hits": {"0": 3}, "misses": 1, "preferred": 0, "last_fallback": None}}))
+        stats = LocatorStats(str(path))
+        stats.hit("SampleLocators.SAVE_BUTTON", 1)
+        stats.miss("SampleLocators.SAVE_BUTTON")
+        merged = stats.save()["SampleLocators.SAVE_BUTTON"]
+        assert merged["hits"] == {"0": 3, "1": 1}
+        assert merged["misses"] == 2 and merged["preferred"] == 1
+        assert json.loads(path.read_text()) == stats.saved
+        assert stats.fallbacks(stats.saved) == [("SampleLocators.SAVE_BUTTON", 1, 3, 2, 1)]
+
+
+class Test_Resolve:
+
+    def test_fallback_strategy_is_returned_and_counted(self, tmp_path, monkeypatch):
+        stats = LocatorStats(str(tmp_path / "stats.json"))
+        monkeypatch.setattr(locator_registry, "_stats", stats)
+        monkeypatch.setattr(locator_registry, "is_enabled", lambda: True)
+        driver = FakeDriver(position=2)
+        assert resolve(driver, SampleLocators.SAVE_BUTTON, timeout=1) == (By.CSS_SELECTOR, "button.save")
+        assert driver.payloads[0][0] == ["css selector", '[id="save"]']
+        assert stats.session["SampleLocators.SAVE_BUTTON"]["hits"] == {"1": 1}
+
+    def test_strategy_matching_several_elements_is_not_remembered(self, tmp_path, monkeypatch):
+        stats = LocatorStats(str(tmp_path / "stats.json"))
+        monkeypatch.setattr(locator_registry, "_stats", stats)
+        monkeypatch.setattr(locator_registry, "is_enabled", lambda: True)
+        assert resolve(FakeDriver(position=3, count=2), SampleLocators.SAVE_BUTTON, timeout=1) == by_text("Save", "button")
+        assert stats.session == {}
+        assert stats.order(SampleLocators.SAVE_BUTTON) == [0, 1, 2]
+
+    def test_plain_tuples_are_returned_unchanged(self):
+        assert resolve(FakeDriver(position=0), (By.ID, "save")) == (By.ID, "save")
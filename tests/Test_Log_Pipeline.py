@@ -0,0 +1,76 @@
+import os
+import sys
+import json
+import time
+import logging
+from utility import log_pipeline
+from utility.log_pipeline import JsonLinesFormatter, SizeAndTimeRotatingFileHandler, StructuredQueueHandler, read
+
+
+def make_record(message, *args, exc_info=None):
+    return logging.LogRecord("pages.base_page", logging.INFO, __file__, 1, message, args, exc_info)
+
+
+def write_lines(path, entries):
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in entries)
+
+
+def entry(ts, worker, test_id="tests/Test_Login.py::test_tc1", level="INFO"):
+    return {"ts": ts, "time": "-", "level": level, "logger": "x", "test_id": test_id, "worker": worker,
+            "thread": "MainThread", "message": f"{worker} at {ts}"}
+
+
+class Test_Log_Pipeline:
+
+    def test_json_line_keeps_the_traceback_apart(self):
+        try:
+            raise ValueError("bad row")
+        except ValueError:
+            record = make_record("Row %s failed", 3, exc_info=sys.exc_info())
+        record.test_id, record.worker = "tests/Test_Login.py::test_tc1", "gw0"
+        prepared = StructuredQueueHandler(None).prepare(record)
+        data = json.loads(JsonLinesFormatter().format(prepared))
+        assert data["message"] == "Row 3 failed"
+        assert data["test_id"] == "tests/Test_Login.py::test_tc1" and data["worker"] == "gw0"
+        assert "ValueError: bad row" in data["exc"] and "Traceback" not in data["message"]
+
+    def test_file_of_an_earlier_run_rolls_over_after_the_interval(self, tmp_path):
+        path = str(tmp_path / "test_logs_main.jsonl")
+        with open(path, "w") as f:
+            f.write("{}\n")
+        old = time.time() - 7200
+        os.utime(path, (old, old))
+        handler = SizeAndTimeRotatingFileHandler(path, max_bytes=0, backup_count=2, interval_s=3600)
+        try:
+            assert handler.shouldRollover(make_record("first"))
+            handler.doRollover()
+            assert os.path.exists(path + ".1")
+            assert not handler.shouldRollover(make_record("second"))
+        finally:
+            handler.close()
+
+    def test_fresh_file_rolls_over_by_size(self, tmp_path):
+        handler = SizeAndTimeRotatingFileHandler(str(tmp_path / "log.jsonl"), max_bytes=10, backup_count=1,
+                                                 interval_s=3600)
+        try:
+            assert not handler.shouldRollover(make_record("short"))
+            handler.emit(make_record("a message longer than ten bytes"))
+            assert handler.shouldRollover(make_record("next"))
+        finally:
+            handler.close()
+
+    def test_read_merges_workers_and_backups_by_time(self, tmp_path):
+        write_lines(tmp_path / "test_logs_gw0.jsonl", [entry(1, "gw0"), entry(4, "gw0")])
+        write_lines(tmp_path / "test_logs_gw0.jsonl.1", [entry(0, "gw0")])
+        write_lines(tmp_path / "test_logs_gw1.jsonl", [entry(2, "gw1"), entry(3, "gw1")])
+        (tmp_path / "other.txt").write_text("ignored")
+        assert [item["ts"] for item in read(str(tmp_path))] == [0, 1, 2, 3, 4]
+        assert list(read(str(tmp_path / "missing"))) == []
+
+    def test_cli_filters_by_test_and_level(self, tmp_path, capsys):
+        write_lines(tmp_path / "test_logs_main.jsonl", [
+            entry(1, "main"), entry(2, "main", level="WARNING"), entry(3, "main", test_id="test_tc2", level="ERROR")])
+        assert log_pipeline.main(["--directory", str(tmp_path), "--test", "test_tc1", "--level", "warning"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 1 and "main at 2" in lines[0]
@@ -0,0 +1,41 @@
+from utility.lpt_schedule import base_nodeid, group_name, group_units, lpt_bins, plan, unit_key
+
+MODULE = "tests/Test_Module.py"
+
+
+class Test_Lpt_Schedule:
+
+    def test_class_tests_share_a_unit(self):
+        assert unit_key(f"{MODULE}::Test_A::test_tc1") == f"{MODULE}::Test_A"
+        assert unit_key(f"{MODULE}::test_module_level") == f"{MODULE}::test_module_level"
+
+    def test_units_keep_collection_order(self):
+        nodeids = [f"{MODULE}::Test_B::test_1", f"{MODULE}::Test_A::test_1", f"{MODULE}::Test_B::test_2"]
+        units = group_units(nodeids)
+        assert list(units) == [f"{MODULE}::Test_B", f"{MODULE}::Test_A"]
+        assert units[f"{MODULE}::Test_B"] == [nodeids[0], nodeids[2]]
+
+    def test_longest_unit_goes_first_onto_least_loaded_bin(self):
+        bins, loads = lpt_bins({"a": 3.0, "b": 5.0, "c": 2.0, "d": 2.0}, 2)
+        assert bins == [["b", "d"], ["a", "c"]]
+        assert loads == [7.0, 5.0]
+
+    def test_at_least_one_bin(self):
+        bins, loads = lpt_bins({"a": 1.0}, 0)
+        assert bins == [["a"]] and loads == [1.0]
+
+    def test_plan_keeps_class_tests_together_and_in_order(self):
+        durations = {f"{MODULE}::Test_A::test_1": 4, f"{MODULE}::Test_A::test_2": 4, f"{MODULE}::Test_B::test_1": 5}
+        schedule = plan(list(durations), durations.get, workers=2)
+        assert schedule["bins"] == [[f"{MODULE}::Test_A::test_1", f"{MODULE}::Test_A::test_2"],
+                                    [f"{MODULE}::Test_B::test_1"]]
+        assert schedule["loads"] == [8.0, 5.0]
+        assert schedule["makespan"] == 8.0
+
+    def test_plan_of_no_tests(self):
+        assert plan([], lambda nodeid: 1.0)["makespan"] == 0.0
+
+    def test_only_the_group_suffix_is_stripped(self):
+        nodeid = f"{MODULE}::test_login[user@example.com]"
+        assert base_nodeid(f"{nodeid}@{group_name(3)}") == nodeid
+        assert base_nodeid(nodeid) == nodeid
@@ -0,0 +1,33 @@
+from utility.config_reader import get_config
+from utility.perf_budgets import PerfBudget, check_records, load_budgets, route_for_url
+
+ADMIN_URL = get_config("Menu_URLs", "admin")
+BUDGETS = {"admin": PerfBudget(1000, 2000, 0), "default": PerfBudget(5000, 0, 500)}
+
+
+class Test_Perf_Budgets:
+
+    def test_budgets_are_read_from_config(self):
+        budgets = load_budgets()
+        assert "default" in budgets
+        assert all(isinstance(budget, PerfBudget) for budget in budgets.values())
+
+    def test_url_maps_to_route_key(self):
+        assert route_for_url(f"{ADMIN_URL}/") == "admin"
+        assert route_for_url(f"{ADMIN_URL}#top") == "admin"
+        assert route_for_url("https://example.com/unknown") is None
+
+    def test_within_budget(self):
+        assert check_records([{"url": ADMIN_URL, "load_ms": 900, "tti_ms": 1500, "api_max_ms": 9000}], BUDGETS) == []
+
+    def test_each_exceeded_limit_is_reported(self):
+        violations = check_records([{"url": ADMIN_URL, "load_ms": 1200, "tti_ms": 2500, "api_max_ms": None}], BUDGETS)
+        assert violations == [f"admin ({ADMIN_URL}): load 1200 ms > budget 1000 ms",
+                              f"admin ({ADMIN_URL}): TTI 2500 ms > budget 2000 ms"]
+
+    def test_unknown_page_uses_default_budget(self):
+        violations = check_records([{"url": "https://example.com/other", "load_ms": 100, "api_max_ms": 800}], BUDGETS)
+        assert violations == ["default (https://example.com/other): API latency 800 ms > budget 500 ms"]
+
+    def test_no_budget_no_check(self):
+        assert check_records([{"url": "https://example.com/other", "load_ms": 99999}], {}) == []
@@ -0,0 +1,106 @@
+from selenium.webdriver.remote.command import Command
+from utility import query_cache
+from utility.query_cache import PageState, cached_query, is_plain
+
+
+class FakeExecutor:
+    """Stands in for the command executor: answers getCurrentUrl with `url`, everything else with None."""
+
+    def __init__(self, url="https://hrm.example.com/dashboard"):
+        self.url = url
+
+    def execute(self, command, params):
+        if command == Command.GET_CURRENT_URL:
+            return {"value": self.url}
+        return {"value": None}
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.command_executor = FakeExecutor()
+
+    def execute(self, command, params=None):
+        return self.command_executor.execute(command, params or {})
+
+
+class SamplePage:
+    """Page object with counted queries, like the Base_Page subclasses."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._query_cache = {}
+        self.calls = 0
+        self.answer = ["Admin", "PIM"]
+
+    @cached_query
+    def menu_labels(self):
+        self.calls += 1
+        return self.answer
+
+    @cached_query
+    def menu_elements(self):
+        self.calls += 1
+        return {"Admin": object()}
+
+
+def page(monkeypatch):
+    monkeypatch.setattr(query_cache, "is_enabled", lambda: True)
+    monkeypatch.setattr(query_cache, "get_current_test", lambda: "test_sample")
+    return SamplePage(FakeDriver())
+
+
+class Test_Query_Cache:
+
+    def test_result_is_reused_until_a_mutating_command(self, monkeypatch):
+        sample = page(monkeypatch)
+        assert sample.menu_labels() == sample.menu_labels()
+        assert sample.calls == 1
+        sample.driver.execute(Command.CLICK_ELEMENT, {"id": "1"})
+        sample.menu_labels()
+        assert sample.calls == 2
+        assert PageState.of(sample.driver).hits == 1
+
+    def test_read_only_scripts_keep_the_cache(self, monkeypatch):
+        sample = page(monkeypatch)
+        sample.menu_labels()
+        with query_cache.read_only(sample.driver):
+            sample.driver.execute(Command.W3C_EXECUTE_SCRIPT, {"script": "return 1"})
+        sample.menu_labels()
+        assert sample.calls == 1
+
+    def test_url_change_invalidates(self, monkeypatch):
+        sample = page(monkeypatch)
+        sample.driver.execute(Command.GET_CURRENT_URL)
+        sample.menu_labels()
+        sample.driver.execute(Command.GET_CURRENT_URL)
+        sample.menu_labels()
+        assert sample.calls == 1
+        sample.driver.command_executor.url = "https://hrm.example.com/pim"
+        sample.driver.execute(Command.GET_CURRENT_URL)
+        sample.menu_labels()
+        assert sample.calls == 2
+
+    def test_falsy_results_are_not_cached(self, monkeypatch):
+        sample = page(monkeypatch)
+        sample.answer = []
+        sample.menu_labels()
+        sample.menu_labels()
+        assert sample.calls == 2
+
+    def test_results_holding_elements_are_not_cached(self, monkeypatch):
+        sample = page(monkeypatch)
+        sample.menu_elements()
+        sample.menu_elements()
+        assert sample.calls == 2
+
+    def test_next_test_does_not_reuse_results(self, monkeypatch):
+        sample = page(monkeypatch)
+        sample.menu_labels()
+        monkeypatch.setattr(query_cache, "get_current_test", lambda: "test_other")
+        sample.menu_labels()
+        assert sample.calls == 2
+
+    def test_plain_values(self):
+        assert is_plain({"Admin": ["a", 1, True, None]})
+        assert not is_plain([object()])
@@ -0,0 +1,91 @@
+import json
+import time
+import zipfile
+from utility import trace_buffer
+from utility.trace_buffer import TraceBuffer
+
+
+class FakeDriver:
+    """Browser logs, DOM and screenshot of a failed test."""
+
+    current_url = "https://hrm.example.com/web/index.php/pim/viewEmployeeList"
+    page_source = "<html>final</html>"
+
+    def __init__(self, logs):
+        self.logs = logs
+
+    def get_log(self, log_type):
+        if log_type not in self.logs:
+            raise ValueError(f"log type '{log_type}' not found")
+        return self.logs[log_type]
+
+    def get_screenshot_as_png(self):
+        return b"png"
+
+
+def performance_entry(timestamp, method, params):
+    return {"timestamp": timestamp, "message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class Test_Trace_Buffer:
+
+    def test_ring_buffers_keep_the_newest_entries(self):
+        trace = TraceBuffer("tests/Test_Sample.py::test_one", max_steps=2, max_dom=1)
+        for number in range(3):
+            trace.step("click", f"button {number}")
+            trace.dom(f"https://hrm.example.com/web/index.php/page/{number}", "<html/>")
+        assert [target for _, _, target in trace.steps] == ["button 1", "button 2"]
+        assert [url for _, url, _ in trace.doms] == ["https://hrm.example.com/web/index.php/page/2"]
+
+    def test_network_rows_and_logs_of_this_test_only(self):
+        trace = TraceBuffer("test")
+        now = trace.started * 1000
+        driver = FakeDriver({
+            "browser": [{"timestamp": now - 5000, "level": "SEVERE", "message": "earlier test"},
+                        {"timestamp": now + 500, "level": "SEVERE", "message": "500 on /api"}],
+            "performance": [
+                performance_entry(now + 100, "Network.requestWillBeSent",
+                                  {"requestId": "1", "request": {"method": "GET", "url": "/api"}, "type": "XHR"}),
+                performance_entry(now + 200, "Network.responseReceived",
+                                  {"requestId": "1", "response": {"status": 500, "url": "/api"}}),
+                performance_entry(now + 300, "Page.frameNavigated", {}),
+            ],
+        })
+        assert [entry["message"] for entry in trace.console(driver)] == ["500 on /api"]
+        network = trace.network(driver)
+        assert len(network) == 1
+        assert network[0]["method"] == "GET" and network[0]["status"] == 500
+
+    def test_write_archive(self, tmp_path):
+        trace = TraceBuffer("tests/Test_Sample.py::test_one[row 1]")
+        trace.step("send_keys", "username")
+        trace.dom("https://hrm.example.com/web/index.php/dashboard/index", "<html>dashboard</html>")
+        path = trace.write(FakeDriver({"browser": []}), "AssertionError: boom", directory=str(tmp_path))
+        assert path.endswith("tests_Test_Sample.py_test_one_row_1.zip")
+        with zipfile.ZipFile(path) as archive:
+            assert sorted(archive.namelist()) == ["dom/01_dashboard_index.html", "dom/final.html",
+                                                  "screenshot.png", "trace.json"]
+            data = json.loads(archive.read("trace.json"))
+        assert data["error"] == "AssertionError: boom" and data["network"] == []
+        assert data["steps"][0]["action"] == "send_keys"
+
+    def test_write_without_driver(self, tmp_path):
+        trace = TraceBuffer("test")
+        with zipfile.ZipFile(trace.write(None, directory=str(tmp_path))) as archive:
+            assert archive.namelist() == ["trace.json"]
+
+    def test_module_functions_are_no_ops_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(trace_buffer, "is_enabled", lambda: False)
+        monkeypatch.setattr(trace_buffer, "_current", None)
+        assert trace_buffer.start("test") is None
+        trace_buffer.step("click", "button")
+        assert trace_buffer.current() is None and not trace_buffer.failure_screenshots_only()
+
+    def test_start_records_steps_of_the_running_test(self, monkeypatch):
+        monkeypatch.setattr(trace_buffer, "is_enabled", lambda: True)
+        # restored after the test, the buffer is module state
+        monkeypatch.setattr(trace_buffer, "_current", None)
+        trace = trace_buffer.start("test")
+        trace_buffer.step("click", ("xpath", "//button"))
+        assert trace.steps[0][1:] == ("click", "('xpath', '//button')")
+        assert trace.started <= time.time()
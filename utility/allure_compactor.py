@@ -0,0 +1,358 @@
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import logging
+import argparse
+import subprocess
+from utility.config_reader import get_config
+
+"""
+allure_compactor.py
+
+Keeps Reports/allure/allure-results small and the report build incremental.
+
+compact (run by conftest.py after a run that wrote results to --alluredir, when
+[Allure] compact_after_run = true):
+    - results of earlier runs are removed when this run has a result for the same
+      test (historyId); of tests not run now only the newest result is kept
+    - containers lose the children that no longer exist, empty ones are removed,
+      containers with the same fixtures (names, statuses, parameters) are merged
+    - attachments with identical content are stored once (references rewritten),
+      attachments no result / container refers to any more are removed
+
+report:
+    - full        → allure generate of the whole (compacted) results folder
+    - incremental → delta report of only the files added since the last build
+                    (build manifest) in [Allure] delta_report_dir, staged with the
+                    full report's history so trends continue; the full report is
+                    left as it is
+
+Example (from the project root):
+    python -m utility.allure_compactor compact
+    python -m utility.allure_compactor report --incremental
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+RESULT_SUFFIX = "-result.json"
+CONTAINER_SUFFIX = "-container.json"
+ATTACHMENT_MARK = "-attachment"
+# Keys that differ between otherwise identical fixture containers
+VOLATILE_KEYS = ("uuid", "children", "start", "stop")
+
+
+def _setting(key, default=None):
+    try:
+        return get_config("Allure", key)
+    except KeyError:
+        return default
+
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path, data):
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(temporary, path)
+
+
+def _attachment_refs(node):
+    """Every {"name", "source", "type"} attachment dict inside a result / container (steps included)."""
+    if isinstance(node, dict):
+        for attachment in node.get("attachments", []) or []:
+            yield attachment
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _attachment_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _attachment_refs(value)
+
+
+def _strip_volatile(node):
+    """Fixture content of a container without uuid / children / timing, to find duplicates."""
+    if isinstance(node, dict):
+        return {key: _strip_volatile(value) for key, value in node.items() if key not in VOLATILE_KEYS}
+    if isinstance(node, list):
+        return [_strip_volatile(value) for value in node]
+    return node
+
+
+def load(directory):
+    """{file name: data} of the results and containers, and the set of attachment file names."""
+    results, containers, attachments = {}, {}, set()
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        try:
+            if name.endswith(RESULT_SUFFIX):
+                results[name] = _read_json(path)
+            elif name.endswith(CONTAINER_SUFFIX):
+                containers[name] = _read_json(path)
+            elif ATTACHMENT_MARK in name:
+                attachments.add(name)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Allure file {path} skipped: {e}")
+    return results, containers, attachments
+
+
+def stale_results(results, run_started_ms=None):
+    """
+    File names of the results to remove: earlier runs of tests that have a result
+    in this run (start >= run_started_ms), else all but the newest result of the test.
+    """
+    by_test = {}
+    for name, result in results.items():
+        by_test.setdefault(result.get("historyId") or result.get("fullName") or name, []).append(name)
+
+    stale = set()
+    for names in by_test.values():
+        current = [name for name in names
+                   if run_started_ms is not None and results[name].get("start", 0) >= run_started_ms]
+        if current:
+            stale.update(name for name in names if name not in current)
+        else:
+            newest = max(names, key=lambda name: results[name].get("stop") or results[name].get("start", 0))
+            stale.update(name for name in names if name != newest)
+    return stale
+
+
+def has_results_since(directory, run_started):
+    """True when `directory` holds a result of a test started at / after `run_started` (epoch seconds)."""
+    if not os.path.isdir(directory):
+        return False
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        # Files older than the run cannot hold one of its results, skip reading them
+        if not name.endswith(RESULT_SUFFIX) or os.path.getmtime(path) < run_started:
+            continue
+        try:
+            if _read_json(path).get("start", 0) >= run_started * 1000:
+                return True
+        except (OSError, ValueError):
+            continue
+    return False
+
+
+def merge_containers(containers, live_uuids):
+    """
+    Returns ({file name: container} to keep, [empty], [merged duplicates]): children
+    filtered to live results, empty containers dropped, duplicates merged into the first one.
+    """
+    merged, empty, duplicates = {}, [], []
+    by_content = {}
+    for name in sorted(containers, key=lambda name: containers[name].get("start", 0)):
+        container = containers[name]
+        children = [child for child in container.get("children", []) if child in live_uuids]
+        if not children:
+            empty.append(name)
+            continue
+        key = json.dumps(_strip_volatile(container), sort_keys=True)
+        if key in by_content:
+            target = merged[by_content[key]]
+            target["children"] = list(dict.fromkeys(target["children"] + children))
+            target["start"] = min(target.get("start", 0), container.get("start", 0))
+            target["stop"] = max(target.get("stop", 0), container.get("stop", 0))
+            duplicates.append(name)
+        else:
+            by_content[key] = name
+            merged[name] = dict(container, children=children)
+    return merged, empty, duplicates
+
+
+def _digest(path):
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def compact(directory=None, run_started=None, dry_run=False):
+    """
+    Compacts an allure-results folder; `run_started` (epoch seconds) marks the
+    results of the current run. Returns the counts and the bytes freed.
+    """
+    directory = directory or _setting("results_dir", "Reports/allure/allure-results")
+    stats = {"results_removed": 0, "containers_merged": 0, "containers_removed": 0,
+             "attachments_deduplicated": 0, "attachments_removed": 0, "bytes_freed": 0}
+    if not os.path.isdir(directory):
+        return stats
+    start = time.perf_counter()
+    results, containers, attachments = load(directory)
+    to_delete = set()
+
+    # 1. Results of earlier runs
+    stale = stale_results(results, run_started * 1000 if run_started else None)
+    to_delete.update(stale)
+    stats["results_removed"] = len(stale)
+    live = {name: result for name, result in results.items() if name not in stale}
+    live_uuids = {result.get("uuid") for result in live.values()}
+
+    # 2. Containers
+    kept, empty, duplicates = merge_containers(containers, live_uuids)
+    to_delete.update(empty + duplicates)
+    stats["containers_removed"] = len(empty)
+    stats["containers_merged"] = len(duplicates)
+
+    # 3. Attachments: one file per distinct content, unreferenced ones removed
+    documents = {**live, **kept}
+    canonical, duplicate_sources, rewritten = {}, set(), set()
+    for name, document in documents.items():
+        for attachment in _attachment_refs(document):
+            source = attachment.get("source")
+            if source not in attachments:
+                continue
+            first = canonical.setdefault(_digest(os.path.join(directory, source)), source)
+            if first != source:
+                attachment["source"] = first
+                duplicate_sources.add(source)
+                rewritten.add(name)
+    unreferenced = attachments - set(canonical.values())
+    to_delete.update(unreferenced)
+    stats["attachments_deduplicated"] = len(duplicate_sources)
+    stats["attachments_removed"] = len(unreferenced - duplicate_sources)
+
+    for name in to_delete:
+        path = os.path.join(directory, name)
+        try:
+            stats["bytes_freed"] += os.path.getsize(path)
+            if not dry_run:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+    if not dry_run:
+        for name in rewritten | {name for name in kept if kept[name] != containers[name]}:
+            _write_json(os.path.join(directory, name), documents[name])
+
+    stats["elapsed_s"] = round(time.perf_counter() - start, 2)
+    logger.info(f"Allure results compacted: {stats}")
+    return stats
+
+
+# ------------------------------ report build ------------------------------
+def _manifest_path():
+    return _setting("manifest", "Reports/allure/build_manifest.json")
+
+
+def new_files(directory, manifest=None):
+    """Result / container / attachment files added since the last build (all of them without a manifest)."""
+    manifest = manifest or _manifest_path()
+    built = set(_read_json(manifest)["files"]) if os.path.exists(manifest) else set()
+    return sorted(name for name in os.listdir(directory)
+                  if os.path.isfile(os.path.join(directory, name)) and name not in built)
+
+
+def stage_incremental(directory, report_dir, staging):
+    """
+    Links the new results, the containers / attachments they need and the
+    previous report's history into `staging`. Returns the number of new results.
+    """
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    added = set(new_files(directory))
+    results, containers, _ = load(directory)
+    new_results = {name: result for name, result in results.items() if name in added}
+    uuids = {result.get("uuid") for result in new_results.values()}
+
+    needed = set(new_results)
+    needed.update(name for name, container in containers.items() if uuids & set(container.get("children", [])))
+    for name in list(needed):
+        document = new_results.get(name) or containers[name]
+        needed.update(attachment["source"] for attachment in _attachment_refs(document) if attachment.get("source"))
+    # Report-wide files (environment.properties, categories.json, executor.json)
+    needed.update(name for name in os.listdir(directory) if ATTACHMENT_MARK not in name and
+                  (not name.endswith(".json") or name in ("categories.json", "executor.json")))
+
+    for name in needed:
+        source = os.path.join(directory, name)
+        if not os.path.isfile(source):
+            continue
+        target = os.path.join(staging, name)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+    _copy_history(report_dir, staging)
+    return len(new_results)
+
+
+def _copy_history(report_dir, results_dir):
+    """Previous report's history → results folder, so the new report keeps its trends."""
+    history = os.path.join(report_dir, "history")
+    if os.path.isdir(history):
+        shutil.copytree(history, os.path.join(results_dir, "history"), dirs_exist_ok=True)
+
+
+def build_report(incremental=False, directory=None, report_dir=None):
+    """
+    Runs `allure generate`; returns its exit code (2 when the Allure CLI is not installed).
+    Incremental builds only hold the new results, so they go to their own folder
+    ([Allure] delta_report_dir) and never replace the full report.
+    """
+    directory = directory or _setting("results_dir", "Reports/allure/allure-results")
+    full_report_dir = _setting("report_dir", "Reports/allure/allure-report")
+    if incremental:
+        report_dir = report_dir or _setting("delta_report_dir", "Reports/allure/allure-report-delta")
+    else:
+        report_dir = report_dir or full_report_dir
+    allure = shutil.which("allure")
+    if allure is None:
+        print("Allure command line not found: install it and put 'allure' on the PATH")
+        return 2
+
+    source = directory
+    if incremental:
+        source = f"{report_dir}.staging"
+        count = stage_incremental(directory, full_report_dir, source)
+        if not count:
+            print(f"No new results in {directory} since the last build")
+            return 0
+        print(f"Incremental build: delta report of {count} new results (full report: {full_report_dir})")
+    else:
+        _copy_history(report_dir, directory)
+
+    start = time.perf_counter()
+    completed = subprocess.run([allure, "generate", source, "-o", report_dir, "--clean"])
+    print(f"allure generate finished in {time.perf_counter() - start:.1f} s → {report_dir}")
+    if completed.returncode == 0:
+        manifest = _manifest_path()
+        os.makedirs(os.path.dirname(manifest) or ".", exist_ok=True)
+        _write_json(manifest, {"built": time.strftime("%Y-%m-%dT%H:%M:%S"), "mode": "incremental" if incremental
+                               else "full", "files": sorted(os.listdir(directory))})
+        if incremental:
+            shutil.rmtree(source, ignore_errors=True)
+    return completed.returncode
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utility.allure_compactor",
+                                     description="Compacts allure-results and builds the Allure report.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compact_parser = commands.add_parser("compact", help="remove earlier runs, merge containers, dedupe attachments")
+    compact_parser.add_argument("--results", default=None, help="results folder (default [Allure] results_dir)")
+    compact_parser.add_argument("--since", type=float, default=None,
+                                help="epoch seconds the current run started (default: keep the newest result per test)")
+    compact_parser.add_argument("--dry-run", action="store_true", help="only report what would be removed")
+    report_parser = commands.add_parser("report", help="allure generate, full or incremental")
+    report_parser.add_argument("--incremental", action="store_true", help="delta report of only the files added since the last build")
+    report_parser.add_argument("--results", default=None, help="results folder (default [Allure] results_dir)")
+    report_parser.add_argument("--output", default=None, help="report folder (default [Allure] report_dir, with --incremental delta_report_dir)")
+    args = parser.parse_args(argv)
+
+    if args.command == "compact":
+        stats = compact(args.results, args.since, args.dry_run)
+        print(", ".join(f"{key}={value}" for key, value in stats.items()))
+        return 0
+    return build_report(args.incremental, args.results, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import logging
+from contextlib import contextmanager
+
+"""
+browser_contexts.py
+
+Lightweight isolated browser contexts inside ONE browser process.
+Each context has its own cookies / storage (like a fresh incognito profile)
+but no extra browser start-up cost.
+
+    - Chrome / Edge → CDP Target.createBrowserContext + Target.createTarget
+    - Firefox       → WebDriver BiDi user contexts (driver_factory starts Firefox with BiDi enabled)
+
+The window handle of each context is the CDP target id / BiDi browsing
+context id, so page objects work in a context after switching to it.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+
+class BrowserContextsNotSupported(Exception):
+    """Raised when the driver supports neither CDP nor BiDi user contexts."""
+
+
+class BrowserContextPool:
+    """
+    Opens N isolated contexts (one tab each) and switches between them.
+
+    Example:
+        with BrowserContextPool(driver) as pool:
+            handles = pool.open(3)
+            for handle in handles:
+                pool.switch(handle)
+                ...
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.origin = None
+        # window handle → CDP browserContextId / BiDi user context id
+        self.contexts = {}
+
+        if hasattr(driver, "execute_cdp_cmd"):
+            self.protocol = "cdp"
+        elif driver.capabilities.get("webSocketUrl"):
+            self.protocol = "bidi"
+        else:
+            raise BrowserContextsNotSupported(
+                f"{driver.name} supports neither CDP nor BiDi user contexts")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self, count, url="about:blank"):
+        """Creates `count` isolated contexts and returns their window handles."""
+        if self.origin is None:
+            self.origin = self.driver.current_window_handle
+
+        handles = []
+        for _ in range(count):
+            if self.protocol == "cdp":
+                context_id = self.driver.execute_cdp_cmd(
+                    "Target.createBrowserContext", {"disposeOnDetach": True})["browserContextId"]
+                handle = self.driver.execute_cdp_cmd(
+                    "Target.createTarget", {"url": url, "browserContextId": context_id})["targetId"]
+            else:
+                context_id = self.driver.browser.create_user_context()
+                handle = self.driver.browsing_context.create(type="tab", user_context=context_id)
+                if url != "about:blank":
+                    self.switch(handle)
+                    self.driver.get(url)
+            self.contexts[handle] = context_id
+            handles.append(handle)
+
+        # Let the driver pick up the targets created outside WebDriver
+        self.driver.window_handles
+        logger.info(f"Opened {count} isolated browser contexts via {self.protocol.upper()}")
+        return handles
+
+    def switch(self, handle):
+        """Makes the context's tab the current WebDriver window."""
+        self.driver.switch_to.window(handle)
+
+    @contextmanager
+    def use(self, handle):
+        """Switches to a context for the duration of a `with` block."""
+        self.switch(handle)
+        try:
+            yield self.driver
+        finally:
+            if self.origin is not None:
+                self.driver.switch_to.window(self.origin)
+
+    def close(self):
+        """Disposes every context (tabs, cookies, storage) and returns to the original window."""
+        if self.origin is not None:
+            self.driver.switch_to.window(self.origin)
+        for handle, context_id in self.contexts.items():
+            try:
+                if self.protocol == "cdp":
+                    self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+                else:
+                    self.driver.browser.remove_user_context(context_id)
+            except Exception as e:
+                logger.error(f"Failed to dispose browser context {context_id}: {e}")
+        if self.contexts:
+            logger.info(f"Closed {len(self.contexts)} isolated browser contexts")
+        self.contexts.clear()
@@ -0,0 +1,111 @@
+import time
+import logging
+from collections import defaultdict
+from selenium.webdriver.remote.command import Command
+
+"""
+command_counter.py
+
+Counts every WebDriver HTTP command sent by a driver, grouped by type,
+together with the time spent waiting for each round-trip.
+Used by conftest.py to record the command count / latency of each test and
+to enforce the optional per-test command budgets.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# WebDriver command name → reported command type
+COMMAND_TYPES = {
+    Command.FIND_ELEMENT: "findElement",
+    Command.FIND_ELEMENTS: "findElement",
+    Command.FIND_CHILD_ELEMENT: "findElement",
+    Command.FIND_CHILD_ELEMENTS: "findElement",
+    Command.GET_ELEMENT_TEXT: "getText",
+    Command.CLICK_ELEMENT: "click",
+    Command.W3C_EXECUTE_SCRIPT: "executeScript",
+    Command.W3C_EXECUTE_SCRIPT_ASYNC: "executeScript",
+    Command.SCREENSHOT: "screenshot",
+    Command.ELEMENT_SCREENSHOT: "screenshot",
+}
+
+
+class CommandCounter:
+    """
+    Wraps `driver.command_executor.execute` and counts commands by type.
+
+    Example:
+        counter = CommandCounter.attach(driver)
+        mark = counter.snapshot()
+        ... test steps ...
+        stats = counter.since(mark)   # {"total": 42, "latency_ms": 812.4, "by_type": {...}}
+    """
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+        self.latency = defaultdict(float)
+
+    @classmethod
+    def attach(cls, driver):
+        """Installs the counter on the driver's command executor and returns it."""
+        counter = cls()
+        executor = driver.command_executor
+        original_execute = executor.execute
+
+        def counting_execute(command, params):
+            start = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                counter.record(command, time.perf_counter() - start)
+
+        executor.execute = counting_execute
+        logger.info("WebDriver command counter attached")
+        return counter
+
+    def record(self, command, seconds):
+        """Adds one command of the given WebDriver name to the totals."""
+        command_type = COMMAND_TYPES.get(command, "other")
+        self.counts[command_type] += 1
+        self.latency[command_type] += seconds
+
+    def snapshot(self):
+        """Returns a copy of the current totals, to be passed to since()."""
+        return dict(self.counts), dict(self.latency)
+
+    def since(self, mark):
+        """
+        Returns the commands issued after `mark`:
+            {"total": int, "latency_ms": float, "by_type": {type: {"count": int, "latency_ms": float}}}
+        """
+        counts, latency = mark
+        by_type = {}
+        for command_type, count in self.counts.items():
+            delta = count - counts.get(command_type, 0)
+            if delta:
+                by_type[command_type] = {
+                    "count": delta,
+                    "latency_ms": round((self.latency[command_type] - latency.get(command_type, 0.0)) * 1000, 1),
+                }
+        return {
+            "total": sum(item["count"] for item in by_type.values()),
+            "latency_ms": round(sum(item["latency_ms"] for item in by_type.values()), 1),
+            "by_type": by_type,
+        }
+
+
+class CommandBudgetWarning(UserWarning):
+    """Raised (as a warning) when a test issues more commands than its budget allows."""
+
+
+def budget_violations(stats, max_commands=0, max_latency_ms=0):
+    """
+    Compares the stats of one test with its budget (0 = no limit).
+    Returns a list of human readable violations, empty when within budget.
+    """
+    violations = []
+    if max_commands and stats["total"] > max_commands:
+        violations.append(f"{stats['total']} WebDriver commands > budget {max_commands}")
+    if max_latency_ms and stats["latency_ms"] > max_latency_ms:
+        violations.append(f"{stats['latency_ms']} ms WebDriver latency > budget {max_latency_ms} ms")
+    return violations
@@ -1,3 +1,4 @@
+import os
 from configparser import ConfigParser
 
 # Create a ConfigParser instance to read the configuration file
@@ -17,3 +18,30 @@ def get_config(section, key):
 
     # Return the specific value from the given section and key
     return config[section][key]
+
+def set_base_url(base_url):
+    """
+     Points every URL of config.ini to another OrangeHRM instance
+     (local stand-in, staging, ...). The URLs are written for
+     [Environment] base_url, which is replaced by the new one.
+
+     Example:
+         set_base_url('http://localhost:8080')
+         get_config('Login_Orange', 'url')
+         'http://localhost:8080/web/index.php/auth/login'
+     """
+    if not config.has_section("Environment"):
+        return
+    current = config["Environment"]["base_url"].rstrip("/")
+    new = base_url.rstrip("/")
+    if new == current:
+        return
+    for section in config.sections():
+        for key, value in config[section].items():
+            if value.startswith(current):
+                config[section][key] = new + value[len(current):]
+    config["Environment"]["base_url"] = new
+
+# The HRM_BASE_URL environment variable overrides [Environment] base_url
+if os.environ.get("HRM_BASE_URL"):
+    set_base_url(os.environ["HRM_BASE_URL"])
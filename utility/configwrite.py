@@ -12,10 +12,29 @@ def create_config():
     """
         Creates a configuration file 'config.ini' with sections for:
         - browser configuration
+        - environment (base URL of the OrangeHRM instance)
         - login page details
         - Excel details
         - Dashboard page details
         - Menu URL details
+        - Page performance capture details & budgets
+        - Browser memory / CPU sampling details
+        - DOM snapshot details (offline locator validation)
+        - Locator audit details
+        - Locator fallback chain details
+        - Page query cache details
+        - Failure trace details
+        - Screencast recording details
+        - Logging pipeline details
+        - Allure results compaction / report build details
+        - Lite HTML report details
+        - Longest-first test scheduling details
+        - Test data pool details
+        - Bulk user creation load scenario details
+        - Leave assignment load scenario details
+        - Claim submission load scenario details
+        - Load generator CLI details
+        - Navigation validation details
         - Add User details
         - Password reset details
         - My Info URL details
@@ -32,6 +51,12 @@ def create_config():
         "browser":"chrome"
     }
 
+    # OrangeHRM instance the URLs below point to
+    # (HRM_BASE_URL environment variable → local stand-in / staging instead)
+    config["Environment"] = {
+        "base_url": "https://opensource-demo.orangehrmlive.com"
+    }
+
     # Login page details
     config["Login_Orange"] = {
         "url": "https://opensource-demo.orangehrmlive.com/web/index.php/auth/login"
@@ -62,6 +87,247 @@ def create_config():
         "Dashboard":"https://opensource-demo.orangehrmlive.com/web/index.php/dashboard/index"
     }
 
+    # Page performance capture (Navigation Timing, Web Vitals)
+    config["Perf"] = {
+        "enabled": "true",
+        # fail → budget violations fail the test as PERF-FAILED, warn → only reported
+        "budget_mode": "fail"
+    }
+
+    # Page performance budgets per route key of Menu_URLs / MYINFO_URLS
+    # value → max load ms, max time-to-interactive ms, max API latency ms (0 = no limit)
+    config["Perf_Budgets"] = {
+        "default": "8000, 10000, 3000",
+        "admin": "8000, 10000, 3000",
+        "pim": "8000, 10000, 3000",
+        "leave": "8000, 10000, 3000",
+        "time": "8000, 10000, 3000",
+        "recruitment": "8000, 10000, 3000",
+        "myinfo": "8000, 10000, 3000",
+        "performance": "8000, 10000, 3000",
+        "dashboard": "8000, 10000, 3000",
+        "personal_details": "8000, 10000, 3000",
+        "contact_details": "8000, 10000, 3000",
+        "emergency_contacts": "8000, 10000, 3000",
+        "dependents": "8000, 10000, 3000",
+        "immigration": "8000, 10000, 3000",
+        "job": "8000, 10000, 3000",
+        "salary": "8000, 10000, 3000",
+        "report_to": "8000, 10000, 3000",
+        "qualifications": "8000, 10000, 3000",
+        "memberships": "8000, 10000, 3000"
+    }
+
+    # Browser memory / CPU sampling at test boundaries (Chrome / Edge)
+    config["Resource_Sampler"] = {
+        "enabled": "true",
+        # growth during ONE test that flags it as leaking
+        "leak_heap_mb": "20",
+        "leak_nodes": "2000",
+        "leak_listeners": "500",
+        # page JS heap / browser RSS growth since the browser started that trigger a recycle
+        "recycle_heap_mb": "400",
+        "recycle_rss_mb": "1000",
+        # heap over the limit → driver (new browser session) or tab (fresh tab only);
+        # RSS growth always restarts the browser session
+        "recycle_mode": "driver"
+    }
+
+    # DOM snapshots of the visited pages for utility/locator_validator.py
+    config["DOM_Snapshots"] = {
+        # off by default: every capture is a page_source round-trip, a hash and a file write
+        "enabled": "false",
+        "directory": "Reports/dom_snapshots",
+        # when to capture: navigation (wait_for_url), test_end, click (before every click, slower)
+        "events": "navigation, test_end",
+        # seconds to wait for the page to render (no loader, main content present) before capturing
+        "ready_timeout": "5",
+        # newest distinct DOMs kept per page
+        "max_per_page": "20"
+    }
+
+    # Locator evaluation cost audit (python -m utility.locator_audit)
+    config["Locator_Audit"] = {
+        # evaluations per locator and page
+        "repeat": "50",
+        # one row per locator and run, tracked over time
+        "history": "Reports/locator_audit/history.csv"
+    }
+
+    # Fallback strategies of Locator chains (utility/locator_registry.py)
+    config["Locator_Registry"] = {
+        "enabled": "true",
+        # strategy hit counts of all runs, the last successful strategy is tried first
+        "stats_path": "Reports/locator_stats.json"
+    }
+
+    # Memoized page queries, reused until a state-changing command or URL change (utility/query_cache.py)
+    config["Query_Cache"] = {
+        "enabled": "true"
+    }
+
+    # Failure-only trace archive of each test (utility/trace_buffer.py)
+    config["Trace"] = {
+        "enabled": "true",
+        "directory": "Reports/traces",
+        # ring buffer sizes: Base_Page steps, DOMs, console / network entries
+        "max_steps": "200",
+        "max_dom_snapshots": "3",
+        "max_log_entries": "500",
+        # Chromium network events (performance log) in the trace, opt-in: it turns on the
+        # chromedriver performance log for every session
+        "capture_network": "false",
+        # all → attach_save_screenshot always attaches, failure (opt-in) → only the trace of a failed test has one
+        "screenshots": "all"
+    }
+
+    # Screen recording kept only for failed tests, opt-in (utility/screencast.py)
+    config["Screencast"] = {
+        "enabled": "false",
+        # ring buffer: frames kept per second, seconds and MB in memory
+        "max_fps": "5",
+        "max_seconds": "60",
+        "max_buffer_mb": "64",
+        # JPEG quality / size of the frames sent by the browser
+        "quality": "50",
+        "max_width": "1280",
+        "max_height": "720",
+        # CPU of the receiving thread (fraction of one core) before frames are skipped
+        "cpu_cap": "0.15",
+        # clip size on disk, frames are thinned out above it
+        "max_clip_mb": "20",
+        "directory": "Reports/screencasts"
+    }
+
+    # Queued JSON-lines logging, one rotating file per xdist worker (utility/log_pipeline.py)
+    config["Logging"] = {
+        "level": "INFO",
+        "directory": "Reports/logs",
+        # a file is rotated when it reaches max_mb or is rotate_hours old, backup_count old files kept
+        "max_mb": "10",
+        "rotate_hours": "24",
+        "backup_count": "5",
+        # text copy of every record on the terminal
+        "console": "true"
+    }
+
+    # Allure results compaction after the run and report build manifest (utility/allure_compactor.py)
+    config["Allure"] = {
+        # opt-in: after a run that wrote results to --alluredir, old results, empty / duplicate
+        # containers and duplicate / orphaned attachments are removed from that folder
+        "compact_after_run": "false",
+        "results_dir": "Reports/allure/allure-results",
+        "report_dir": "Reports/allure/allure-report",
+        # 'report --incremental' writes a report of only the new results here, report_dir stays complete
+        "delta_report_dir": "Reports/allure/allure-report-delta",
+        # files already in the last report, for 'report --incremental'
+        "manifest": "Reports/allure/build_manifest.json"
+    }
+
+    # HTML report: full = pytest-html file of pytest.ini, lite = streamed index.html with sidecar assets (utility/lite_report.py)
+    config["HTML_Report"] = {
+        "mode": "full",
+        "directory": "Reports/html/lite",
+        # captured log lines per sidecar page, loaded one page at a time
+        "log_page_lines": "200"
+    }
+
+    # Longest-first test scheduling from historical durations
+    config["Scheduling"] = {
+        "enabled": "true",
+        "db_path": "Reports/durations.db",
+        # passing runs per test used for its estimate (median)
+        "history": "5",
+        # estimate of a test when no history exists yet
+        "default_seconds": "30"
+    }
+
+    # Unique test data per worker / run (false → fixed values of the sections below)
+    config["Data_Pool"] = {
+        "enabled": "true",
+        # admin account used for API data setup and the cleanup at session end
+        "admin_username": "Admin",
+        "admin_password": "admin123",
+        "username_prefix": "Test",
+        "employee_first_name": "Pool",
+        # first leave date handed out = today + offset (weekdays only)
+        "leave_start_offset_days": "30",
+        # the date cursor starts over after this many days (stays inside the leave periods)
+        "leave_horizon_days": "180",
+        "lease_dir": "Reports/data_pool",
+        "cleanup": "true"
+    }
+
+    # Bulk user creation load scenario (pytest --load)
+    config["Load_User_Creation"] = {
+        "users": "20",
+        # parallel browser sessions
+        "sessions": "4",
+        "headless": "true",
+        # name:weight, cycled over the created users
+        "role_mix": "ESS:3, Admin:1",
+        "status_mix": "Enabled:4, Disabled:1",
+        "max_error_rate": "0.05"
+    }
+
+    # Leave assignment load scenario (pytest --load)
+    config["Load_Leave"] = {
+        "leaves": "40",
+        "sessions": "4",
+        # leased employees the leaves are spread over
+        "employees": "4",
+        "headless": "true",
+        "leave_types": "CAN - Personal, CAN - Vacation, US - Personal, US - Vacation",
+        # leave length cycles through 1..max_days weekdays
+        "max_days": "3",
+        # Leave List search after every N assignments of a session
+        "search_every": "5",
+        "max_error_rate": "0.05",
+        "assign_url": "https://opensource-demo.orangehrmlive.com/web/index.php/leave/assignLeave",
+        "list_url": "https://opensource-demo.orangehrmlive.com/web/index.php/leave/viewLeaveList"
+    }
+
+    # Multi-expense claim submission load scenario (pytest --load)
+    config["Load_Claim"] = {
+        # one row per expense line, rows with the same claim_id form one claim
+        "data": "testdata/claim_expenses.csv",
+        # parallel sessions, each logged in as its own ESS employee
+        "sessions": "3",
+        # times the claim table is submitted
+        "repeat": "1",
+        "headless": "true",
+        "max_error_rate": "0.05",
+        "submit_url": "https://opensource-demo.orangehrmlive.com/web/index.php/claim/submitClaim"
+    }
+
+    # Load generator CLI (python -m scenarios.loadgen), command line options override these
+    config["Load_Generator"] = {
+        # flow:weight list, flows: login, browse_menu, user_search, leave_list
+        "mix": "login:1, browse_menu:2, user_search:2, leave_list:1",
+        # virtual users, started one after another over ramp_up seconds
+        "users": "10",
+        "ramp_up": "30",
+        # total run time in seconds, pause between two iterations of a user
+        "duration": "120",
+        "think_time": "1",
+        # browser → headless WebDriver per user, http → HTTP-level replay of the flows
+        "mode": "browser",
+        # seconds between two rows of the live table / CSV
+        "interval": "5",
+        "username": "Admin",
+        "password": "admin123",
+        "csv": "Reports/load/loadgen.csv",
+        "max_error_rate": "0.05"
+    }
+
+    # Navigation validation details
+    config["Navigation"] = {
+        # menu items / My Info tabs checked by click navigation (0 = all)
+        "click_sample": "3",
+        # tabs loading at the same time during concurrent URL validation
+        "max_tabs": "5"
+    }
+
     # Add User details
     config["Add_new_user"]= {
         "new_username":"Test0981",
@@ -0,0 +1,263 @@
+import os
+import json
+import time
+import logging
+import secrets
+from datetime import date, timedelta
+from utility.config_reader import get_config
+from utility.file_lock import FileLock
+from utility.hrm_api import HRMApiClient, HRMApiError, base_url_from
+
+"""
+data_pool.py
+
+Unique test data for parallel and repeated runs, so workers and reruns do not
+collide on the same user, employee or leave dates:
+    - usernames  → prefix + run id + worker + counter (never reused)
+    - employees (optionally with an ESS login) → created through the OrangeHRM API for the lease
+    - leave date ranges → weekdays handed out from a cursor shared by all
+      workers and runs (file lock in [Data_Pool] lease_dir); past
+      leave_horizon_days the cursor starts over, so dates stay in the leave periods
+Everything created is deleted and the leaves assigned by this session (register_leave)
+are cancelled in bulk through the API at session end, so the dates can be handed
+out again. Leaves of other users of a shared instance are never touched.
+With [Data_Pool] enabled = false the fixed config.ini values are returned.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+BASE36 = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _base36(number):
+    digits = ""
+    while number:
+        number, remainder = divmod(number, 36)
+        digits = BASE36[remainder] + digits
+    return digits or "0"
+
+
+class DataPool:
+    """
+    One pool per pytest process (worker).
+
+    Example:
+        pool = DataPool()
+        username = pool.lease_username()            # 'Testk3f9a2c1w01'
+        employee = pool.lease_employee()            # 'Pool k3f9a2c1w02'
+        from_date, to_date = pool.lease_date_range(days=1)
+        ... create the user, assign the leave ...
+        pool.register_user(username)
+        pool.register_leave(employee, from_date, to_date)
+        pool.cleanup()                              # at session end
+    """
+
+    def __init__(self, worker=None, run_id=None):
+        self.enabled = get_config("Data_Pool", "enabled").lower() == "true"
+        self.worker = worker or os.environ.get("PYTEST_XDIST_WORKER", "main")
+        # Same run id for all workers when HRM_RUN_ID is exported by the CI job
+        self.run_id = run_id or os.environ.get("HRM_RUN_ID") or _base36(int(time.time())) + secrets.token_hex(1)
+        self.lease_dir = get_config("Data_Pool", "lease_dir")
+        self.counter = 0
+        self.api = None
+        # Set after the first failed API call → no login retry for every lease
+        self.api_error = None
+
+        # Created during this session → deleted by cleanup()
+        self.created_users = []
+        self.created_employees = []
+        # full name → empNumber of the employees created for this session
+        self.employee_numbers = {}
+        # (employee name, from_date, to_date) of the leaves assigned → cancelled by cleanup()
+        self.assigned_leaves = []
+
+    # NAMES
+    def _unique_tag(self):
+        """run id + worker + counter, e.g. 'k3f9a2c1w01' (worker gw0 → w0, no xdist → m)."""
+        self.counter += 1
+        worker = self.worker.replace("gw", "w") if self.worker != "main" else "m"
+        return f"{self.run_id}{worker}{self.counter}"
+
+    def lease_username(self):
+        """Username that exists nowhere yet."""
+        if not self.enabled:
+            return get_config("Add_new_user", "new_username")
+        username = f"{get_config('Data_Pool', 'username_prefix')}{self._unique_tag()}"
+        logger.info(f"Leased username {username}")
+        return username
+
+    def register_user(self, username):
+        """Marks a system user created by a test for the cleanup at session end."""
+        if self.enabled:
+            self.created_users.append(username)
+
+    def _create_employee(self):
+        """Creates a fresh employee through the API → (full name, empNumber)."""
+        first_name = get_config("Data_Pool", "employee_first_name")
+        last_name = self._unique_tag()
+        employee = self._api().post("pim/employees", {
+            "firstName": first_name, "middleName": "", "lastName": last_name, "empPicture": None})["data"]
+        self.created_employees.append(employee["empNumber"])
+        self.employee_numbers[f"{first_name} {last_name}"] = employee["empNumber"]
+        logger.info(f"Leased employee {first_name} {last_name} (empNumber {employee['empNumber']})")
+        return f"{first_name} {last_name}", employee["empNumber"]
+
+    def lease_employee(self):
+        """
+        Creates a fresh employee through the API and returns its full name.
+        Falls back to the config.ini employee when the API is not reachable.
+        """
+        if not self.enabled or self.api_error:
+            return get_config("Add_new_user", "emp_name")
+        try:
+            return self._create_employee()[0]
+        except HRMApiError as e:
+            self.api_error = e
+            logger.warning(f"Employee could not be created ({e}) → using the config.ini employee")
+            return get_config("Add_new_user", "emp_name")
+
+    def lease_ess_user(self):
+        """
+        Creates a fresh employee with an enabled ESS login through the API and
+        returns (username, password). Falls back to the [claim] employee login
+        of config.ini when the API is not reachable.
+        """
+        fallback = get_config("claim", "emp_username"), get_config("claim", "emp_password")
+        if not self.enabled or self.api_error:
+            return fallback
+        username = self.lease_username()
+        password = get_config("Add_new_user", "new_password")
+        try:
+            _, emp_number = self._create_employee()
+            # userRoleId 2 → ESS
+            self._api().post("admin/users", {"username": username, "password": password, "status": True,
+                                             "userRoleId": 2, "empNumber": emp_number})
+        except HRMApiError as e:
+            self.api_error = e
+            logger.warning(f"ESS user could not be created ({e}) → using the config.ini employee login")
+            return fallback
+        self.created_users.append(username)
+        return username, password
+
+    # DATES
+    @staticmethod
+    def _weekdays(start, days):
+        """The first `days` weekdays from `start` on."""
+        weekdays, cursor = [], start
+        while len(weekdays) < days:
+            if cursor.weekday() < 5:
+                weekdays.append(cursor)
+            cursor += timedelta(days=1)
+        return weekdays
+
+    def lease_date_range(self, days=1):
+        """
+        Returns (from_date, to_date) as 'YYYY-MM-DD' covering `days` weekdays that
+        no other worker has leased since the cursor last started over.
+        """
+        if not self.enabled:
+            return get_config("Leave_Data", "from_date"), get_config("Leave_Data", "to_date")
+
+        os.makedirs(self.lease_dir, exist_ok=True)
+        state_path = os.path.join(self.lease_dir, "date_leases.json")
+        with FileLock(os.path.join(self.lease_dir, "date_leases.lock")):
+            state = {}
+            if os.path.exists(state_path):
+                with open(state_path) as f:
+                    state = json.load(f)
+
+            earliest = date.today() + timedelta(days=int(get_config("Data_Pool", "leave_start_offset_days")))
+            latest = earliest + timedelta(days=int(get_config("Data_Pool", "leave_horizon_days")))
+            cursor = max(earliest, date.fromisoformat(state.get("next_date", earliest.isoformat())))
+            leased = self._weekdays(cursor, days)
+            if leased[-1] > latest:
+                # Back to the start: cleanup() of the earlier sessions cancelled those leaves
+                logger.info(f"Leave date cursor passed {latest} → starting over at {earliest}")
+                leased = self._weekdays(earliest, days)
+
+            state["next_date"] = (leased[-1] + timedelta(days=1)).isoformat()
+            with open(state_path, "w") as f:
+                json.dump(state, f)
+
+        from_date, to_date = leased[0].isoformat(), leased[-1].isoformat()
+        logger.info(f"Leased leave dates {from_date} → {to_date} ({self.worker})")
+        return from_date, to_date
+
+    def register_leave(self, employee, from_date, to_date):
+        """Marks a leave assigned by a test (employee full name, leased dates) for the cancel at session end."""
+        if self.enabled:
+            self.assigned_leaves.append((employee, from_date, to_date))
+
+    # API SESSION
+    def _api(self):
+        """Admin API session, opened on first use."""
+        if self.api is None:
+            self.api = HRMApiClient(base_url_from(get_config("Login_Orange", "url")),
+                                    get_config("Data_Pool", "admin_username"),
+                                    get_config("Data_Pool", "admin_password")).login()
+        return self.api
+
+    # CLEANUP
+    def _employee_number(self, api, name):
+        """empNumber of an employee: known for the ones created here, looked up by full name otherwise."""
+        if name in self.employee_numbers:
+            return self.employee_numbers[name]
+        for employee in api.get("pim/employees", nameOrId=name, limit=50)["data"]:
+            if f"{employee['firstName']} {employee['lastName']}" == name:
+                self.employee_numbers[name] = employee["empNumber"]
+                return employee["empNumber"]
+        return None
+
+    def _cancel_leaves(self, api):
+        """
+        Cancels the pending / scheduled leave requests this session assigned: same
+        employee and exactly the registered dates, returns how many.
+        """
+        request_ids = set()
+        for employee, from_date, to_date in self.assigned_leaves:
+            emp_number = self._employee_number(api, employee)
+            if emp_number is None:
+                logger.warning(f"Employee {employee} not found, leave {from_date} → {to_date} not cancelled")
+                continue
+            # status 1 = pending approval, 2 = scheduled
+            requests = api.get("leave/employees/leave-requests", fromDate=from_date, toDate=to_date,
+                               empNumber=emp_number, includeEmployees="onlyCurrent", limit=50,
+                               **{"statuses[]": [1, 2]})["data"]
+            for request in requests:
+                dates = request["dates"]
+                # Single-day requests have no toDate
+                if request["employee"]["empNumber"] == emp_number and dates["fromDate"] == from_date \
+                        and (dates.get("toDate") or dates["fromDate"]) == to_date:
+                    request_ids.add(request["id"])
+        if request_ids:
+            api.put("leave/employees/leave-requests/bulk",
+                    {"data": [{"leaveRequestId": request_id, "action": "CANCEL"} for request_id in sorted(request_ids)]})
+        return len(request_ids)
+
+    def cleanup(self):
+        """
+        Cancels the leaves assigned in this session and deletes every user and
+        employee created in it (bulk API calls, never raises).
+        """
+        if not (self.created_users or self.created_employees or self.assigned_leaves):
+            return
+        if get_config("Data_Pool", "cleanup").lower() != "true":
+            logger.info(f"Data pool cleanup disabled, keeping users {self.created_users}")
+            return
+        try:
+            api = self._api()
+            # Before the employees are deleted: leaves of deleted employees are no longer listed
+            cancelled = self._cancel_leaves(api) if self.assigned_leaves else 0
+            user_ids = [user["id"] for username in self.created_users
+                        for user in api.get("admin/users", username=username, limit=50)["data"]
+                        if user["userName"] == username]
+            if user_ids:
+                api.delete("admin/users", {"ids": user_ids})
+            if self.created_employees:
+                api.delete("pim/employees", {"ids": self.created_employees})
+            logger.info(f"Data pool cleanup: cancelled {cancelled} leaves, deleted {len(user_ids)} users, "
+                        f"{len(self.created_employees)} employees")
+        except HRMApiError as e:
+            logger.error(f"Data pool cleanup failed: {e}")
+        self.created_users, self.created_employees, self.assigned_leaves = [], [], []
@@ -0,0 +1,219 @@
+import re
+import logging
+from collections import OrderedDict
+import pytest
+
+"""
+dependency_graph.py
+
+Declarative dependencies between tests and explicit data handoff.
+
+    @depends_on("tc05")
+    def test_tc06_validate_new_user_in_search(self, setup, handoff):
+        username = handoff.get("tc05", "username")
+
+The test id is taken from the test name (test_tc05__create_... → "tc05", leading
+zeros do not matter) and is resolved inside the same test module. conftest.py builds the dependency
+graph at collection time:
+    - cycles and unknown prerequisites are reported before anything runs
+    - an id used by several test functions of a module (test_tc1_a / test_tc1_b)
+      is reported; those tests are tracked by their full name and cannot be a
+      prerequisite, so one failing does not mark the other as unmet
+    - tests are put in a stable topological order
+    - a prerequisite and its dependents share one scheduling unit (xdist group),
+      independent branches can run on different workers
+    - dependents are skipped as soon as a prerequisite fails or is skipped
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+TEST_ID_PATTERN = re.compile(r"^test_?(tc)_?(\d+)", re.IGNORECASE)
+
+
+class DependencyError(Exception):
+    """Raised when the declared test dependencies cannot be resolved."""
+
+
+class DependencyCycleError(DependencyError):
+    """Raised when the declared test dependencies contain a cycle."""
+
+
+def depends_on(*test_ids):
+    """Declares the tests (e.g. "tc05") that must pass before this test runs."""
+    return pytest.mark.depends_on(*test_ids)
+
+
+def normalize_id(name):
+    """'TC05', 'tc_05' and 'tc5' are the same test id → 'tc5'."""
+    match = TEST_ID_PATTERN.match(f"test_{name}")
+    return f"tc{int(match.group(2))}" if match else name.lower()
+
+
+def dependency_id(item):
+    """Test id of a pytest item, inferred from its name ('test_tc05__create...' → 'tc5')."""
+    name = getattr(item, "originalname", None) or item.name
+    match = TEST_ID_PATTERN.match(name)
+    return f"tc{int(match.group(2))}" if match else name
+
+
+def _key(item, id_value):
+    """Graph node: (module path, test id), so ids are only resolved inside one module."""
+    return item.nodeid.split("::")[0], id_value
+
+
+def _function(item):
+    """Test function name without the parametrize id."""
+    return getattr(item, "originalname", None) or item.name
+
+
+class DependencyGraph:
+    """
+    DAG of the collected tests.
+
+    Example:
+        graph = DependencyGraph(items)
+        items[:] = graph.ordered(items)
+        graph.prerequisites(item)   # [(module, "tc5")]
+        graph.key(item)             # (module, "tc5") → failed / skipped tests are recorded under it
+    """
+
+    def __init__(self, items):
+        # (module, test id) used by more than one test function → their names
+        functions = {}
+        for item in items:
+            functions.setdefault(_key(item, dependency_id(item)), set()).add(_function(item))
+        self.ambiguous = {node: sorted(names) for node, names in functions.items() if len(names) > 1}
+        for (module, id_value), names in self.ambiguous.items():
+            logger.warning(f"Test id '{id_value}' is used by {', '.join(names)} in {module} "
+                           f"→ tracked by full test name, cannot be used in @depends_on")
+
+        # graph node → items with that id (parametrized tests share one id)
+        self.nodes = OrderedDict()
+        for item in items:
+            self.nodes.setdefault(self.key(item), []).append(item)
+
+        # graph node → set of prerequisite nodes
+        self.edges = {node: set() for node in self.nodes}
+        for node, node_items in self.nodes.items():
+            for item in node_items:
+                for marker in item.iter_markers("depends_on"):
+                    for prerequisite in marker.args:
+                        prerequisite_node = (node[0], normalize_id(prerequisite))
+                        if prerequisite_node in self.ambiguous:
+                            raise DependencyError(
+                                f"{item.nodeid} depends on '{prerequisite}', which names several tests: "
+                                f"{', '.join(self.ambiguous[prerequisite_node])} → rename one of them")
+                        if prerequisite_node not in self.nodes:
+                            logger.warning(f"{item.nodeid} depends on '{prerequisite}' which is not collected "
+                                           f"→ dependency ignored for this run")
+                            continue
+                        self.edges[node].add(prerequisite_node)
+        self._check_cycles()
+
+    def _check_cycles(self):
+        """Depth-first search; raises DependencyCycleError with the cycle path."""
+        state = {}
+
+        def visit(node, path):
+            state[node] = "visiting"
+            for prerequisite in sorted(self.edges[node]):
+                if state.get(prerequisite) == "visiting":
+                    cycle = path[path.index(prerequisite):] + [prerequisite]
+                    raise DependencyCycleError("Test dependency cycle: " + " → ".join(n[1] for n in cycle))
+                if prerequisite not in state:
+                    visit(prerequisite, path + [prerequisite])
+            state[node] = "done"
+
+        for node in self.nodes:
+            if node not in state:
+                visit(node, [node])
+
+    def key(self, item):
+        """Graph node of an item: (module, test id), (module, function name) when the id is ambiguous."""
+        node = _key(item, dependency_id(item))
+        return _key(item, _function(item)) if node in self.ambiguous else node
+
+    def prerequisites(self, item):
+        """Graph nodes the item depends on."""
+        return sorted(self.edges.get(self.key(item), ()))
+
+    def ordered(self, items):
+        """
+        Stable topological order: tests keep the given order unless one of their
+        prerequisites comes later, then they move right behind it.
+        """
+        placed = set()
+        remaining = list(items)
+        result = []
+        while remaining:
+            for index, item in enumerate(remaining):
+                node = self.key(item)
+                # Every item of a prerequisite (all parametrizations) must be placed first
+                ready = all(all(i in placed for i in self.nodes[p]) for p in self.edges[node])
+                if ready:
+                    result.append(remaining.pop(index))
+                    placed.add(item)
+                    break
+            else:
+                # Prerequisites outside `items` → keep the rest as it is
+                result.extend(remaining)
+                break
+        return result
+
+    def unit_of(self, base_unit):
+        """
+        Returns {nodeid: scheduling unit}: the base unit of a test (e.g. its class)
+        merged with every unit it is linked to by dependencies, so a prerequisite
+        and its dependents always run in the same process.
+        """
+        parent = {}
+
+        def find(unit):
+            parent.setdefault(unit, unit)
+            while parent[unit] != unit:
+                parent[unit] = parent[parent[unit]]
+                unit = parent[unit]
+            return unit
+
+        for node, prerequisites in self.edges.items():
+            for prerequisite in prerequisites:
+                parent[find(base_unit(self.nodes[node][0].nodeid))] = \
+                    find(base_unit(self.nodes[prerequisite][0].nodeid))
+        return {item.nodeid: find(base_unit(item.nodeid))
+                for node_items in self.nodes.values() for item in node_items}
+
+
+class DataHandoff:
+    """
+    Explicit data passing between dependent tests (per pytest process).
+
+    Example:
+        handoff.publish("username", new_username)               # in tc05
+        handoff.get("tc05", "username", default="Test0981")     # in tc06
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.current = None
+
+    def bind(self, item, key=None):
+        """Makes `publish` store values under the given test (`key`: its DependencyGraph.key)."""
+        self.current = key or _key(item, dependency_id(item))
+        return self
+
+    def publish(self, key, value):
+        """Makes a value produced by the running test available to its dependents."""
+        self.data.setdefault(self.current, {})[key] = value
+        logger.info(f"Handoff: {self.current[1]} published '{key}'")
+
+    def get(self, producer, key, default=None):
+        """
+        Returns a value published by `producer` in the same module. Falls back to
+        `default` when the producer did not run in this session (e.g. selected with -k).
+        """
+        value = self.data.get((self.current[0], normalize_id(producer)), {}).get(key)
+        if value is None:
+            logger.info(f"Handoff: nothing published for {producer}.{key} → using default")
+            return default
+        return value
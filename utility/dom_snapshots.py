@@ -0,0 +1,162 @@
+import os
+import re
+import time
+import hashlib
+import logging
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from utility.config_reader import get_config
+from utility.test_context import get_current_test
+from utility import query_cache, trace_buffer
+
+"""
+dom_snapshots.py
+
+Store of the OrangeHRM (OXD) pages' HTML, captured during normal test runs so
+locators can be checked offline (utility/locator_validator.py, no browser).
+    - captured after every navigation (Base_Page.wait_for_url), at the end of
+      every test and optionally before every click (open dropdowns, dialogs)
+    - only once the SPA has rendered: no loader left and the main content
+      present, within [DOM_Snapshots] ready_timeout (skipped otherwise, a
+      skeleton DOM would make every locator look broken)
+    - one folder per page (URL path, ids replaced by 'n'), one file per
+      distinct DOM (content hash), the newest [DOM_Snapshots] max_per_page kept
+    - URL, test and capture time in a comment on the first line of the file
+Switched on/off by [DOM_Snapshots] enabled in config.ini (off by default: each
+capture costs a page_source round-trip, a hash and a file write).
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+HEADER_PATTERN = re.compile(r"<!-- snapshot url=(\S*) test=(\S*) captured=(\S*) -->")
+
+# True once the page has rendered: no table / form loader or spinner, main content (or login form) present
+READY_SCRIPT = """
+return !document.querySelector('.oxd-table-loader, .oxd-form-loader, .oxd-loading-spinner')
+    && !!document.querySelector('.oxd-layout-context > *, .orangehrm-login-container');
+"""
+
+
+def is_enabled(event="navigation"):
+    """True when snapshots are on and `event` (navigation, click, test_end) is in [DOM_Snapshots] events."""
+    try:
+        if get_config("DOM_Snapshots", "enabled").lower() != "true":
+            return False
+        events = [name.strip() for name in get_config("DOM_Snapshots", "events").split(",")]
+    except KeyError:
+        return False
+    return event in events
+
+
+def wait_until_rendered(driver, timeout=None):
+    """Waits up to [DOM_Snapshots] ready_timeout seconds for READY_SCRIPT; False when the page never got there."""
+    if timeout is None:
+        try:
+            timeout = float(get_config("DOM_Snapshots", "ready_timeout"))
+        except KeyError:
+            timeout = 5
+    # Read-only script: must not drop the cached page queries
+    with query_cache.read_only(driver):
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(lambda d: d.execute_script(READY_SCRIPT))
+        except TimeoutException:
+            return False
+    return True
+
+
+def page_key(url):
+    """https://host/web/index.php/pim/viewPersonalDetails/empNumber/7 → 'pim_viewPersonalDetails_empNumber_n'"""
+    path = url.split("/web/index.php/", 1)[-1].split("?")[0].split("#")[0]
+    parts = ["n" if part.isdigit() else part for part in path.strip("/").split("/") if part]
+    key = "_".join(parts) or "root"
+    return re.sub(r"[^A-Za-z0-9_.-]", "-", key)
+
+
+def capture(driver, event="navigation"):
+    """
+    Saves the current DOM of the page. Never raises: snapshots must not break a test.
+    Returns the snapshot path, or None when disabled / not rendered / unchanged / failed.
+    """
+    if not is_enabled(event):
+        return None
+    try:
+        if not wait_until_rendered(driver):
+            logger.info(f"DOM snapshot skipped, {driver.current_url} still loading")
+            return None
+        url = driver.current_url
+        html = driver.page_source
+    except Exception as e:
+        logger.error(f"DOM snapshot failed: {e}")
+        return None
+    # Already read → also kept for the failure trace of the test (utility/trace_buffer.py)
+    trace_buffer.dom(url, html)
+    return save(url, html, get_current_test())
+
+
+def save(url, html, test=None, directory=None):
+    """Writes one snapshot (skipped when the same DOM of the page is already stored)."""
+    directory = os.path.join(directory or get_config("DOM_Snapshots", "directory"), page_key(url))
+    digest = hashlib.sha1(html.encode("utf-8", "replace")).hexdigest()[:16]
+    path = os.path.join(directory, f"{digest}.html")
+    if os.path.exists(path):
+        # Same DOM seen again → keep it as the newest one
+        os.utime(path)
+        return None
+
+    os.makedirs(directory, exist_ok=True)
+    header = (f"<!-- snapshot url={url.replace(' ', '%20')} test={(test or '-').replace(' ', '_')} "
+              f"captured={time.strftime('%Y-%m-%dT%H:%M:%S')} -->\n")
+    # Write to a temporary file first, so xdist workers never read half a snapshot
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        f.write(header + html)
+    os.replace(temporary, path)
+    logger.info(f"DOM snapshot of {url} saved to {path}")
+    _evict(directory)
+    return path
+
+
+def _evict(directory):
+    """Keeps the newest [DOM_Snapshots] max_per_page snapshots of a page."""
+    keep = int(get_config("DOM_Snapshots", "max_per_page"))
+    snapshots = sorted((entry for entry in os.scandir(directory) if entry.name.endswith(".html")),
+                       key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in snapshots[keep:]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+def load(directory=None):
+    """
+    Returns every stored snapshot as a dict: page, path, url, test, html.
+
+    Example:
+        for snapshot in load():
+            print(snapshot["page"], snapshot["url"])
+    """
+    directory = directory or get_config("DOM_Snapshots", "directory")
+    snapshots = []
+    if not os.path.isdir(directory):
+        return snapshots
+    for page in sorted(os.listdir(directory)):
+        page_dir = os.path.join(directory, page)
+        if not os.path.isdir(page_dir):
+            continue
+        for name in sorted(os.listdir(page_dir)):
+            if not name.endswith(".html"):
+                continue
+            path = os.path.join(page_dir, name)
+            with open(path, encoding="utf-8") as f:
+                html = f.read()
+            match = HEADER_PATTERN.match(html)
+            snapshots.append({
+                "page": page,
+                "path": path,
+                "url": match.group(1) if match else "",
+                "test": match.group(2) if match else "",
+                "html": html,
+            })
+    return snapshots
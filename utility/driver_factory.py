@@ -0,0 +1,126 @@
+import logging
+from selenium import webdriver
+from selenium.webdriver.remote.command import Command
+
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.edge.service import Service as EdgeService
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.edge.options import Options as EdgeOptions
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from utility import trace_buffer
+
+"""
+driver_factory.py
+
+Creates the Selenium WebDriver of the configured browser (private / incognito
+mode, password manager popups disabled). Shared by the `setup` fixture of
+conftest.py and the load scenarios, which start several headless sessions.
+restart_session() replaces the browser of a driver in place (resource sampler recycle).
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+
+def create_driver(browser_name, headless=False):
+    """
+    Returns a new WebDriver for chrome, firefox or edge.
+
+    Example:
+        driver = create_driver("chrome", headless=True)
+    """
+    browser = browser_name.lower()
+
+    #  Launching Chrome
+    if browser == 'chrome':
+        logger.info("Initializing Chrome browser...")
+        options = ChromeOptions()
+        # Open browser in Incognito mode
+        options.add_argument("--incognito")
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+        # Disable password manager popup
+        options.add_experimental_option("prefs", {
+            "credentials_enable_service": False,
+            "profile.password_manager_enabled": False
+        })
+        # Console / network log kept by the browser, read only for failed tests (utility/trace_buffer.py)
+        if trace_buffer.is_enabled():
+            prefs = trace_buffer.logging_prefs()
+            options.set_capability("goog:loggingPrefs", prefs)
+            if "performance" in prefs:
+                options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+        # WebDriverManager auto-installs correct driver version
+        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+        logger.info("Launched Chrome browser in incognito mode")
+
+    #  Launching Firefox
+    elif browser == 'firefox':
+        logger.info("Initializing Firefox browser...")
+        options = FirefoxOptions()
+        # Open Firefox in private mode
+        options.set_preference("browser.privatebrowsing.autostart", True)
+        if headless:
+            options.add_argument("-headless")
+        # WebDriver BiDi socket → isolated user contexts of TC01 (utility/browser_contexts.py)
+        options.enable_bidi = True
+
+        driver = webdriver.Firefox(
+            service=FirefoxService(GeckoDriverManager().install()),
+            options=options
+        )
+        logger.info("Launched Firefox in private mode")
+
+    #  Launching Edge
+    elif browser == 'edge':
+        logger.info("Initializing Edge browser...")
+        options = EdgeOptions()
+        options.add_argument("--inprivate")
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+        driver = webdriver.Edge(
+            service=EdgeService(),
+            options=options
+        )
+        logger.info("Launched Edge in InPrivate mode")
+
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+
+    # Options of the session, for restart_session()
+    driver.requested_capabilities = options.to_capabilities()
+    return driver
+
+
+def restart_session(driver):
+    """
+    Replaces the browser of `driver` with a fresh one: the WebDriver session is
+    ended (every browser process exits) and a new one is started with the same
+    options on the same driver service. The driver object stays the same, so the
+    page objects, command counter and state bound to it keep working. Window
+    size, timeouts and the cookies of the current site are carried over, so the
+    login survives and the test goes on where it was.
+    """
+    url = driver.current_url
+    cookies = driver.get_cookies()
+    window = driver.get_window_rect()
+    timeouts = driver.timeouts
+
+    driver.execute(Command.QUIT)
+    driver.start_session(driver.requested_capabilities)
+
+    driver.set_window_rect(**window)
+    driver.timeouts = timeouts
+    # Cookies can only be set on a page of their domain
+    driver.get(url)
+    for cookie in cookies:
+        driver.add_cookie(cookie)
+    driver.get(url)
+    logger.info(f"Browser session restarted → {url}")
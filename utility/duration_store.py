@@ -0,0 +1,86 @@
+import os
+import time
+import sqlite3
+import logging
+from statistics import median
+
+"""
+duration_store.py
+
+Local SQLite history of test durations (setup + call + teardown) across runs.
+The estimate of a test is the median of its last `history` passing runs, so one
+slow / aborted run does not reorder the whole suite.
+Used by conftest.py for longest-processing-time-first scheduling.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS durations (
+    nodeid   TEXT NOT NULL,
+    seconds  REAL NOT NULL,
+    outcome  TEXT NOT NULL,
+    run_at   REAL NOT NULL
+)
+"""
+
+
+class DurationStore:
+    """
+    Example:
+        store = DurationStore("Reports/durations.db")
+        store.estimate("tests/Test_Login_Page_OrangeHRM.py::...::test_tc2_validate_url")   # 7.3
+        store.add(nodeid, 12.4, "passed")
+        store.flush()
+    """
+
+    def __init__(self, path, history=5, default_seconds=30.0):
+        self.path = path
+        self.history = history
+        self.default_seconds = default_seconds
+        self.pending = []
+        # Estimates are loaded once, so the durations of the running session
+        # do not change the prediction it was scheduled with
+        self.estimates = self._load_estimates()
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute(SCHEMA)
+        return connection
+
+    def _load_estimates(self):
+        """Returns {nodeid: median of the last `history` passing durations}."""
+        if not os.path.exists(self.path):
+            return {}
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT nodeid, seconds FROM durations WHERE outcome = 'passed' ORDER BY run_at DESC").fetchall()
+        per_test = {}
+        for nodeid, seconds in rows:
+            runs = per_test.setdefault(nodeid, [])
+            if len(runs) < self.history:
+                runs.append(seconds)
+        return {nodeid: median(runs) for nodeid, runs in per_test.items()}
+
+    def estimate(self, nodeid):
+        """Predicted duration of a test; unknown tests get the median of the known ones (or the default)."""
+        if nodeid in self.estimates:
+            return self.estimates[nodeid]
+        if self.estimates:
+            return median(self.estimates.values())
+        return self.default_seconds
+
+    def add(self, nodeid, seconds, outcome):
+        """Buffers the duration of one finished test, written by flush()."""
+        self.pending.append((nodeid, round(seconds, 3), outcome, time.time()))
+
+    def flush(self):
+        """Writes the buffered durations to the database."""
+        if not self.pending:
+            return
+        with self._connect() as connection:
+            connection.executemany("INSERT INTO durations VALUES (?, ?, ?, ?)", self.pending)
+        logger.info(f"Recorded {len(self.pending)} test durations in {self.path}")
+        self.pending = []
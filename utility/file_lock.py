@@ -0,0 +1,45 @@
+import os
+import time
+
+"""
+file_lock.py
+
+Cross-process lock on an exclusively created file, shared by the modules that
+merge state written by several xdist workers / runs (data_pool, locator_registry).
+"""
+
+
+class FileLock:
+    """
+    Cross-process lock based on an exclusively created lock file
+    (works for pytest-xdist workers and parallel runs on one machine).
+    """
+
+    def __init__(self, path, timeout=30, stale_after=120):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        deadline = time.time() + self.timeout
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return self
+            except FileExistsError:
+                # Lock left behind by a killed process
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(f"Could not acquire lock {self.path} within {self.timeout} s")
+                time.sleep(0.05)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
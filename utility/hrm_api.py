@@ -0,0 +1,112 @@
+import re
+import json
+import logging
+from http.cookiejar import CookieJar
+from urllib.parse import urlencode
+from urllib.request import build_opener, HTTPCookieProcessor, Request
+
+"""
+hrm_api.py
+
+Minimal client for the OrangeHRM 5 REST API (web/index.php/api/v2/...).
+Logs in through the regular login form (CSRF token + session cookie) and then
+sends JSON requests with that session. Used for test-data setup / cleanup that
+does not need to go through the UI, and by the HTTP mode of the load generator.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# <auth-login :token="&quot;...&quot;" ...> on the login page
+LOGIN_TOKEN_PATTERN = re.compile(r':token="&quot;([^&]+)&quot;"')
+
+
+class HRMApiError(Exception):
+    """Raised when a login or API call fails."""
+
+
+def base_url_from(url):
+    """https://host/web/index.php/auth/login → https://host"""
+    return url.split("/web/index.php")[0].rstrip("/")
+
+
+class HRMApiClient:
+    """
+    Example:
+        api = HRMApiClient("https://opensource-demo.orangehrmlive.com", "Admin", "admin123").login()
+        users = api.get("admin/users", username="Test0981")["data"]
+        api.delete("admin/users", {"ids": [user["id"] for user in users]})
+    """
+
+    def __init__(self, base_url, username, password, timeout=30):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.opener = build_opener(HTTPCookieProcessor(CookieJar()))
+
+    def login(self):
+        """Opens an authenticated session (a new one when called again), returns the client."""
+        self.opener = build_opener(HTTPCookieProcessor(CookieJar()))
+        try:
+            with self.opener.open(f"{self.base_url}/web/index.php/auth/login", timeout=self.timeout) as response:
+                match = LOGIN_TOKEN_PATTERN.search(response.read().decode("utf-8", "replace"))
+            if not match:
+                raise HRMApiError("CSRF token not found on the login page")
+
+            form = urlencode({"_token": match.group(1), "username": self.username, "password": self.password})
+            with self.opener.open(f"{self.base_url}/web/index.php/auth/validate", data=form.encode(),
+                                  timeout=self.timeout) as response:
+                logged_in = "/auth/login" not in response.geturl()
+        except HRMApiError:
+            raise
+        except Exception as e:
+            raise HRMApiError(f"API login to {self.base_url} failed: {e}") from e
+        if not logged_in:
+            raise HRMApiError(f"API login failed for '{self.username}'")
+        logger.info(f"API session opened as '{self.username}' on {self.base_url}")
+        return self
+
+    def request(self, method, path, payload=None, **params):
+        """Sends one JSON request to /web/index.php/api/v2/<path> and returns the decoded body."""
+        url = f"{self.base_url}/web/index.php/api/v2/{path}"
+        if params:
+            # lists → repeated keys, e.g. statuses[]=1&statuses[]=2
+            url += "?" + urlencode(params, doseq=True)
+        body = json.dumps(payload).encode() if payload is not None else None
+        request = Request(url, data=body, method=method,
+                          headers={"Content-Type": "application/json", "Accept": "application/json"})
+        try:
+            with self.opener.open(request, timeout=self.timeout) as response:
+                content = response.read()
+        except Exception as e:
+            raise HRMApiError(f"{method} {path} failed: {e}") from e
+        return json.loads(content) if content else {}
+
+    def page(self, url):
+        """
+        GETs a page of the web app with the session (HTTP-level replay of a page
+        load) and returns its size in bytes. A redirect to the login page means
+        the session is gone and raises HRMApiError.
+        """
+        try:
+            with self.opener.open(url, timeout=self.timeout) as response:
+                content = response.read()
+                final_url = response.geturl()
+        except Exception as e:
+            raise HRMApiError(f"GET {url} failed: {e}") from e
+        if "/auth/login" in final_url and "/auth/login" not in url:
+            raise HRMApiError(f"GET {url} redirected to the login page")
+        return len(content)
+
+    def get(self, path, **params):
+        return self.request("GET", path, **params)
+
+    def post(self, path, payload):
+        return self.request("POST", path, payload)
+
+    def put(self, path, payload):
+        return self.request("PUT", path, payload)
+
+    def delete(self, path, payload):
+        return self.request("DELETE", path, payload)
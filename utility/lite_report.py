@@ -0,0 +1,303 @@
+import os
+import re
+import html
+import time
+import shutil
+import logging
+import zipfile
+from utility.config_reader import get_config
+from utility.test_context import get_current_test
+from utility.lpt_schedule import base_nodeid
+
+"""
+lite_report.py
+
+Compact HTML report for large runs (pytest --report-mode=lite), written instead
+of the pytest-html file of pytest.ini:
+    - index.html is streamed: one small table row is appended (and flushed) as
+      soon as a test finished, so the report of a 1000-test run builds at constant
+      memory and opens instantly, also while the run is still going
+    - nothing is embedded: each test has a sidecar folder assets/<test>/ with
+        · log_001.txt, log_002.txt, ... → captured output / log / failure text,
+          [HTML_Report] log_page_lines lines per page
+        · *.png                         → screenshots (Base_Page.attach_save_screenshot; with
+                                          [Trace] screenshots = failure only the failure screenshot
+                                          taken from the trace archive)
+        · *.zip / *.mp4                 → failure trace, screencast clip
+      which the page loads only when the row is opened (one log page at a time)
+Settings in [HTML_Report] of config.ini.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+OUTCOME_ORDER = ("failed", "error", "perf-failed", "xpassed", "xfailed", "skipped", "passed")
+
+HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8"/>
+<title>{title}</title>
+<style>
+body {{ font-family: Helvetica, Arial, sans-serif; font-size: 13px; margin: 16px; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 6px; text-align: left; vertical-align: top; }}
+tr.hidden {{ display: none; }}
+.passed .outcome {{ color: #2e7d32; }} .skipped .outcome, .xfailed .outcome {{ color: #8d6e63; }}
+.failed .outcome, .error .outcome, .perf-failed .outcome, .xpassed .outcome {{ color: #c62828; font-weight: bold; }}
+#summary span {{ margin-right: 12px; cursor: pointer; }} #summary span.off {{ opacity: 0.35; }}
+iframe {{ width: 100%; height: 420px; border: 1px solid #ccc; background: #fafafa; }}
+img {{ max-width: 420px; margin: 4px; border: 1px solid #ccc; }}
+</style>
+<script>
+function details(button) {{
+  var row = button.closest("tr");
+  if (row.nextElementSibling && row.nextElementSibling.className === "details") {{
+    row.parentNode.removeChild(row.nextElementSibling);
+    return;
+  }}
+  var dir = row.dataset.dir, pages = parseInt(row.dataset.pages, 10), cell = document.createElement("td");
+  cell.colSpan = 4;
+  if (pages) {{
+    cell.innerHTML = '<div><button>&lt;</button> page <b>1</b> / ' + pages + ' <button>&gt;</button></div><iframe></iframe>';
+    var frame = cell.querySelector("iframe"), label = cell.querySelector("b"), page = 1;
+    var show = function (n) {{
+      page = Math.min(Math.max(n, 1), pages);
+      label.textContent = page;
+      frame.src = dir + "/log_" + ("00" + page).slice(-3) + ".txt";
+    }};
+    cell.querySelectorAll("button")[0].onclick = function () {{ show(page - 1); }};
+    cell.querySelectorAll("button")[1].onclick = function () {{ show(page + 1); }};
+    show(1);
+  }}
+  (row.dataset.files ? row.dataset.files.split("|") : []).forEach(function (name) {{
+    var url = dir + "/" + encodeURIComponent(name);
+    cell.insertAdjacentHTML("beforeend", /\\.png$/.test(name)
+      ? '<a href="' + url + '"><img src="' + url + '"/></a>'
+      : '<div><a href="' + url + '">' + name + '</a></div>');
+  }});
+  var details = document.createElement("tr");
+  details.className = "details";
+  details.appendChild(cell);
+  row.parentNode.insertBefore(details, row.nextSibling);
+}}
+document.addEventListener("DOMContentLoaded", function () {{
+  var rows = document.querySelectorAll("tr.result"), counts = {{}};
+  rows.forEach(function (row) {{ counts[row.dataset.outcome] = (counts[row.dataset.outcome] || 0) + 1; }});
+  var summary = document.getElementById("summary");
+  summary.textContent = rows.length + " tests: ";
+  Object.keys(counts).forEach(function (outcome) {{
+    var toggle = document.createElement("span");
+    toggle.className = outcome;
+    toggle.innerHTML = '<span class="outcome">' + counts[outcome] + " " + outcome + "</span>";
+    toggle.onclick = function () {{
+      toggle.classList.toggle("off");
+      rows.forEach(function (row) {{
+        if (row.dataset.outcome === outcome) row.classList.toggle("hidden", toggle.classList.contains("off"));
+      }});
+    }};
+    summary.appendChild(toggle);
+  }});
+}});
+</script>
+</head>
+<body>
+<h1>{title}</h1>
+<p>Started {started}. Rows are added as tests finish; reload to see the latest.</p>
+<p id="summary"></p>
+<table>
+<tr><th>Result</th><th>Test</th><th>Duration</th><th></th></tr>
+"""
+
+ROW = ('<tr class="result {outcome}" data-outcome="{outcome}" data-dir="{dir}" data-pages="{pages}" '
+       'data-files="{files}"><td class="outcome">{outcome}</td><td>{nodeid}</td><td>{duration:.2f} s</td>'
+       '<td><button onclick="details(this)">details</button></td></tr>\n')
+
+
+def _setting(key, default):
+    try:
+        return get_config("HTML_Report", key)
+    except KeyError:
+        return default
+
+
+def _slug(nodeid):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")[-150:]
+
+
+def outcome_of(reports):
+    """One outcome for setup + call + teardown, the worst one wins."""
+    outcomes = set()
+    for report in reports:
+        if hasattr(report, "wasxfail"):
+            outcomes.add("xfailed" if report.skipped else "xpassed")
+        elif getattr(report, "perf_failed", False):
+            outcomes.add("perf-failed")
+        elif report.failed:
+            outcomes.add("failed" if report.when == "call" else "error")
+        else:
+            outcomes.add(report.outcome)
+    return next(outcome for outcome in OUTCOME_ORDER if outcome in outcomes | {"passed"})
+
+
+class LiteReport:
+    """
+    Streaming index.html + sidecar assets of one run (written by the pytest
+    controller; xdist workers only write screenshots / archives into assets/).
+
+    Example:
+        report = LiteReport("Reports/html/lite")
+        report.open()
+        report.add("tests/Test_Login.py::test_tc1", [setup_report, call_report, teardown_report])
+        report.close()
+    """
+
+    def __init__(self, directory, page_lines=200):
+        self.directory = directory
+        self.page_lines = page_lines
+        self.path = os.path.join(directory, "index.html")
+        self.started = time.time()
+        self.tests = 0
+        self._file = None
+
+    def open(self):
+        """Removes the previous run's report and writes the page head."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(os.path.join(self.directory, "assets"), exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write(HEAD.format(title="Test report", started=time.strftime("%d-%b-%Y %H:%M:%S")))
+        self._file.flush()
+
+    def _write_log_pages(self, folder, reports):
+        """Captured sections and failure text of the test → log_NNN.txt pages, returns the page count."""
+        lines, seen = [], set()
+        for report in reports:
+            # Later phases repeat the captured sections of the earlier ones
+            for title, content in report.sections:
+                if (title, content) in seen:
+                    continue
+                seen.add((title, content))
+                lines.append(f"----- {title} -----")
+                lines.extend(content.splitlines())
+            if report.failed or report.skipped:
+                lines.append(f"----- {report.when} {report.outcome} -----")
+                lines.extend(report.longreprtext.splitlines())
+        pages = [lines[start:start + self.page_lines] for start in range(0, len(lines), self.page_lines)]
+        for number, page in enumerate(pages, start=1):
+            with open(os.path.join(folder, f"log_{number:03d}.txt"), "w", encoding="utf-8") as f:
+                f.write("\n".join(page))
+        return len(pages)
+
+    def add(self, nodeid, reports):
+        """Writes the sidecar log pages of a finished test and appends its row."""
+        folder = asset_dir(nodeid, self.directory)
+        os.makedirs(folder, exist_ok=True)
+        pages = self._write_log_pages(folder, reports)
+        files = sorted(name for name in os.listdir(folder) if not name.startswith("log_"))
+        self._file.write(ROW.format(outcome=outcome_of(reports), dir=f"assets/{_slug(nodeid)}", pages=pages,
+                                    files=html.escape("|".join(files)), nodeid=html.escape(nodeid),
+                                    duration=sum(report.duration for report in reports)))
+        self._file.flush()
+        self.tests += 1
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.write(f"</table>\n<p>{self.tests} tests in {time.time() - self.started:.1f} s</p>\n"
+                         f"</body>\n</html>\n")
+        self._file.close()
+        self._file = None
+        logger.info(f"Lite HTML report written to {self.path}")
+
+
+# Report of this run (None unless --report-mode=lite) and the reports of unfinished tests
+_enabled = False
+_report = None
+_pending = {}
+
+
+def configure(config):
+    """
+    Reads --report-mode (default [HTML_Report] mode). In lite mode the pytest-html
+    file is switched off and the controller opens the streaming report.
+    Returns True in lite mode.
+    """
+    global _enabled, _report
+    mode = (config.getoption("report_mode", None) or _setting("mode", "full")).lower()
+    _enabled = mode == "lite"
+    if not _enabled:
+        return False
+    config.option.htmlpath = None
+    if not hasattr(config, "workerinput"):
+        _report = LiteReport(_setting("directory", "Reports/html/lite"), int(_setting("log_page_lines", 200)))
+        _report.open()
+    return True
+
+
+def asset_dir(nodeid, directory=None):
+    """Sidecar folder of a test, the same for the worker that ran it and the controller writing its row."""
+    return os.path.join(directory or _setting("directory", "Reports/html/lite"), "assets", _slug(base_nodeid(nodeid)))
+
+
+def record(report):
+    """Collects setup / call / teardown of a test, the row is written after its teardown."""
+    if _report is None:
+        return
+    nodeid = base_nodeid(report.nodeid)
+    _pending.setdefault(nodeid, []).append(report)
+    if report.when == "teardown":
+        try:
+            _report.add(nodeid, _pending.pop(nodeid))
+        except OSError as e:
+            logger.error(f"Lite report row of {nodeid} not written: {e}")
+
+
+def screenshot(name, png):
+    """Stores a screenshot of the running test as a sidecar file (no-op unless in lite mode)."""
+    nodeid = get_current_test()
+    if not _enabled or nodeid is None:
+        return
+    folder = asset_dir(nodeid)
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, f"{_slug(name)}.png"), "wb") as f:
+        f.write(png)
+
+
+def attach(path):
+    """Links a file of the running test (trace archive, screencast clip) into its sidecar folder."""
+    nodeid = get_current_test()
+    if not _enabled or nodeid is None or not os.path.isfile(path):
+        return
+    folder = asset_dir(nodeid)
+    os.makedirs(folder, exist_ok=True)
+    target = os.path.join(folder, os.path.basename(path))
+    try:
+        os.link(path, target)
+    except OSError:
+        shutil.copy2(path, target)
+    if path.endswith(".zip"):
+        _extract_trace_screenshot(path, folder)
+
+
+def _extract_trace_screenshot(path, folder):
+    """The failure trace's screenshot as its own PNG, shown inline (the only one with [Trace] screenshots = failure)."""
+    try:
+        with zipfile.ZipFile(path) as archive:
+            if "screenshot.png" not in archive.namelist():
+                return
+            png = archive.read("screenshot.png")
+    except (OSError, zipfile.BadZipFile):
+        return
+    with open(os.path.join(folder, "failure_screenshot.png"), "wb") as f:
+        f.write(png)
+
+
+def close():
+    """Writes the end of the streaming report (no-op unless in lite mode)."""
+    if _report is not None:
+        _report.close()
+
+
+def report_path():
+    """index.html of this run, None when not in lite mode or in an xdist worker."""
+    return _report.path if _report is not None else None
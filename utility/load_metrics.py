@@ -0,0 +1,177 @@
+import os
+import json
+import math
+import time
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+"""
+load_metrics.py
+
+Thread-safe metrics of a load scenario:
+    - per-step latency distribution (min / mean / p50 / p90 / p95 / p99 / max)
+    - completed and failed iterations → throughput per minute and error rate
+    - optional samples tagged with a volume (e.g. leave count), to see how
+      latency changes as data grows
+Used by the scenarios/ flows and the load tests.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (None for an empty list)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def distribution(values):
+    """Summary of a list of latencies in ms."""
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "min_ms": round(min(values), 1),
+        "mean_ms": round(sum(values) / len(values), 1),
+        "p50_ms": round(percentile(values, 50), 1),
+        "p90_ms": round(percentile(values, 90), 1),
+        "p95_ms": round(percentile(values, 95), 1),
+        "p99_ms": round(percentile(values, 99), 1),
+        "max_ms": round(max(values), 1),
+    }
+
+
+class LoadMetrics:
+    """
+    Example:
+        metrics = LoadMetrics("user_creation")
+        with metrics.iteration():
+            with metrics.step("save"):
+                adminpage.save_user()
+        metrics.summary()   # {"completed": 1, "per_minute": ..., "steps": {"save": {...}}, ...}
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.steps = defaultdict(list)
+        # step → [(volume, ms), ...]
+        self.volume_samples = defaultdict(list)
+        self.completed = 0
+        self.failed = 0
+        self.errors = defaultdict(int)
+        self.started = None
+        self.finished = None
+
+    def start(self):
+        self.started = time.perf_counter()
+
+    def stop(self):
+        self.finished = time.perf_counter()
+
+    def record(self, step, elapsed_ms, volume=None):
+        """Adds one latency sample of a step."""
+        with self.lock:
+            self.steps[step].append(elapsed_ms)
+            if volume is not None:
+                self.volume_samples[step].append((volume, elapsed_ms))
+
+    @contextmanager
+    def step(self, name, volume=None):
+        """Times the wrapped block as one sample of step `name` (failed steps are not recorded)."""
+        start = time.perf_counter()
+        yield
+        self.record(name, (time.perf_counter() - start) * 1000, volume)
+
+    @contextmanager
+    def iteration(self):
+        """
+        One unit of work (e.g. one user created). Exceptions are counted as
+        errors by type and swallowed, so the session goes on with the next one.
+        """
+        if self.started is None:
+            self.start()
+        try:
+            yield
+        except Exception as e:
+            self.fail(type(e).__name__)
+            logger.error(f"{self.name} iteration failed: {type(e).__name__}: {e}")
+        else:
+            with self.lock:
+                self.completed += 1
+
+    def complete(self, count=1):
+        """Counts `count` iterations as completed (for callers that time iterations themselves)."""
+        with self.lock:
+            self.completed += count
+
+    def fail(self, error, count=1):
+        """Counts `count` iterations as failed without running them (e.g. the session could not start)."""
+        with self.lock:
+            self.failed += count
+            self.errors[error] += count
+
+    def summary(self):
+        """Throughput, error rate and the latency distribution of every step."""
+        elapsed = ((self.finished or time.perf_counter()) - self.started) if self.started else 0
+        total = self.completed + self.failed
+        return {
+            "scenario": self.name,
+            "duration_s": round(elapsed, 1),
+            "completed": self.completed,
+            "failed": self.failed,
+            "error_rate": round(self.failed / total, 4) if total else 0.0,
+            "per_minute": round(self.completed / elapsed * 60, 2) if elapsed else 0.0,
+            "errors": dict(self.errors),
+            "steps": {step: distribution(values) for step, values in self.steps.items()},
+        }
+
+    def by_volume(self, step, buckets=5):
+        """
+        Latency of a step as volume grows: the samples are split into `buckets`
+        volume ranges, each with its own distribution.
+        """
+        samples = sorted(self.volume_samples.get(step, []))
+        if not samples:
+            return []
+        size = max(1, -(-len(samples) // buckets))
+        return [dict(distribution([ms for _, ms in chunk]),
+                     volume_from=chunk[0][0], volume_to=chunk[-1][0])
+                for chunk in (samples[i:i + size] for i in range(0, len(samples), size))]
+
+    def table(self):
+        """Plain-text table of the step distributions, used for logs and Allure."""
+        summary = self.summary()
+        lines = [f"{self.name}: {summary['completed']} ok, {summary['failed']} failed "
+                 f"(error rate {summary['error_rate']:.1%}), {summary['per_minute']} / min in {summary['duration_s']} s",
+                 f"{'step':<24} {'count':>6} {'p50 ms':>9} {'p90 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+        for step, dist in summary["steps"].items():
+            if dist["count"]:
+                lines.append(f"{step:<24} {dist['count']:>6} {dist['p50_ms']:>9} {dist['p90_ms']:>9} "
+                             f"{dist['p95_ms']:>9} {dist['p99_ms']:>9} {dist['max_ms']:>9}")
+        return "\n".join(lines)
+
+    def volume_table(self, step, buckets=5):
+        """Plain-text table of by_volume(step)."""
+        lines = [f"{step} latency by volume",
+                 f"{'volume':>13} {'count':>6} {'p50 ms':>9} {'p90 ms':>9} {'max ms':>9}"]
+        for row in self.by_volume(step, buckets):
+            lines.append(f"{row['volume_from']:>6}-{row['volume_to']:<6} {row['count']:>6} "
+                         f"{row['p50_ms']:>9} {row['p90_ms']:>9} {row['max_ms']:>9}")
+        return "\n".join(lines)
+
+    def write(self, directory="Reports/load"):
+        """Writes the summary (and volume samples) to Reports/load/<scenario>.json."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.name}.json")
+        data = dict(self.summary(), volume={step: self.by_volume(step) for step in self.volume_samples})
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        logger.info(f"Load metrics written to {path}")
+        return path
@@ -0,0 +1,385 @@
+import gc
+import os
+import re
+import csv
+import sys
+import time
+import logging
+import argparse
+from collections import defaultdict
+from lxml import etree, html as lxml_html
+from selenium.webdriver.common.by import By
+from utility.config_reader import config, get_config
+from utility import dom_snapshots
+from utility.locator_validator import collect, to_xpath
+from utility.locator_registry import to_css
+
+"""
+locator_audit.py
+
+Evaluation cost of every locator of locators/locators.py, to find and fix the
+expensive XPath patterns (following::, //child::, (...)[n], /../..):
+    - snapshot timing → lxml evaluation on the stored DOM snapshots (no browser)
+    - live timing     → document.evaluate / querySelectorAll timed in Chrome on
+                        the login page and every [Menu_URLs] page (--live)
+    - suggestions     → CSS or shorter XPath rewrites, kept only when they match
+                        the same elements as the original on every snapshot
+    - history         → every run is appended to [Locator_Audit] history, the
+                        report shows the change against the previous run
+
+Example (from the project root):
+    python -m utility.locator_audit
+    python -m utility.locator_audit --live --top 15
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# Patterns that make an XPath slow or fragile → short flag shown in the report
+COST_PATTERNS = [
+    ("following", re.compile(r"(following|preceding)(-sibling)?::")),
+    ("child-axis", re.compile(r"child::")),
+    ("positional", re.compile(r"\)\s*\[\d+\]")),
+    ("parent", re.compile(r"/\.\.")),
+    ("text", re.compile(r"text\(\)")),
+    ("union", re.compile(r"\|")),
+    ("any-tag", re.compile(r"//\*")),
+]
+
+# Times every locator in the page: arguments[0] → [[by, value], ...], arguments[1] → repeat.
+# Returns [µs per evaluation, matches, error] per locator.
+LIVE_TIMING_SCRIPT = """
+var locators = arguments[0], repeat = arguments[1], results = [];
+locators.forEach(function (locator) {
+    var by = locator[0], value = locator[1], count = 0, start;
+    try {
+        start = performance.now();
+        for (var i = 0; i < repeat; i++) {
+            if (by === 'xpath') {
+                count = document.evaluate(value, document, null,
+                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+            } else {
+                count = document.querySelectorAll(value).length;
+            }
+        }
+        results.push([(performance.now() - start) * 1000 / repeat, count, null]);
+    } catch (e) {
+        results.push([null, 0, String(e)]);
+    }
+});
+return results;
+"""
+
+
+def cost_flags(by, value):
+    """Expensive / fragile patterns of a locator, e.g. ['following', 'text']."""
+    if by != By.XPATH:
+        return []
+    return [flag for flag, pattern in COST_PATTERNS if pattern.search(value)]
+
+
+# XPATH → CSS / SHORTER XPATH
+STEP_PATTERN = re.compile(r"(//|/)([A-Za-z*][\w-]*)((?:\[[^\[\]]+\])*)")
+PREDICATE_PATTERN = re.compile(r"\[([^\[\]]+)\]")
+ATTRIBUTE_PATTERN = re.compile(r"""^@([\w-]+)\s*=\s*(['"])(.*)\2$""")
+CONTAINS_PATTERN = re.compile(r"""^contains\(\s*@([\w-]+)\s*,\s*(['"])(.*)\2\s*\)$""")
+
+
+def _normalize(xpath):
+    """Removes blanks outside string literals: '// div[@class ='x']' → '//div[@class='x']'."""
+    parts = re.split(r"""('[^']*'|"[^"]*")""", xpath)
+    return "".join(part if index % 2 else re.sub(r"\s+(?=[/\[\]=@(),])|(?<=[/\[\]=@(,])\s+", "", part)
+                   for index, part in enumerate(parts))
+
+
+def _css_predicate(predicate):
+    """One XPath predicate → CSS attribute selectors, None when CSS cannot express it."""
+    selectors = []
+    for condition in re.split(r"\s+and\s+", predicate.strip()):
+        attribute = ATTRIBUTE_PATTERN.match(condition)
+        contains = CONTAINS_PATTERN.match(condition)
+        if attribute:
+            name, value = attribute.group(1), attribute.group(3)
+            operator = "="
+        elif contains:
+            name, value = contains.group(1), contains.group(3)
+            operator = "*="
+        elif re.fullmatch(r"@[\w-]+", condition):
+            selectors.append(f"[{condition[1:]}]")
+            continue
+        else:
+            return None
+        quote = '"' if "'" in value else "'"
+        selectors.append(f"[{name}{operator}{quote}{value}{quote}]")
+    return "".join(selectors)
+
+
+def xpath_to_css(xpath):
+    """
+    CSS equivalent of an XPath made of tag / attribute steps only, else None.
+    '//ul[@class='oxd-main-menu']//li' → "ul[class='oxd-main-menu'] li"
+    """
+    xpath = _normalize(xpath)
+    if not xpath.startswith("//"):
+        return None
+    css, position = [], 0
+    for match in STEP_PATTERN.finditer(xpath):
+        if match.start() != position:
+            return None
+        position = match.end()
+        predicates = ""
+        for predicate in PREDICATE_PATTERN.findall(match.group(3)):
+            converted = _css_predicate(predicate)
+            if converted is None:
+                return None
+            predicates += converted
+        tag = "" if match.group(2) == "*" and predicates else match.group(2)
+        if css:
+            css.append(" " if match.group(1) == "//" else " > ")
+        css.append(tag + predicates)
+    if position != len(xpath) or not css:
+        return None
+    return "".join(css)
+
+
+def candidates(by, value):
+    """Rewrites of an XPath locator as [(by, value, note)], not yet verified."""
+    if by != By.XPATH:
+        return []
+    found = []
+    xpath = _normalize(value)
+    # (...)[1] → find_element already returns the first match
+    first = re.fullmatch(r"\((.*)\)\[1\]", xpath)
+    if first:
+        xpath = first.group(1)
+    # //x//child::li → //x//li
+    xpath = xpath.replace("/child::", "/")
+    # label/following::div[...][1] → the field sits in the label's wrapper sibling
+    following = re.fullmatch(r"(.*)/following::([\w*]+)((?:\[[^\[\]]+\])*?)\[1\]", xpath)
+    if following:
+        head, tag, predicates = following.groups()
+        found.append((By.XPATH, f"{head}/../following-sibling::*//{tag}{predicates}", "sibling instead of following::"))
+        found.append((By.XPATH, f"{head}/../..//{tag}{predicates}", "wrapper instead of following::"))
+    if xpath != _normalize(value):
+        found.append((By.XPATH, xpath, "shorter XPath"))
+    css = xpath_to_css(xpath)
+    if css:
+        found.append((By.CSS_SELECTOR, css, "CSS"))
+    return found
+
+
+# TIMING
+def _query(by, value):
+    return etree.XPath(to_xpath(by, value))
+
+
+def time_on_snapshots(query, documents, repeat, rounds=3):
+    """
+    µs per evaluation (best of `rounds`, averaged over the documents, like
+    timeit: the minimum is the least disturbed run) and the matches per document.
+    """
+    matches, total = [], 0.0
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for document in documents:
+            # Warm-up, so the first locator does not pay for lxml's caches
+            result = query(document)
+            best = None
+            for _ in range(rounds):
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    query(document)
+                elapsed = (time.perf_counter() - start) / repeat
+                best = elapsed if best is None else min(best, elapsed)
+            total += best
+            matches.append(result if isinstance(result, list) else [])
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return (total / len(documents) * 1e6 if documents else None), matches
+
+
+def _same_elements(original, candidate):
+    """'same' (identical match lists everywhere), 'first' (same first match everywhere) or None."""
+    if not any(original):
+        return None
+    if all(a == b for a, b in zip(original, candidate)):
+        return "same"
+    if all((a[:1] == b[:1]) for a, b in zip(original, candidate)):
+        return "first"
+    return None
+
+
+def audit_snapshots(snapshots, repeat=50, module=None):
+    """
+    Times every locator on the snapshots and verifies the rewrite candidates.
+    Returns {name: {by, value, flags, snapshot_us, matches, suggestion}}.
+    """
+    documents = []
+    for snapshot in snapshots:
+        try:
+            documents.append(lxml_html.document_fromstring(snapshot["html"]))
+        except (etree.ParserError, ValueError) as e:
+            logger.warning(f"Snapshot {snapshot['path']} skipped: {e}")
+
+    results = {}
+    for name, by, value in (collect(module) if module else collect()):
+        entry = {"by": by, "value": value, "flags": cost_flags(by, value), "snapshot_us": None,
+                 "matches": 0, "suggestion": None, "error": None}
+        results[name] = entry
+        try:
+            query = _query(by, value)
+        except Exception as e:
+            entry["error"] = f"{type(e).__name__}: {e}"
+            continue
+        try:
+            entry["snapshot_us"], original = time_on_snapshots(query, documents, repeat)
+        except etree.XPathEvalError as e:
+            entry["error"] = f"XPathEvalError: {e}"
+            continue
+        entry["matches"] = max((len(found) for found in original), default=0)
+
+        # Fastest candidate that finds the same elements
+        for candidate_by, candidate_value, note in candidates(by, value):
+            try:
+                candidate_us, found = time_on_snapshots(_query(candidate_by, candidate_value), documents, repeat)
+            except Exception:
+                continue
+            equivalence = _same_elements(original, found)
+            if not equivalence or (entry["suggestion"] and candidate_us >= entry["suggestion"]["snapshot_us"]):
+                continue
+            entry["suggestion"] = {"by": candidate_by, "value": candidate_value, "note": note,
+                                   "equivalence": equivalence, "snapshot_us": candidate_us}
+    return results
+
+
+def audit_live(results, browser="chrome", repeat=50):
+    """Adds live_us (mean over the visited pages) and live_suggestion_us to the results."""
+    from utility.driver_factory import create_driver
+    from scenarios.runner import login
+
+    payload, index = [], []
+    for name, entry in results.items():
+        if entry["error"]:
+            continue
+        timed = [("live_us", entry["by"], entry["value"])]
+        if entry["suggestion"]:
+            timed.append(("live_suggestion_us", entry["suggestion"]["by"], entry["suggestion"]["value"]))
+        for key, by, value in timed:
+            css = to_css(by, value)
+            payload.append(["css selector", css] if css else ["xpath", to_xpath(by, value)])
+            index.append((name, key))
+
+    totals = defaultdict(list)
+    driver = create_driver(browser, headless=True)
+    try:
+        driver.implicitly_wait(10)
+        driver.get(get_config("Login_Orange", "url"))
+        pages = [("login", None)] + list(config["Menu_URLs"].items())
+        for page, url in pages:
+            if url:
+                driver.get(url)
+            time.sleep(1)   # let the Vue app render the page
+            for (name, key), (micros, _, error) in zip(index, driver.execute_script(LIVE_TIMING_SCRIPT,
+                                                                                     payload, repeat)):
+                if micros is not None:
+                    totals[(name, key)].append(micros)
+            if page == "login":
+                login(driver, get_config("Data_Pool", "admin_username"), get_config("Data_Pool", "admin_password"))
+    finally:
+        driver.quit()
+
+    for (name, key), values in totals.items():
+        results[name][key] = sum(values) / len(values)
+    return results
+
+
+# HISTORY
+def previous_run(path, source):
+    """{locator: mean µs} of the last run of `source` in the history CSV."""
+    if not os.path.exists(path):
+        return {}
+    runs = defaultdict(dict)
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            if row["source"] == source and row["mean_us"]:
+                runs[row["run_at"]][row["locator"]] = float(row["mean_us"])
+    return runs[max(runs)] if runs else {}
+
+
+def append_history(path, results, run_at):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    new_file = not os.path.exists(path)
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(["run_at", "source", "locator", "mean_us", "matches", "flags"])
+        for name, entry in results.items():
+            for source, key in (("snapshot", "snapshot_us"), ("live", "live_us")):
+                if entry.get(key) is not None:
+                    writer.writerow([run_at, source, name, round(entry[key], 2), entry["matches"],
+                                     " ".join(entry["flags"])])
+
+
+def report(results, previous, top=None):
+    """Speed ranking (slowest first) with flags, change against the last run and the suggestions."""
+    def cost(item):
+        entry = item[1]
+        return entry.get("live_us") or entry["snapshot_us"] or 0.0
+
+    ranked = sorted(results.items(), key=cost, reverse=True)
+    live = any(entry.get("live_us") is not None for entry in results.values())
+    lines = [f"{'#':>3} {'snapshot µs':>11} {'live µs':>9} {'Δ last':>7} {'hits':>4}  {'locator':<48} flags"]
+    for rank, (name, entry) in enumerate(ranked[:top] if top else ranked, start=1):
+        snapshot_us = f"{entry['snapshot_us']:.1f}" if entry["snapshot_us"] is not None else "-"
+        live_us = f"{entry['live_us']:.1f}" if entry.get("live_us") is not None else "-"
+        delta = "-"
+        if name in previous and entry["snapshot_us"] and previous[name]:
+            delta = f"{(entry['snapshot_us'] - previous[name]) / previous[name]:+.0%}"
+        lines.append(f"{rank:>3} {snapshot_us:>11} {live_us:>9} {delta:>7} {entry['matches']:>4}  "
+                     f"{name:<48} {','.join(entry['flags'])}")
+        if entry["error"]:
+            lines.append(f"{'':>41}{entry['error']}")
+        suggestion = entry["suggestion"]
+        if suggestion:
+            speedup = entry["snapshot_us"] / suggestion["snapshot_us"] if suggestion["snapshot_us"] else 0
+            live_note = (f", live {entry['live_us'] / entry['live_suggestion_us']:.1f}x"
+                         if live and entry.get("live_suggestion_us") else "")
+            lines.append(f"{'':>41}→ ({suggestion['by']!r}, {suggestion['value']!r})  "
+                         f"{suggestion['note']}, {speedup:.1f}x{live_note}"
+                         f"{'' if suggestion['equivalence'] == 'same' else ', same first match'}")
+    suggested = sum(1 for entry in results.values() if entry["suggestion"])
+    lines.append(f"{len(results)} locators, {suggested} with a verified faster equivalent")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utility.locator_audit",
+                                     description="Times every locator and suggests faster equivalents.")
+    parser.add_argument("--snapshots", default=None, help="snapshot folder (default [DOM_Snapshots] directory)")
+    parser.add_argument("--live", action="store_true", help="also time the locators in a headless browser")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--repeat", type=int, default=int(get_config("Locator_Audit", "repeat")),
+                        help="evaluations per locator and page")
+    parser.add_argument("--top", type=int, default=None, help="only show the N slowest locators")
+    parser.add_argument("--history", default=get_config("Locator_Audit", "history"))
+    args = parser.parse_args(argv)
+
+    snapshots = dom_snapshots.load(args.snapshots)
+    if not snapshots and not args.live:
+        print("No DOM snapshots found: run the tests with [DOM_Snapshots] enabled = true, or use --live")
+        return 2
+    results = audit_snapshots(snapshots, repeat=args.repeat)
+    if args.live:
+        audit_live(results, browser=args.browser, repeat=args.repeat)
+
+    previous = previous_run(args.history, "snapshot")
+    print(report(results, previous, top=args.top))
+    append_history(args.history, results, time.strftime("%Y-%m-%dT%H:%M:%S"))
+    print(f"History appended to {args.history}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from utility.config_reader import get_config
+from utility.file_lock import FileLock
+from utility import query_cache
+
+"""
+locator_registry.py
+
+Self-healing locators: an element of locators/locators.py can carry an ordered
+chain of strategies (id, CSS, XPath, text XPath) instead of one (By, value).
+    - Locator is a tuple subclass → everywhere it is used as (By, value) it is
+      its primary strategy, existing code keeps working unchanged
+    - Base_Page resolves it with ONE script call per poll that tries the whole
+      chain, so a broken primary costs a fallback, not a 30 s timeout
+    - the strategy that last succeeded is tried first, also in later runs
+      (hit statistics in [Locator_Registry] stats_path, merged across workers);
+      only a match of exactly one element counts as a success, so a fallback
+      that also matches other elements is never locked in
+    - the terminal summary / `python -m utility.locator_registry` lists the
+      elements that keep falling back, i.e. whose primary should be updated
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# arguments[0] → [[by, value], ...] in the order to try.
+# Returns [1-based position, number of matched elements] of the first strategy
+# with a match, null for none.
+PROBE_SCRIPT = """
+var strategies = arguments[0];
+for (var i = 0; i < strategies.length; i++) {
+    var by = strategies[i][0], value = strategies[i][1], count = 0;
+    try {
+        if (by === 'xpath') {
+            count = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+        } else {
+            count = document.querySelectorAll(value).length;
+        }
+    } catch (e) {
+        count = 0;
+    }
+    if (count) { return [i + 1, count]; }
+}
+return null;
+"""
+
+
+def by_text(text, tag="*"):
+    """Text strategy: element whose own text is `text`, e.g. by_text('Save', 'button')."""
+    return By.XPATH, f"//{tag}[normalize-space(text())='{text}']"
+
+
+def to_css(by, value):
+    """CSS form of a non-XPath strategy (None for XPath / link text)."""
+    return {
+        By.CSS_SELECTOR: value,
+        By.ID: f'[id="{value}"]',
+        By.NAME: f'[name="{value}"]',
+        By.CLASS_NAME: f".{value}",
+        By.TAG_NAME: value,
+    }.get(by)
+
+
+def _probe_form(by, value):
+    """(By, value) → [by, value] the probe script understands (CSS or XPath)."""
+    css = to_css(by, value)
+    if css:
+        return ["css selector", css]
+    if by == By.LINK_TEXT:
+        return ["xpath", f"//a[normalize-space(.)='{value}']"]
+    if by == By.PARTIAL_LINK_TEXT:
+        return ["xpath", f"//a[contains(., '{value}')]"]
+    return ["xpath", value]
+
+
+class Locator(tuple):
+    """
+    (By, value) of the primary strategy, with fallbacks. The name is set from
+    the class attribute, e.g. 'AdminPageLocators.ROLE_DROPDOWN'.
+
+    Example:
+        class AdminPageLocators:
+            SAVE_BUTTON = Locator(By.XPATH, "//button[@type='submit']",
+                                  (By.CSS_SELECTOR, "button.oxd-button--secondary"),
+                                  by_text("Save", "button"))
+    """
+
+    def __new__(cls, by, value, *fallbacks):
+        locator = super().__new__(cls, (by, value))
+        locator.strategies = [(by, value), *fallbacks]
+        locator.name = f"{by}={value}"
+        return locator
+
+    def __getnewargs__(self):
+        # copy / pickle rebuild the whole chain, not just the primary
+        return (*self.strategies[0], *self.strategies[1:])
+
+    def __set_name__(self, owner, name):
+        # Page classes re-bind the same Locator as their own attribute: the
+        # *Locators class name stays, so stats keep one key per element
+        if owner.__name__.endswith("Locators"):
+            self.name = f"{owner.__name__}.{name}"
+
+
+class LocatorStats:
+    """
+    Strategy hit counts per element: {name: {"hits": {"0": n, "1": m}, "misses": k,
+    "preferred": index, "last_fallback": time}}. Counts of this process are kept
+    apart so save() can add them to the file written by other workers / runs.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.saved = self._read()
+        self.session = {}
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Locator stats {self.path} ignored: {e}")
+            return {}
+
+    def _entry(self, name):
+        return self.session.setdefault(name, {"hits": {}, "misses": 0, "preferred": None, "last_fallback": None})
+
+    def order(self, locator):
+        """Strategy indexes to try: the one that last succeeded first, then the declared order."""
+        entry = self.session.get(locator.name) or self.saved.get(locator.name) or {}
+        preferred = entry.get("preferred")
+        indexes = list(range(len(locator.strategies)))
+        if preferred is not None and 0 < preferred < len(indexes):
+            indexes.remove(preferred)
+            indexes.insert(0, preferred)
+        return indexes
+
+    def hit(self, name, index):
+        with self.lock:
+            entry = self._entry(name)
+            entry["hits"][str(index)] = entry["hits"].get(str(index), 0) + 1
+            entry["preferred"] = index
+            if index:
+                entry["last_fallback"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    def miss(self, name):
+        with self.lock:
+            self._entry(name)["misses"] += 1
+
+    def fallbacks(self, merged=None):
+        """Elements found through a fallback: [(name, fallback hits, primary hits, misses, preferred)], worst first."""
+        rows = []
+        for name, entry in (merged if merged is not None else self.session).items():
+            primary = entry["hits"].get("0", 0)
+            fallback = sum(count for index, count in entry["hits"].items() if index != "0")
+            if fallback or entry["misses"]:
+                rows.append((name, fallback, primary, entry["misses"], entry["preferred"]))
+        return sorted(rows, key=lambda row: (row[1] + row[3], row[1]), reverse=True)
+
+    def save(self):
+        """Adds this session's counts to the stats file (under a lock, for xdist workers). Returns the merged stats."""
+        if not self.session:
+            return self.saved
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with FileLock(f"{self.path}.lock"):
+            merged = self._read()
+            for name, entry in self.session.items():
+                target = merged.setdefault(name, {"hits": {}, "misses": 0, "preferred": None, "last_fallback": None})
+                for index, count in entry["hits"].items():
+                    target["hits"][index] = target["hits"].get(index, 0) + count
+                target["misses"] += entry["misses"]
+                if entry["preferred"] is not None:
+                    target["preferred"] = entry["preferred"]
+                target["last_fallback"] = entry["last_fallback"] or target["last_fallback"]
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, "w") as f:
+                json.dump(merged, f, indent=2, sort_keys=True)
+            os.replace(temporary, self.path)
+        self.saved, self.session = merged, {}
+        return merged
+
+
+_stats = None
+
+
+def is_enabled():
+    """Fallback resolution is switched on/off by [Locator_Registry] enabled in config.ini."""
+    try:
+        return get_config("Locator_Registry", "enabled").lower() == "true"
+    except KeyError:
+        return False
+
+
+def get_stats():
+    """Hit statistics of this process, loaded from [Locator_Registry] stats_path on first use."""
+    global _stats
+    if _stats is None:
+        _stats = LocatorStats(get_config("Locator_Registry", "stats_path"))
+    return _stats
+
+
+def resolve(driver, locator, timeout=30):
+    """
+    Returns the (By, value) of the first strategy of `locator` that finds an
+    element, polling the whole chain with one script call per poll. Plain
+    (By, value) tuples and single-strategy locators are returned unchanged.
+    The hit is only recorded when the strategy matched exactly one element.
+    Raises TimeoutException when no strategy matches within `timeout`.
+    """
+    if not isinstance(locator, Locator) or len(locator.strategies) == 1 or not is_enabled():
+        return locator
+    stats = get_stats()
+    order = stats.order(locator)
+    payload = [_probe_form(*locator.strategies[index]) for index in order]
+    try:
+        with query_cache.read_only(driver):
+            position, count = WebDriverWait(driver, timeout, poll_frequency=0.25,
+                                            ignored_exceptions=(WebDriverException,)) \
+                .until(lambda d: d.execute_script(PROBE_SCRIPT, payload))
+    except TimeoutException:
+        stats.miss(locator.name)
+        raise TimeoutException(f"No strategy of {locator.name} matched within {timeout} s: {locator.strategies}")
+
+    index = order[position - 1]
+    if count == 1:
+        stats.hit(locator.name, index)
+    else:
+        # Not remembered: tried first next time, it could keep picking the wrong element
+        logger.warning(f"Locator {locator.name}: {locator.strategies[index]} matched {count} elements, "
+                       f"hit not recorded")
+    if index:
+        logger.warning(f"Locator {locator.name}: primary {tuple(locator)} failed, "
+                       f"fallback {locator.strategies[index]} used")
+    return locator.strategies[index]
+
+
+def fallback_report(rows):
+    """Plain-text table of LocatorStats.fallbacks()."""
+    lines = [f"{'fallback':>8} {'primary':>8} {'missed':>7}  element (strategy now tried first)"]
+    for name, fallback, primary, misses, preferred in rows:
+        lines.append(f"{fallback:>8} {primary:>8} {misses:>7}  {name} "
+                     f"({'-' if preferred is None else f'#{preferred}'})")
+    return "\n".join(lines)
+
+
+def main():
+    """Prints the elements that keep falling back, from the stats of all runs."""
+    stats = get_stats()
+    rows = stats.fallbacks(stats.saved)
+    if not rows:
+        print(f"No fallbacks recorded in {stats.path}")
+        return 0
+    print(fallback_report(rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
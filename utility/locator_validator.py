@@ -0,0 +1,203 @@
+import sys
+import json
+import time
+import logging
+import argparse
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector, SelectorError
+from selenium.webdriver.common.by import By
+from utility.config_reader import get_config
+from utility import dom_snapshots
+from utility.locator_registry import Locator
+from locators import locators
+from locators.locators import DashBoardPageLocators, MyInfoPageLocators
+
+"""
+locator_validator.py
+
+Checks every *Locators class of locators/locators.py against the DOM snapshots
+(utility/dom_snapshots.py) with lxml, without a browser:
+    - invalid   → XPath / CSS syntax error
+    - zero      → no stored page has a match (broken, or only on a page / state never captured)
+    - ambiguous → more than one element on a page (first one wins with find_element;
+                  expected for list locators used with find_elements)
+    - unique    → exactly one element on every page where it matches
+Dynamic locators (static methods such as menu_item_by_text, '{}' templates)
+are expanded with the values the tests call them with; the fallback strategies
+of a Locator chain are listed as '<name>~<n>'.
+
+Example (from the project root):
+    python -m utility.locator_validator
+    python -m utility.locator_validator --strict --json Reports/locator_validation.json
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+
+# Arguments the dynamic locators are called / formatted with in the tests
+DYNAMIC_ARGUMENTS = {
+    "menu_item_by_text": lambda: DashBoardPageLocators.REQUIRED_MENU_ITEMS,
+    "myinfo_menu_tab": lambda: MyInfoPageLocators.MYINFO_ITEMS,
+    "LEAVE_TYPE_OPTIONS": lambda: [name.strip() for name in get_config("Load_Leave", "leave_types").split(",")],
+    "CLAIM_TYPE_DROPDOWN": lambda: [get_config("claim", "claim_type")],
+    "CURRENCY_TYPE_DROPDOWN": lambda: [get_config("claim", "currency")],
+}
+
+
+def _xpath_literal(text):
+    """Quotes a string for an XPath expression."""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ")"
+
+
+def to_xpath(by, value):
+    """Selenium (By, value) → XPath expression evaluated by lxml."""
+    if by == By.XPATH:
+        return value
+    if by == By.LINK_TEXT:
+        return f"//a[normalize-space(.)={_xpath_literal(value)}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return f"//a[contains(., {_xpath_literal(value)})]"
+    css = {
+        By.CSS_SELECTOR: value,
+        By.ID: f'[id="{value}"]',
+        By.NAME: f'[name="{value}"]',
+        By.CLASS_NAME: f".{value}",
+        By.TAG_NAME: value,
+    }.get(by)
+    if css is None:
+        raise ValueError(f"Unsupported locator strategy: {by}")
+    return CSSSelector(css, translator="html").path
+
+
+def _locator_type(value):
+    """Plain string locators: XPath when it starts like one, CSS otherwise."""
+    return By.XPATH if value.lstrip().startswith(("/", "(", ".")) else By.CSS_SELECTOR
+
+
+def collect(module=locators):
+    """
+    Every locator of the *Locators classes as (name, by, value); dynamic ones
+    are expanded once per argument, e.g. 'DashBoardPageLocators.menu_item_by_text(Admin)'.
+    """
+    found = []
+    for class_name, cls in vars(module).items():
+        if not (isinstance(cls, type) and class_name.endswith("Locators")):
+            continue
+        for attr, value in vars(cls).items():
+            if attr.startswith("_"):
+                continue
+            name = f"{class_name}.{attr}"
+            if isinstance(value, staticmethod):
+                for argument in DYNAMIC_ARGUMENTS.get(attr, lambda: [])():
+                    by, expression = value.__func__(argument)
+                    found.append((f"{name}({argument})", by, expression))
+            elif isinstance(value, dict):
+                found.extend((f"{name}[{key}]", *locator) for key, locator in value.items()
+                             if isinstance(locator, tuple))
+            elif isinstance(value, (tuple, str)):
+                by, expression = value if isinstance(value, tuple) else (_locator_type(value), value)
+                if isinstance(value, tuple) and not (len(value) == 2 and isinstance(by, str)):
+                    continue
+                if "{}" in expression:
+                    found.extend((f"{name}({argument})", by, expression.format(argument))
+                                 for argument in DYNAMIC_ARGUMENTS.get(attr, lambda: [])())
+                else:
+                    found.append((name, by, expression))
+                if isinstance(value, Locator):
+                    # Fallback strategies are checked too: 'AdminPageLocators.ROLE_DROPDOWN~1'
+                    found.extend((f"{name}~{index}", *strategy)
+                                 for index, strategy in enumerate(value.strategies[1:], start=1))
+    return found
+
+
+def validate(snapshots, module=locators):
+    """
+    Evaluates every locator on every snapshot. Returns one result per locator:
+    name, by, value, status, pages (hit / total), max_hits, hits {page: count}, error.
+    """
+    documents = []
+    for snapshot in snapshots:
+        try:
+            documents.append((snapshot["page"], lxml_html.document_fromstring(snapshot["html"])))
+        except (etree.ParserError, ValueError) as e:
+            logger.warning(f"Snapshot {snapshot['path']} skipped: {e}")
+
+    results = []
+    for name, by, value in collect(module):
+        result = {"name": name, "by": by, "value": value, "pages": f"0/{len(documents)}",
+                  "max_hits": 0, "hits": {}, "error": None}
+        try:
+            query = etree.XPath(to_xpath(by, value))
+        except (etree.XPathSyntaxError, SelectorError, ValueError) as e:
+            result.update(status="invalid", error=f"{type(e).__name__}: {e}")
+            results.append(result)
+            continue
+
+        for page, document in documents:
+            try:
+                matches = query(document)
+            except etree.XPathEvalError as e:
+                result.update(status="invalid", error=f"XPathEvalError: {e}")
+                break
+            count = len(matches) if isinstance(matches, list) else int(bool(matches))
+            if count:
+                result["hits"][page] = max(count, result["hits"].get(page, 0))
+        else:
+            hit_pages = len(result["hits"])
+            result["max_hits"] = max(result["hits"].values(), default=0)
+            result["pages"] = f"{hit_pages}/{len(documents)}"
+            result["status"] = ("zero" if not hit_pages else
+                                "ambiguous" if result["max_hits"] > 1 else "unique")
+        results.append(result)
+    return results
+
+
+def report(results, elapsed_ms, snapshot_count):
+    """Plain-text table, problems first."""
+    order = {"invalid": 0, "zero": 1, "ambiguous": 2, "unique": 3}
+    counts = {status: sum(1 for result in results if result["status"] == status) for status in order}
+    lines = [f"{len(results)} locators on {snapshot_count} snapshots in {elapsed_ms:.0f} ms: "
+             + ", ".join(f"{count} {status}" for status, count in counts.items()),
+             f"{'status':<10} {'pages':>7} {'max':>4}  locator"]
+    for result in sorted(results, key=lambda result: (order[result["status"]], result["name"])):
+        lines.append(f"{result['status']:<10} {result['pages']:>7} {result['max_hits']:>4}  {result['name']}")
+        if result["error"]:
+            lines.append(f"{'':<24}{result['error']}")
+        elif result["status"] == "ambiguous":
+            worst = max(result["hits"], key=result["hits"].get)
+            lines.append(f"{'':<24}{result['hits'][worst]} elements on {worst}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utility.locator_validator",
+                                     description="Validates the locators against stored DOM snapshots.")
+    parser.add_argument("--snapshots", default=None, help="snapshot folder (default [DOM_Snapshots] directory)")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--strict", action="store_true", help="exit code 1 for zero-hit locators too")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    snapshots = dom_snapshots.load(args.snapshots)
+    results = validate(snapshots)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if not snapshots:
+        print("No DOM snapshots found: run the tests with [DOM_Snapshots] enabled = true first")
+        return 2
+    print(report(results, elapsed_ms, len(snapshots)))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    failing = {"invalid", "zero"} if args.strict else {"invalid"}
+    return 1 if any(result["status"] in failing for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+import os
+import sys
+import copy
+import json
+import time
+import queue
+import logging
+import argparse
+import heapq
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from utility.config_reader import get_config
+from utility.test_context import get_current_test
+
+"""
+log_pipeline.py
+
+Non-blocking logging of the test run:
+    - the root logger only has a QueueHandler: a log call puts the record on an
+      in-memory queue and returns, Base_Page never waits for disk or terminal I/O
+    - a QueueListener thread writes the records to
+        · Reports/logs/test_logs_<worker>.jsonl → one JSON object per line, one file
+          per xdist worker ('main' without xdist), rotated by size AND time
+        · the console, in the usual text format
+    - every record carries the pytest node id of the running test and the worker
+Settings in [Logging] of config.ini.
+
+Example (merges the per-worker files by time, optionally for one test):
+    python -m utility.log_pipeline
+    python -m utility.log_pipeline --test test_tc05 --level WARNING
+"""
+
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+
+
+def worker_id():
+    """xdist worker id (gw0, gw1, ...) or 'main'."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+class TestContextFilter(logging.Filter):
+    """Adds test_id and worker to every record, in the thread that logs it."""
+
+    def filter(self, record):
+        record.test_id = get_current_test() or "-"
+        record.worker = worker_id()
+        return True
+
+
+class StructuredQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps the traceback apart from the message (the stock
+    prepare() merges them), so the JSON line gets its own 'exc' field.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: ts, level, logger, test_id, worker, thread, message (+ exc)."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "test_id": getattr(record, "test_id", "-"),
+            "worker": getattr(record, "worker", worker_id()),
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SizeAndTimeRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that also rolls over every `interval_s` seconds (numbered backups either way)."""
+
+    def __init__(self, filename, max_bytes, backup_count, interval_s, encoding="utf-8"):
+        # Like TimedRotatingFileHandler, the clock of a file kept from an earlier run starts at its last write,
+        # so a file older than the interval rolls over with the first record
+        started = os.path.getmtime(filename) if os.path.exists(filename) else time.time()
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        self.interval_s = interval_s
+        self.rollover_at = started + interval_s
+
+    def shouldRollover(self, record):
+        if self.interval_s > 0 and time.time() >= self.rollover_at:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.rollover_at = time.time() + self.interval_s
+
+
+# Listener of this process (None until start())
+_listener = None
+
+
+def _setting(key, default):
+    try:
+        return get_config("Logging", key)
+    except KeyError:
+        return default
+
+
+def log_path(directory=None, worker=None):
+    directory = directory or _setting("directory", "Reports/logs")
+    return os.path.join(directory, f"test_logs_{worker or worker_id()}.jsonl")
+
+
+def start():
+    """
+    Replaces the root logger's handlers with the queue pipeline and starts the
+    listener thread. Returns the listener (stop() flushes it at the end of the run).
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    path = log_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    file_handler = SizeAndTimeRotatingFileHandler(
+        path,
+        max_bytes=int(float(_setting("max_mb", 10)) * 1024 * 1024),
+        backup_count=int(_setting("backup_count", 5)),
+        interval_s=float(_setting("rotate_hours", 24)) * 3600)
+    file_handler.setFormatter(JsonLinesFormatter())
+    handlers = [file_handler]
+
+    if _setting("console", "true").lower() == "true":
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(fmt=TEXT_FORMAT))
+        handlers.append(console_handler)
+
+    # Unbounded queue: put() never blocks the logging thread
+    records = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(records)
+    queue_handler.addFilter(TestContextFilter())
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, _setting("level", "INFO").upper(), logging.INFO))
+    for handler in [h for h in root.handlers if not type(h).__module__.startswith("_pytest")]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop():
+    """Writes the queued records and stops the listener thread."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def read(directory=None):
+    """Records of every worker's files (backups included), merged in time order."""
+    directory = directory or _setting("directory", "Reports/logs")
+    if not os.path.isdir(directory):
+        return
+    streams = []
+    for name in sorted(os.listdir(directory)):
+        if name.startswith("test_logs_") and ".jsonl" in name:
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                streams.append([json.loads(line) for line in f if line.strip()])
+    yield from heapq.merge(*streams, key=lambda entry: entry["ts"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utility.log_pipeline",
+                                     description="Prints the JSON-lines logs of all workers merged by time.")
+    parser.add_argument("--directory", default=None, help="log folder (default [Logging] directory)")
+    parser.add_argument("--test", help="only records whose test id contains this text")
+    parser.add_argument("--level", default="DEBUG", help="minimum level")
+    args = parser.parse_args(argv)
+
+    minimum = getattr(logging, args.level.upper(), logging.DEBUG)
+    for entry in read(args.directory):
+        if args.test and args.test not in entry["test_id"]:
+            continue
+        if getattr(logging, entry["level"], 0) < minimum:
+            continue
+        print(f"{entry['time']} {entry['worker']:<5} {entry['level']:<8} {entry['test_id']} "
+              f"{entry['logger']}: {entry['message']}")
+        if entry.get("exc"):
+            print(entry["exc"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
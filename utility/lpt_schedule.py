@@ -0,0 +1,73 @@
+import re
+import heapq
+from collections import OrderedDict
+
+"""
+lpt_schedule.py
+
+Longest-processing-time-first (LPT) scheduling of test items.
+
+Tests of one class share a class-scoped driver and build on each other's
+browser state (login, created user, ...), so the unit of scheduling is the
+class: its tests stay together and in their original order. Module level
+tests are units of their own.
+"""
+
+# xdist_group of LPT bin i; with --dist loadgroup xdist appends "@<group>" to the node ids
+GROUP_PREFIX = "lpt"
+
+
+def group_name(index):
+    return f"{GROUP_PREFIX}{index}"
+
+
+def base_nodeid(nodeid):
+    """Node id without xdist's "@lpt<N>" group suffix ("@" inside parametrize ids is kept)."""
+    return re.sub(rf"@{GROUP_PREFIX}\d+$", "", nodeid)
+
+
+def unit_key(nodeid):
+    """Scheduling unit of a test: 'file::Class' for class tests, the nodeid otherwise."""
+    parts = nodeid.split("::")
+    return "::".join(parts[:2]) if len(parts) > 2 else nodeid
+
+
+def group_units(nodeids, unit_of=unit_key):
+    """Returns {unit: [nodeids in original order]}, units in first-seen order."""
+    units = OrderedDict()
+    for nodeid in nodeids:
+        units.setdefault(unit_of(nodeid), []).append(nodeid)
+    return units
+
+
+def lpt_bins(unit_costs, workers):
+    """
+    Assigns units to `workers` bins, longest unit first, always onto the least
+    loaded bin. Returns (bins, loads): bins[i] is a list of unit keys in
+    execution order, loads[i] the predicted seconds of bin i.
+    """
+    workers = max(1, workers)
+    bins = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    heap = [(0.0, index) for index in range(workers)]
+    # Stable sort → equal costs keep their collection order
+    for key, cost in sorted(unit_costs.items(), key=lambda unit: -unit[1]):
+        load, index = heapq.heappop(heap)
+        bins[index].append(key)
+        loads[index] = load + cost
+        heapq.heappush(heap, (loads[index], index))
+    return bins, loads
+
+
+def plan(nodeids, estimate, workers=1, unit_of=None):
+    """
+    Builds the LPT schedule of the given tests. `unit_of(nodeid)` can merge
+    classes into bigger units (e.g. linked by test dependencies).
+    Returns {"bins": [[nodeid, ...], ...], "loads": [...], "makespan": seconds}.
+    """
+    units = group_units(nodeids, unit_of or unit_key)
+    costs = {key: sum(estimate(nodeid) for nodeid in members) for key, members in units.items()}
+    unit_bins, loads = lpt_bins(costs, workers)
+    bins = [[nodeid for key in keys for nodeid in units[key]] for keys in unit_bins]
+    return {"bins": bins, "loads": [round(load, 1) for load in loads],
+            "makespan": round(max(loads), 1) if loads else 0.0}
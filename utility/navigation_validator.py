@@ -0,0 +1,152 @@
+import time
+import logging
+from selenium.common.exceptions import WebDriverException
+
+"""
+navigation_validator.py
+
+Validates many target URLs of one authenticated browser concurrently.
+Each target is opened in its own tab with a non-blocking navigation, so the
+browser loads all of them at the same time; the tabs are then polled for
+URL, title and readiness. With timings of sequential click navigations of the
+same pages as a baseline, the wall-clock speedup of the concurrent run is reported.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# Starts a navigation without waiting for the page load (unlike driver.get)
+NAVIGATE_SCRIPT = "window.location.href = arguments[0];"
+
+# Reads URL, title and readiness of the current tab in one round-trip
+READY_STATE_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+return {
+    url: location.href,
+    title: document.title,
+    ready_state: document.readyState,
+    layout_ready: !!document.querySelector('.oxd-layout-context'),
+    load_ms: nav && nav.loadEventEnd > 0 ? Math.round(nav.loadEventEnd - nav.startTime) : null
+};
+"""
+
+
+def speedup_report(sequential_ms, targets, wall_clock_ms):
+    """Per-target sequential baseline (mean of the samples), its total for `targets` and the speedup."""
+    baseline = sum(sequential_ms) / len(sequential_ms)
+    estimated = baseline * targets
+    return {
+        "sequential_baseline_ms": round(baseline, 1),
+        "estimated_sequential_ms": round(estimated, 1),
+        "speedup": round(estimated / wall_clock_ms, 2) if wall_clock_ms else None,
+    }
+
+
+class NavigationValidator:
+    """
+    Opens every target URL in a separate tab, lets them load concurrently and
+    collects URL, title and readiness of each one.
+
+    Example:
+        report = NavigationValidator(driver).validate({"Admin": admin_url, "PIM": pim_url})
+        report["results"]  → one dict per target (name, expected_url, actual_url, title, passed, ...)
+        report["wall_clock_ms"] → time of the whole concurrent run
+        report["speedup"]       → sequential baseline × targets / wall_clock_ms (with sequential_ms)
+    """
+
+    def __init__(self, driver, max_tabs=5, timeout=30, poll_interval=0.25):
+        self.driver = driver
+        self.max_tabs = max_tabs
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    def validate(self, targets, sequential_ms=None):
+        """
+        targets       → {name: expected_url}
+        sequential_ms → ms of sequential navigations (click → URL reached) of some of
+                        the targets, their mean is the per-target sequential baseline
+        RETURNS:
+            {
+                "results": [{"name", "expected_url", "actual_url", "title",
+                             "ready_state", "load_ms", "passed"}, ...],
+                "wall_clock_ms": float,       # time for the whole concurrent run
+                "summed_load_ms": float,      # sum of the page loads, each measured while
+                                              # the others loaded too (not a sequential baseline)
+                # only with sequential_ms:
+                "sequential_baseline_ms": float,   # mean sequential navigation of one target
+                "estimated_sequential_ms": float,  # baseline × number of targets
+                "speedup": float                   # estimated_sequential_ms / wall_clock_ms
+            }
+        """
+        origin = self.driver.current_window_handle
+        items = list(targets.items())
+        results = []
+
+        start = time.perf_counter()
+        try:
+            # Limit the number of tabs loading at the same time
+            for batch_start in range(0, len(items), self.max_tabs):
+                results.extend(self._validate_batch(items[batch_start:batch_start + self.max_tabs]))
+        finally:
+            self.driver.switch_to.window(origin)
+        wall_clock_ms = (time.perf_counter() - start) * 1000
+
+        report = {
+            "results": results,
+            "wall_clock_ms": round(wall_clock_ms, 1),
+            "summed_load_ms": round(sum(result["load_ms"] or 0 for result in results), 1),
+        }
+        logger.info(f"Validated {len(results)} URLs concurrently in {report['wall_clock_ms']} ms "
+                    f"(sum of concurrent page loads {report['summed_load_ms']} ms)")
+        if sequential_ms:
+            report.update(speedup_report(sequential_ms, len(items), wall_clock_ms))
+            logger.info(f"Sequential baseline {report['sequential_baseline_ms']} ms per URL → "
+                        f"{report['estimated_sequential_ms']} ms for {len(items)} URLs, "
+                        f"speedup {report['speedup']}x")
+        return report
+
+    def _validate_batch(self, batch):
+        # Open one tab per target and start its navigation without waiting
+        handles = {}
+        for name, url in batch:
+            self.driver.switch_to.new_window("tab")
+            self.driver.execute_script(NAVIGATE_SCRIPT, url)
+            handles[name] = self.driver.current_window_handle
+            logger.info(f"Opened tab for {name} → {url}")
+
+        # Poll every tab until it is loaded (or the timeout expires)
+        expected = dict(batch)
+        states = {}
+        pending = list(handles)
+        deadline = time.monotonic() + self.timeout
+        while pending and time.monotonic() < deadline:
+            for name in list(pending):
+                self.driver.switch_to.window(handles[name])
+                try:
+                    state = self.driver.execute_script(READY_STATE_SCRIPT)
+                except WebDriverException:
+                    # Page is being replaced by the navigation, read it on the next sweep
+                    continue
+                states[name] = state
+                if state["ready_state"] == "complete" and state["layout_ready"] \
+                        and state["load_ms"] is not None and state["url"] == expected[name]:
+                    pending.remove(name)
+            if pending:
+                time.sleep(self.poll_interval)
+
+        # Close the tabs of this batch
+        results = []
+        for name, handle in handles.items():
+            state = states.get(name, {})
+            results.append({
+                "name": name,
+                "expected_url": expected[name],
+                "actual_url": state.get("url"),
+                "title": state.get("title"),
+                "ready_state": state.get("ready_state"),
+                "load_ms": state.get("load_ms"),
+                "passed": name not in pending,
+            })
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        return results
@@ -0,0 +1,69 @@
+import logging
+from collections import namedtuple
+from utility.config_reader import config
+
+"""
+perf_budgets.py
+
+Per-page performance budgets read from the [Perf_Budgets] section of config.ini.
+Every route key of [Menu_URLs] and [MYINFO_URLS] has one line:
+
+    admin = 8000, 10000, 3000      → max load ms, max time-to-interactive ms, max API latency ms
+
+`default` applies to pages without their own line, 0 disables a limit.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+PerfBudget = namedtuple("PerfBudget", ["load_ms", "tti_ms", "api_ms"])
+
+# record field → budget field, label used in violation messages
+BUDGET_FIELDS = [("load_ms", "load_ms", "load"), ("tti_ms", "tti_ms", "TTI"), ("api_max_ms", "api_ms", "API latency")]
+
+# Sections whose keys are the route keys of the budgets
+ROUTE_SECTIONS = ["Menu_URLs", "MYINFO_URLS"]
+
+
+def load_budgets():
+    """Returns {route_key: PerfBudget} from config.ini ({} when the section is missing)."""
+    if not config.has_section("Perf_Budgets"):
+        return {}
+    budgets = {}
+    for key, value in config["Perf_Budgets"].items():
+        load_ms, tti_ms, api_ms = (float(part) for part in value.split(","))
+        budgets[key] = PerfBudget(load_ms, tti_ms, api_ms)
+    return budgets
+
+
+def route_for_url(url):
+    """Maps a measured URL to its route key, e.g. .../admin/viewSystemUsers → 'admin'."""
+    for section in ROUTE_SECTIONS:
+        if not config.has_section(section):
+            continue
+        for key, route_url in config[section].items():
+            if url.split("#")[0].rstrip("/") == route_url.rstrip("/"):
+                return key
+    return None
+
+
+def check_records(records, budgets=None):
+    """
+    Compares perf records (see perf_metrics) with the budgets.
+    Returns a list of violation messages, empty when every page is within budget.
+    """
+    budgets = load_budgets() if budgets is None else budgets
+    violations = []
+    for record in records:
+        route = route_for_url(record["url"])
+        budget = budgets.get(route) or budgets.get("default")
+        if budget is None:
+            continue
+        for record_field, budget_field, label in BUDGET_FIELDS:
+            limit = getattr(budget, budget_field)
+            measured = record.get(record_field)
+            if limit and measured is not None and measured > limit:
+                violations.append(f"{route or 'default'} ({record['url']}): {label} {measured} ms > budget {limit:g} ms")
+    for violation in violations:
+        logger.warning(f"Performance budget exceeded → {violation}")
+    return violations
@@ -0,0 +1,200 @@
+import os
+import json
+import logging
+from collections import defaultdict
+from utility.config_reader import get_config
+from utility.test_context import get_current_test
+from utility import query_cache
+
+"""
+perf_metrics.py
+
+Collects OrangeHRM page performance after every navigation / SPA route change:
+    - Navigation Timing (TTFB, DOMContentLoaded, load)
+    - Resource Timing (count, transfer size, slowest resources, API calls)
+    - Web Vitals: LCP and CLS
+    - Long tasks
+Records are stored per test and per URL, summarised in Allure by conftest.py
+and written to Reports/perf/perf_results.json at the end of the session.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# Async script: installs the observers once per document, waits for the load
+# event, then returns everything measured since the previous capture.
+CAPTURE_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var state = window.__hrmPerf;
+var firstCapture = !state;
+if (firstCapture) {
+    state = window.__hrmPerf = {lcp: null, cls: 0, longTasks: [], mark: 0, routeStart: null};
+    var types = (window.PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+    var observe = function (type, callback) {
+        if (types.indexOf(type) === -1) { return; }
+        new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+            .observe({type: type, buffered: true});
+    };
+    observe('largest-contentful-paint', function (e) { state.lcp = e.startTime; });
+    observe('layout-shift', function (e) { if (!e.hadRecentInput) { state.cls += e.value; } });
+    observe('longtask', function (e) { state.longTasks.push([e.startTime, e.duration]); });
+    // SPA route changes → remember when the route started
+    ['pushState', 'replaceState'].forEach(function (name) {
+        var original = history[name];
+        history[name] = function () {
+            state.routeStart = performance.now();
+            return original.apply(this, arguments);
+        };
+    });
+}
+
+// Same document, same URL and no route change since the last capture → nothing new
+if (!firstCapture && state.routeStart === null && state.lastUrl === location.href) {
+    done(null);
+    return;
+}
+state.lastUrl = location.href;
+
+var reported = false;
+function report() {
+    if (reported) { return; }
+    reported = true;
+    var since = firstCapture ? 0 : (state.routeStart !== null ? state.routeStart : state.mark);
+    state.mark = performance.now();
+    state.routeStart = null;
+
+    var nav = performance.getEntriesByType('navigation')[0];
+    var resources = performance.getEntriesByType('resource').filter(function (r) { return r.startTime >= since; });
+    var api = resources.filter(function (r) {
+        return r.initiatorType === 'fetch' || r.initiatorType === 'xmlhttprequest';
+    });
+    var tasks = state.longTasks.filter(function (t) { return t[0] >= since; });
+    var lastResponse = resources.reduce(function (m, r) { return Math.max(m, r.responseEnd); }, since);
+
+    done({
+        type: firstCapture ? 'navigation' : 'route',
+        url: location.href,
+        navigation: firstCapture && nav ? {
+            ttfb_ms: nav.responseStart - nav.startTime,
+            dom_interactive_ms: nav.domInteractive - nav.startTime,
+            dom_content_loaded_ms: nav.domContentLoadedEventEnd - nav.startTime,
+            load_ms: nav.loadEventEnd - nav.startTime,
+            transfer_size: nav.transferSize || 0
+        } : null,
+        route_ms: firstCapture ? null : lastResponse - since,
+        resources: {
+            count: resources.length,
+            transfer_size: resources.reduce(function (s, r) { return s + (r.transferSize || 0); }, 0),
+            slowest: resources.slice().sort(function (a, b) { return b.duration - a.duration; })
+                .slice(0, 5).map(function (r) { return [r.name, Math.round(r.duration)]; })
+        },
+        api: {
+            count: api.length,
+            max_ms: api.reduce(function (m, r) { return Math.max(m, r.duration); }, 0),
+            total_ms: api.reduce(function (s, r) { return s + r.duration; }, 0)
+        },
+        lcp_ms: state.lcp,
+        cls: state.cls,
+        long_tasks: {
+            count: tasks.length,
+            total_ms: tasks.reduce(function (s, t) { return s + t[1]; }, 0),
+            last_end_ms: tasks.reduce(function (m, t) { return Math.max(m, t[0] + t[1]); }, 0) - since
+        }
+    });
+}
+// Buffered observer entries arrive asynchronously → report shortly after load
+var collect = function () { setTimeout(report, 50); };
+if (document.readyState === 'complete') { collect(); }
+else { window.addEventListener('load', collect, {once: true}); setTimeout(report, 10000); }
+"""
+
+# test nodeid → list of records (in navigation order)
+_records = defaultdict(list)
+
+
+def is_enabled():
+    """Performance capture is switched on/off by [Perf] enabled in config.ini."""
+    try:
+        return get_config("Perf", "enabled").lower() == "true"
+    except KeyError:
+        return False
+
+
+def capture(driver):
+    """
+    Measures the page that was just navigated to and stores the record
+    under the running test. Never raises: perf data must not break a test.
+    """
+    if not is_enabled():
+        return None
+    try:
+        # Measuring does not change the page → cached page queries stay valid
+        with query_cache.read_only(driver):
+            raw = driver.execute_async_script(CAPTURE_SCRIPT)
+    except Exception as e:
+        logger.error(f"Performance capture failed: {e}")
+        return None
+
+    if raw is None:
+        return None
+
+    record = _summarise(raw)
+    _records[get_current_test()].append(record)
+    logger.info(f"Perf {record['type']} {record['url']} → load {record['load_ms']} ms, "
+                f"TTI {record['tti_ms']} ms, API max {record['api_max_ms']} ms, "
+                f"LCP {record['lcp_ms']} ms, CLS {record['cls']}")
+    return record
+
+
+def _summarise(raw):
+    """Adds the headline numbers (load, TTI, API latency) to a raw capture."""
+    navigation = raw.get("navigation")
+    long_tasks = raw["long_tasks"]
+    if navigation:
+        load_ms = navigation["load_ms"]
+        # TTI approximation → DOMContentLoaded or end of the last long task, whichever is later
+        tti_ms = max(navigation["dom_content_loaded_ms"], long_tasks["last_end_ms"])
+    else:
+        load_ms = raw["route_ms"]
+        tti_ms = max(raw["route_ms"] or 0, long_tasks["last_end_ms"])
+
+    record = dict(raw)
+    record.update({
+        "load_ms": round(load_ms or 0, 1),
+        "tti_ms": round(tti_ms or 0, 1),
+        "api_max_ms": round(raw["api"]["max_ms"], 1),
+        "lcp_ms": round(raw["lcp_ms"], 1) if raw["lcp_ms"] is not None else None,
+        "cls": round(raw["cls"], 4),
+    })
+    return record
+
+
+def records_for(nodeid):
+    """Returns the records captured during one test."""
+    return list(_records.get(nodeid, []))
+
+
+def summary_table(records):
+    """Plain-text table of a test's records, used for the Allure attachment."""
+    lines = [f"{'type':<10} {'load ms':>9} {'TTI ms':>9} {'API max':>9} {'LCP ms':>9} {'CLS':>7} {'long tasks':>10}  url"]
+    for r in records:
+        lcp = r["lcp_ms"] if r["lcp_ms"] is not None else "-"
+        lines.append(f"{r['type']:<10} {r['load_ms']:>9} {r['tti_ms']:>9} {r['api_max_ms']:>9} "
+                     f"{lcp:>9} {r['cls']:>7} {r['long_tasks']['count']:>10}  {r['url']}")
+    return "\n".join(lines)
+
+
+def write_results(path="Reports/perf/perf_results.json"):
+    """Writes all records, grouped per test and per URL, to a JSON file."""
+    if not _records:
+        return None
+    per_url = defaultdict(list)
+    for nodeid, records in _records.items():
+        for record in records:
+            per_url[record["url"]].append(dict(record, test=nodeid))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"per_test": _records, "per_url": per_url}, f, indent=2)
+    logger.info(f"Performance results written to {path}")
+    return path
@@ -0,0 +1,191 @@
+import logging
+import functools
+from contextlib import contextmanager
+from selenium.webdriver.remote.command import Command
+from utility.config_reader import get_config
+from utility.test_context import get_current_test
+
+"""
+query_cache.py
+
+Memoizes read-only page-object queries (@cached_query) until the page may have
+changed. Every driver gets a PageState whose epoch is bumped by
+    - every state-changing WebDriver command (navigation, click, typing,
+      scripts, actions, window / frame switches, cookies)
+    - a different URL returned by getCurrentUrl (redirects, SPA route changes)
+A cached result is reused while the epoch and the running test are the same,
+so repeated reads in assertions and logging cost no round-trip. Only plain
+values (texts, numbers, booleans and containers of them) are cached: the SPA
+re-renders through XHR without any WebDriver command, so a cached WebElement
+could be stale by the next read.
+Switched on/off by [Query_Cache] enabled in config.ini.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# Commands that can change the page (scripts included: BULK_FILL_SCRIPT sets values)
+MUTATING_COMMANDS = {
+    Command.GET,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+    Command.REFRESH,
+    Command.CLICK_ELEMENT,
+    Command.SEND_KEYS_TO_ELEMENT,
+    Command.CLEAR_ELEMENT,
+    Command.W3C_EXECUTE_SCRIPT,
+    Command.W3C_EXECUTE_SCRIPT_ASYNC,
+    Command.W3C_ACTIONS,
+    Command.W3C_CLEAR_ACTIONS,
+    Command.SWITCH_TO_WINDOW,
+    Command.SWITCH_TO_FRAME,
+    Command.SWITCH_TO_PARENT_FRAME,
+    Command.NEW_WINDOW,
+    Command.CLOSE,
+    Command.ADD_COOKIE,
+    Command.DELETE_COOKIE,
+    Command.DELETE_ALL_COOKIES,
+}
+
+
+def is_enabled():
+    """Query caching is switched on/off by [Query_Cache] enabled in config.ini."""
+    try:
+        return get_config("Query_Cache", "enabled").lower() == "true"
+    except KeyError:
+        return False
+
+
+class PageState:
+    """
+    Change counter of one driver, installed on its command executor.
+
+    Example:
+        state = PageState.of(driver)
+        epoch = state.epoch
+        driver.get(url)               # state.epoch > epoch
+        with state.read_only():
+            driver.execute_script("return document.title")   # epoch unchanged
+    """
+
+    # Attribute of the driver that holds its PageState
+    DRIVER_ATTRIBUTE = "_page_state"
+
+    def __init__(self):
+        self.epoch = 0
+        self.url = None
+        self.hits = 0
+        self.misses = 0
+        self._read_only = 0
+
+    @classmethod
+    def of(cls, driver):
+        """The PageState of `driver`, attached on first use."""
+        state = getattr(driver, cls.DRIVER_ATTRIBUTE, None)
+        if state is None:
+            state = cls()
+            state._attach(driver)
+            setattr(driver, cls.DRIVER_ATTRIBUTE, state)
+        return state
+
+    def _attach(self, driver):
+        executor = driver.command_executor
+        original_execute = executor.execute
+
+        def tracking_execute(command, params):
+            try:
+                response = original_execute(command, params)
+            finally:
+                if command in MUTATING_COMMANDS and not self._read_only:
+                    self.invalidate()
+            if command == Command.GET_CURRENT_URL and isinstance(response, dict):
+                url = response.get("value")
+                if url != self.url:
+                    if self.url is not None:
+                        self.invalidate()
+                    self.url = url
+            return response
+
+        executor.execute = tracking_execute
+        logger.info("Page state tracking attached")
+
+    def invalidate(self):
+        """Marks every cached query of this driver as stale."""
+        self.epoch += 1
+
+    @contextmanager
+    def read_only(self):
+        """Scripts run inside do not invalidate the cache (they only read the page)."""
+        self._read_only += 1
+        try:
+            yield self
+        finally:
+            self._read_only -= 1
+
+
+@contextmanager
+def read_only(driver):
+    """PageState.read_only() of `driver`; nothing to do when no query was cached on it yet."""
+    state = getattr(driver, PageState.DRIVER_ATTRIBUTE, None)
+    if state is None:
+        yield None
+        return
+    with state.read_only():
+        yield state
+
+
+def is_plain(value):
+    """True for values that stay valid after a re-render: no WebElement anywhere inside."""
+    if value is None or isinstance(value, (str, bytes, int, float, bool)):
+        return True
+    if isinstance(value, dict):
+        return all(is_plain(key) and is_plain(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(is_plain(item) for item in value)
+    return False
+
+
+def invalidate(driver):
+    """Drops the cached queries of `driver`, e.g. after a change made outside WebDriver."""
+    PageState.of(driver).invalidate()
+
+
+def cached_query(method):
+    """
+    Decorator for read-only Base_Page methods: the result is reused until the
+    page state changes or the next test starts. Empty / falsy results are not
+    cached, the element may still be rendering; neither are results holding
+    WebElements (see is_plain), they would go stale on the next re-render.
+
+    Example:
+        @cached_query
+        @allure.step("Checking if dashboard is loaded")
+        def is_dashboard_loaded(self): ...
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not is_enabled():
+            return method(self, *args, **kwargs)
+        try:
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        state = PageState.of(self.driver)
+        cached = self._query_cache.get(key)
+        if cached is not None and cached[0] == (get_current_test(), state.epoch):
+            state.hits += 1
+            logger.info(f"{type(self).__name__}.{method.__name__} served from query cache")
+            return cached[1]
+
+        state.misses += 1
+        with state.read_only():
+            result = method(self, *args, **kwargs)
+        if result and is_plain(result):
+            # Stamped after the call: a URL change seen while querying belongs to this result
+            self._query_cache[key] = ((get_current_test(), state.epoch), result)
+        return result
+
+    return wrapper
@@ -0,0 +1,158 @@
+import logging
+from utility.config_reader import get_config
+from utility.driver_factory import restart_session
+
+try:
+    import psutil
+except ImportError:  # process RSS is optional, CDP metrics still work without it
+    psutil = None
+
+"""
+resource_sampler.py
+
+Samples browser memory / CPU at test boundaries to spot leaks during long
+sessions (Chrome / Edge only, uses CDP):
+    - JS heap, DOM node count, event listener count (Performance.getMetrics)
+    - CPU time spent by the page (TaskDuration)
+    - RSS of all browser processes started by the driver (psutil, optional)
+A test whose growth crosses the [Resource_Sampler] leak thresholds is flagged.
+Crossing a recycle threshold recycles the browser before the next test:
+    - page JS heap over recycle_heap_mb → recycle_mode: "tab" swaps in a fresh
+      tab (new renderer), "driver" restarts the browser session
+    - browser RSS growth since the browser started over recycle_rss_mb → the
+      browser session is always restarted: a new tab does not free the browser /
+      GPU processes, only a new browser does
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+class ResourceSampler:
+    """
+    Example:
+        sampler = ResourceSampler(driver)
+        before = sampler.sample()
+        ... test ...
+        result = sampler.compare(before, sampler.sample())
+        if result["recycle"]:
+            sampler.recycle(result["recycle"])
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.leak_heap_mb = float(get_config("Resource_Sampler", "leak_heap_mb"))
+        self.leak_nodes = int(get_config("Resource_Sampler", "leak_nodes"))
+        self.leak_listeners = int(get_config("Resource_Sampler", "leak_listeners"))
+        self.recycle_heap_mb = float(get_config("Resource_Sampler", "recycle_heap_mb"))
+        self.recycle_rss_mb = float(get_config("Resource_Sampler", "recycle_rss_mb"))
+        self.recycle_mode = get_config("Resource_Sampler", "recycle_mode").lower()
+        # Browser RSS at the first sample of this browser (reset by a session restart)
+        self.rss_baseline_mb = None
+        self.driver.execute_cdp_cmd("Performance.enable", {})
+        logger.info("Resource sampler enabled (CDP Performance metrics"
+                    f"{', process RSS' if psutil else ''})")
+
+    @staticmethod
+    def is_enabled(driver):
+        """Sampler runs for Chromium browsers when [Resource_Sampler] enabled = true."""
+        try:
+            enabled = get_config("Resource_Sampler", "enabled").lower() == "true"
+        except KeyError:
+            return False
+        return enabled and hasattr(driver, "execute_cdp_cmd")
+
+    # SAMPLING
+    def sample(self):
+        """
+        Returns one sample:
+            {"heap_mb", "nodes", "listeners", "documents", "cpu_s", "rss_mb"}
+        Garbage is collected first so only live objects are counted.
+        """
+        self.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        metrics = {m["name"]: m["value"] for m in
+                   self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+        return {
+            "heap_mb": round(metrics.get("JSHeapUsedSize", 0) / MB, 2),
+            "nodes": int(metrics.get("Nodes", 0)),
+            "listeners": int(metrics.get("JSEventListeners", 0)),
+            "documents": int(metrics.get("Documents", 0)),
+            "cpu_s": round(metrics.get("TaskDuration", 0), 3),
+            "rss_mb": self.browser_rss_mb(),
+        }
+
+    def browser_rss_mb(self):
+        """Sum of the RSS of every process started by the driver service (None without psutil)."""
+        service = getattr(self.driver, "service", None)
+        process = getattr(service, "process", None)
+        if psutil is None or process is None:
+            return None
+        try:
+            root = psutil.Process(process.pid)
+            processes = [root] + root.children(recursive=True)
+            return round(sum(p.memory_info().rss for p in processes if p.is_running()) / MB, 1)
+        except psutil.Error as e:
+            logger.error(f"Could not read browser RSS: {e}")
+            return None
+
+    # ANALYSIS
+    def compare(self, before, after):
+        """
+        Growth of one test and the resulting verdict:
+            {"before", "after", "delta", "leaks": [...], "rss_growth_mb", "recycle": None / "tab" / "driver"}
+        """
+        delta = {key: round(after[key] - before[key], 3)
+                 for key in after if after[key] is not None and before.get(key) is not None}
+
+        leaks = []
+        if delta["heap_mb"] > self.leak_heap_mb:
+            leaks.append(f"JS heap +{delta['heap_mb']} MB")
+        if delta["nodes"] > self.leak_nodes:
+            leaks.append(f"DOM nodes +{delta['nodes']}")
+        if delta["listeners"] > self.leak_listeners:
+            leaks.append(f"event listeners +{delta['listeners']}")
+
+        if self.rss_baseline_mb is None:
+            self.rss_baseline_mb = before["rss_mb"]
+        rss_growth = None
+        if after["rss_mb"] is not None and self.rss_baseline_mb is not None:
+            rss_growth = round(after["rss_mb"] - self.rss_baseline_mb, 1)
+
+        recycle = None
+        if rss_growth is not None and rss_growth > self.recycle_rss_mb:
+            recycle = "driver"
+        elif after["heap_mb"] > self.recycle_heap_mb:
+            recycle = "driver" if self.recycle_mode == "driver" else "tab"
+        return {"before": before, "after": after, "delta": delta, "leaks": leaks,
+                "rss_growth_mb": rss_growth, "recycle": recycle}
+
+    # RECYCLE
+    def recycle(self, kind="tab"):
+        """
+        "driver" → restarts the browser session in place (driver_factory.restart_session),
+                   the RSS baseline is taken again from the new browser
+        "tab"    → replaces the current tab with a fresh one on the same URL (new
+                   renderer, fresh JS heap); the RSS baseline stays, a tab swap
+                   does not free browser memory
+        Cookies are kept either way, so the login session survives.
+        """
+        if kind == "driver":
+            restart_session(self.driver)
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+            self.rss_baseline_mb = None
+            logger.info(f"Browser recycled → new session on {self.driver.current_url}")
+            return
+        url = self.driver.current_url
+        old_handles = self.driver.window_handles
+        self.driver.switch_to.new_window("tab")
+        new_handle = self.driver.current_window_handle
+        for handle in old_handles:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(new_handle)
+        self.driver.get(url)
+        # Metrics domain is per target → enable it again for the new tab
+        self.driver.execute_cdp_cmd("Performance.enable", {})
+        logger.info(f"Browser page recycled → {url}")
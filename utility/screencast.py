@@ -0,0 +1,261 @@
+import os
+import json
+import math
+import time
+import base64
+import shutil
+import zipfile
+import logging
+import tempfile
+import threading
+import subprocess
+from collections import deque
+from utility.config_reader import get_config
+
+try:
+    import websocket
+except ImportError:  # websocket-client comes with selenium, the recorder stays off without it
+    websocket = None
+
+"""
+screencast.py
+
+Screen recording of the running test, kept only when the test fails
+(Chrome / Edge, CDP Page.startScreencast over the browser's DevTools socket):
+    - a background thread receives the JPEG frames, acks them and keeps at most
+      [Screencast] max_fps frames per second in a ring buffer bounded by
+      max_seconds and max_buffer_mb
+    - the thread measures its own CPU time; above cpu_cap (fraction of one core)
+      the browser is asked for every 2nd, 4th, ... frame only
+    - the buffer is cleared when a test starts; a failed test's frames are encoded
+      to an MP4 with ffmpeg (real frame timing), or zipped as JPEGs without ffmpeg,
+      thinned out to stay under max_clip_mb
+Opt-in: [Screencast] enabled = true in config.ini.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+def _setting(key):
+    return get_config("Screencast", key)
+
+
+class ScreencastRecorder:
+    """
+    Example:
+        recorder = ScreencastRecorder(driver)
+        recorder.start()
+        recorder.mark()                    # test starts → frames of the previous test dropped
+        ... test fails ...
+        path = recorder.save_clip("tests/Test_Dashboard.py::test_tc09")
+        recorder.stop()
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.max_fps = float(_setting("max_fps"))
+        self.max_buffer_bytes = float(_setting("max_buffer_mb")) * MB
+        self.max_clip_bytes = float(_setting("max_clip_mb")) * MB
+        self.cpu_cap = float(_setting("cpu_cap"))
+        self.quality = int(_setting("quality"))
+        self.max_width = int(_setting("max_width"))
+        self.max_height = int(_setting("max_height"))
+        self.directory = _setting("directory")
+        self.frames = deque(maxlen=max(1, int(self.max_fps * float(_setting("max_seconds")))))
+        self.buffered_bytes = 0
+        self.every_nth = 1
+        self.lock = threading.Lock()
+        self.stats = {"frames_received": 0, "frames_kept": 0, "frames_dropped": 0, "throttled": 0,
+                      "thread_cpu_s": 0.0, "clips": 0, "clip_bytes": 0, "encode_s": 0.0}
+        self.started = None
+        self._socket = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._message_id = 0
+        self._last_kept = 0.0
+
+    @staticmethod
+    def is_enabled(driver):
+        """Recorder runs for Chromium browsers with a DevTools address when [Screencast] enabled = true."""
+        try:
+            enabled = get_config("Screencast", "enabled").lower() == "true"
+        except KeyError:
+            return False
+        return enabled and websocket is not None and ScreencastRecorder.debugger_address(driver) is not None
+
+    @staticmethod
+    def debugger_address(driver):
+        capabilities = getattr(driver, "capabilities", None) or {}
+        for key in ("goog:chromeOptions", "ms:edgeOptions"):
+            address = capabilities.get(key, {}).get("debuggerAddress")
+            if address:
+                return address
+        return None
+
+    # ------------------------------ recording ------------------------------
+    def start(self):
+        """Connects to the page's DevTools socket and starts the receiving thread."""
+        url = f"ws://{self.debugger_address(self.driver)}/devtools/page/{self.driver.current_window_handle}"
+        self._socket = websocket.create_connection(url, timeout=5, suppress_origin=True)
+        self._socket.settimeout(0.5)
+        self._start_screencast()
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="screencast", daemon=True)
+        self._thread.start()
+        logger.info(f"Screencast recording started ({self.max_fps} fps max, CPU cap {self.cpu_cap:.0%})")
+
+    def _send(self, method, params=None):
+        self._message_id += 1
+        self._socket.send(json.dumps({"id": self._message_id, "method": method, "params": params or {}}))
+
+    def _start_screencast(self):
+        self._send("Page.startScreencast", {"format": "jpeg", "quality": self.quality, "maxWidth": self.max_width,
+                                            "maxHeight": self.max_height, "everyNthFrame": self.every_nth})
+
+    def _run(self):
+        window_wall, window_cpu = time.perf_counter(), time.thread_time()
+        while not self._stop.is_set():
+            try:
+                message = json.loads(self._socket.recv())
+            except websocket.WebSocketTimeoutException:
+                message = None
+            except (websocket.WebSocketException, OSError, ValueError) as e:
+                if not self._stop.is_set():
+                    logger.warning(f"Screencast stopped: {e}")
+                break
+
+            if message and message.get("method") == "Page.screencastFrame":
+                self._on_frame(message["params"])
+
+            # CPU cap: measured once a second on this thread's own CPU time
+            wall = time.perf_counter()
+            if wall - window_wall >= 1.0:
+                cpu = time.thread_time()
+                self.stats["thread_cpu_s"] += cpu - window_cpu
+                if (cpu - window_cpu) / (wall - window_wall) > self.cpu_cap and self.every_nth < 32:
+                    self.every_nth *= 2
+                    self.stats["throttled"] += 1
+                    logger.warning(f"Screencast over CPU cap → every {self.every_nth}th frame")
+                    self._send("Page.stopScreencast")
+                    self._start_screencast()
+                window_wall, window_cpu = wall, cpu
+
+    def _on_frame(self, params):
+        # Unacked frames stop the stream, so every frame is acked, kept or not
+        self._send("Page.screencastFrameAck", {"sessionId": params["sessionId"]})
+        self.stats["frames_received"] += 1
+        now = time.time()
+        if now - self._last_kept < 1.0 / self.max_fps:
+            self.stats["frames_dropped"] += 1
+            return
+        self._last_kept = now
+        jpeg = base64.b64decode(params["data"])
+        timestamp = params.get("metadata", {}).get("timestamp") or now
+        with self.lock:
+            if len(self.frames) == self.frames.maxlen:
+                self.buffered_bytes -= len(self.frames[0][1])
+            self.frames.append((timestamp, jpeg))
+            self.buffered_bytes += len(jpeg)
+            while self.buffered_bytes > self.max_buffer_bytes and len(self.frames) > 1:
+                self.buffered_bytes -= len(self.frames.popleft()[1])
+        self.stats["frames_kept"] += 1
+
+    def mark(self):
+        """A test starts: frames of the previous one are discarded."""
+        with self.lock:
+            self.frames.clear()
+            self.buffered_bytes = 0
+
+    def stop(self):
+        """Stops the screencast and the thread (driver teardown)."""
+        self._stop.set()
+        try:
+            self._send("Page.stopScreencast")
+        except Exception:
+            pass
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self._socket:
+            self._socket.close()
+        logger.info(f"Screencast recording stopped: {self.measurements()}")
+
+    # ------------------------------ failed test ------------------------------
+    def save_clip(self, nodeid):
+        """Encodes the buffered frames of the failed test; returns the clip path (None without frames)."""
+        with self.lock:
+            frames = list(self.frames)
+        if not frames:
+            return None
+        start = time.perf_counter()
+
+        # Disk cap: keep every n-th frame so the clip stays under max_clip_mb
+        total = sum(len(jpeg) for _, jpeg in frames)
+        if total > self.max_clip_bytes:
+            frames = frames[::math.ceil(total / self.max_clip_bytes)]
+
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, "".join(c if c.isalnum() or c in "._-" else "_" for c in nodeid)[-150:])
+        ffmpeg = shutil.which("ffmpeg")
+        path = self._encode_mp4(ffmpeg, frames, base + ".mp4") if ffmpeg else None
+        if path is None:
+            path = self._zip_frames(frames, base + ".zip")
+
+        self.stats["clips"] += 1
+        self.stats["clip_bytes"] += os.path.getsize(path)
+        self.stats["encode_s"] += time.perf_counter() - start
+        logger.info(f"Screencast of {nodeid}: {len(frames)} frames → {path} "
+                    f"({os.path.getsize(path) / MB:.2f} MB in {time.perf_counter() - start:.2f} s)")
+        return path
+
+    @staticmethod
+    def _encode_mp4(ffmpeg, frames, path):
+        """MP4 through ffmpeg's concat demuxer, each frame shown until the next one arrived."""
+        with tempfile.TemporaryDirectory() as folder:
+            lines = []
+            for number, (timestamp, jpeg) in enumerate(frames):
+                name = os.path.join(folder, f"{number:05d}.jpg")
+                with open(name, "wb") as f:
+                    f.write(jpeg)
+                following = frames[number + 1][0] if number + 1 < len(frames) else timestamp + 1
+                lines.append(f"file '{name}'\nduration {max(following - timestamp, 0.01):.3f}")
+            lines.append(f"file '{name}'")
+            listing = os.path.join(folder, "frames.txt")
+            with open(listing, "w") as f:
+                f.write("\n".join(lines))
+            command = [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", listing,
+                       "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2", "-pix_fmt", "yuv420p", "-c:v", "libx264",
+                       "-preset", "veryfast", "-vsync", "vfr", path]
+            try:
+                subprocess.run(command, check=True, capture_output=True, timeout=120)
+            except (subprocess.SubprocessError, OSError) as e:
+                logger.error(f"ffmpeg encoding failed, frames are zipped instead: {e}")
+                return None
+        return path
+
+    @staticmethod
+    def _zip_frames(frames, path):
+        """JPEG frames named by their offset in ms, plus index.json with the timestamps."""
+        first = frames[0][0]
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as archive:
+            index = []
+            for number, (timestamp, jpeg) in enumerate(frames):
+                name = f"frames/{number:05d}_{int((timestamp - first) * 1000):07d}ms.jpg"
+                archive.writestr(name, jpeg)
+                index.append({"file": name, "timestamp": timestamp})
+            archive.writestr("index.json", json.dumps(index, indent=2))
+        return path
+
+    def measurements(self):
+        """Overhead so far: thread CPU (seconds and share of wall time), frames, buffer and clip sizes."""
+        wall = time.perf_counter() - self.started if self.started else 0
+        return dict(self.stats,
+                    thread_cpu_s=round(self.stats["thread_cpu_s"], 3),
+                    cpu_share=round(self.stats["thread_cpu_s"] / wall, 4) if wall else 0,
+                    every_nth=self.every_nth,
+                    buffered_frames=len(self.frames),
+                    buffered_mb=round(self.buffered_bytes / MB, 2),
+                    clip_mb=round(self.stats["clip_bytes"] / MB, 2),
+                    encode_s=round(self.stats["encode_s"], 2))
@@ -0,0 +1,19 @@
+"""
+test_context.py
+
+Keeps track of the test that is currently running so that page objects and
+utilities (performance capture, logging, ...) can tag their data with it.
+conftest.py updates it at the start and end of every test.
+"""
+
+_current = {"nodeid": None}
+
+
+def set_current_test(nodeid):
+    """Called by conftest.py when a test starts (nodeid) or ends (None)."""
+    _current["nodeid"] = nodeid
+
+
+def get_current_test():
+    """Returns the pytest node id of the running test, or None outside of a test."""
+    return _current["nodeid"]
@@ -0,0 +1,199 @@
+import os
+import io
+import re
+import json
+import time
+import zipfile
+import logging
+from collections import deque
+from utility.config_reader import get_config
+
+"""
+trace_buffer.py
+
+Failure-only trace of the running test, kept in memory in bounded ring buffers:
+    - the last [Trace] max_steps Base_Page steps (action, target, timestamp)
+    - the last [Trace] max_dom_snapshots DOMs already read by dom_snapshots.capture
+Nothing is read from the browser and nothing is written while the test passes.
+When it fails, the browser console and network log (Chromium goog:loggingPrefs,
+entries of this test only), the final DOM and one screenshot are added and
+everything is written to ONE archive [Trace] directory/<test>.zip, attached to Allure:
+    trace.json      → test, error, steps, console, network
+    dom/NN_*.html   → buffered DOMs, oldest first, final.html last
+    screenshot.png
+Switched on/off by [Trace] enabled in config.ini.
+"""
+
+# Logger for this file
+logger = logging.getLogger(__name__)
+
+# Chrome DevTools network events kept from the performance log
+NETWORK_EVENTS = ("Network.requestWillBeSent", "Network.responseReceived",
+                  "Network.loadingFailed", "Network.loadingFinished")
+
+
+def is_enabled():
+    """Trace recording is switched on/off by [Trace] enabled in config.ini."""
+    try:
+        return get_config("Trace", "enabled").lower() == "true"
+    except KeyError:
+        return False
+
+
+def _setting(key, default):
+    try:
+        return get_config("Trace", key)
+    except KeyError:
+        return default
+
+
+class TraceBuffer:
+    """
+    Ring buffers of one test. Recording is an append to a bounded deque,
+    the oldest entries drop out.
+
+    Example:
+        trace = TraceBuffer("tests/Test_Login.py::test_tc1")
+        trace.step("click", "('xpath', \"//button[@type='submit']\")")
+        path = trace.write(driver, "AssertionError: ...")
+    """
+
+    def __init__(self, nodeid, max_steps=200, max_dom=3, max_log_entries=500):
+        self.nodeid = nodeid
+        self.started = time.time()
+        self.steps = deque(maxlen=max_steps)
+        self.doms = deque(maxlen=max_dom)
+        self.max_log_entries = max_log_entries
+
+    def step(self, action, target=""):
+        self.steps.append((time.time(), action, target))
+
+    def dom(self, url, html):
+        self.doms.append((time.time(), url, html))
+
+    # ------------------------- read on failure only -------------------------
+    def _since_start(self, entry):
+        """Seconds from the test start to a browser log entry (same clock as the steps)."""
+        return round(entry["timestamp"] / 1000 - self.started, 3)
+
+    def _log(self, driver, log_type):
+        """Entries of a browser log since the test started (empty when the driver has no such log)."""
+        try:
+            entries = driver.get_log(log_type)
+        except Exception as e:
+            logger.info(f"No '{log_type}' log from the browser: {e}")
+            return []
+        since_ms = self.started * 1000
+        return [entry for entry in entries if entry.get("timestamp", 0) >= since_ms][-self.max_log_entries:]
+
+    def console(self, driver):
+        return [{"time": self._since_start(entry), "level": entry.get("level"), "message": entry.get("message")}
+                for entry in self._log(driver, "browser")]
+
+    def network(self, driver):
+        """Performance log → one row per request: method, url, status, failure, bytes."""
+        requests = {}
+        for entry in self._log(driver, "performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            if message.get("method") not in NETWORK_EVENTS:
+                continue
+            params = message.get("params", {})
+            request = requests.setdefault(params.get("requestId"), {"time": self._since_start(entry)})
+            if message["method"] == "Network.requestWillBeSent":
+                request.update(method=params["request"]["method"], url=params["request"]["url"],
+                               type=params.get("type"))
+            elif message["method"] == "Network.responseReceived":
+                request.update(status=params["response"].get("status"), url=params["response"].get("url"),
+                               mime=params["response"].get("mimeType"))
+            elif message["method"] == "Network.loadingFailed":
+                request.update(failed=params.get("errorText"))
+            else:
+                request.update(bytes=params.get("encodedDataLength"))
+        return list(requests.values())
+
+    def write(self, driver, error="", directory=None):
+        """Writes the trace archive of the failed test and returns its path."""
+        directory = directory or _setting("directory", "Reports/traces")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, re.sub(r"[^A-Za-z0-9_.-]+", "_", self.nodeid).strip("_")[-150:] + ".zip")
+
+        trace = {
+            "test": self.nodeid,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "error": error,
+            "steps": [{"time": round(at - self.started, 3), "action": action, "target": target}
+                      for at, action, target in self.steps],
+            "console": [],
+            "network": [],
+        }
+        final_html = screenshot = None
+        if driver is not None:
+            trace["console"] = self.console(driver)
+            trace["network"] = self.network(driver)
+            try:
+                trace["url"] = driver.current_url
+                final_html = driver.page_source
+                screenshot = driver.get_screenshot_as_png()
+            except Exception as e:
+                logger.error(f"Trace of {self.nodeid}: browser state not captured: {e}")
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("trace.json", json.dumps(trace, indent=2, default=str))
+            for number, (at, url, html) in enumerate(self.doms, start=1):
+                name = re.sub(r"[^A-Za-z0-9]+", "_", url.split("/web/index.php/")[-1])[:60]
+                archive.writestr(f"dom/{number:02d}_{name}.html", f"<!-- {url} t={at - self.started:.3f}s -->\n{html}")
+            if final_html is not None:
+                archive.writestr("dom/final.html", final_html)
+            if screenshot is not None:
+                archive.writestr("screenshot.png", screenshot)
+        with open(path, "wb") as f:
+            f.write(buffer.getvalue())
+        logger.info(f"Trace of failed test {self.nodeid} written to {path}")
+        return path
+
+
+# Buffer of the running test (one test at a time per process / xdist worker)
+_current = None
+
+
+def start(nodeid):
+    """New, empty buffer for the test that starts now (None when tracing is off)."""
+    global _current
+    _current = TraceBuffer(nodeid,
+                           max_steps=int(_setting("max_steps", 200)),
+                           max_dom=int(_setting("max_dom_snapshots", 3)),
+                           max_log_entries=int(_setting("max_log_entries", 500))) if is_enabled() else None
+    return _current
+
+
+def current():
+    return _current
+
+
+def step(action, target=""):
+    """Records one Base_Page step of the running test (no-op when tracing is off)."""
+    if _current is not None:
+        _current.step(action, str(target))
+
+
+def dom(url, html):
+    """Keeps a DOM that was read anyway (dom_snapshots.capture) in the running test's buffer."""
+    if _current is not None:
+        _current.dom(url, html)
+
+
+def failure_screenshots_only():
+    """[Trace] screenshots = failure → attach_save_screenshot only records a step, the trace has the screenshot."""
+    return is_enabled() and _setting("screenshots", "all").lower() == "failure"
+
+
+def logging_prefs():
+    """goog:loggingPrefs for Chromium: console always, network events when [Trace] capture_network = true."""
+    prefs = {"browser": "ALL"}
+    if _setting("capture_network", "false").lower() == "true":
+        prefs["performance"] = "ALL"
+    return prefs